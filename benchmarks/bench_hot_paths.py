@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Offline-Benchmarks der zeitkritischen Funktionen auf synthetischen Kursdaten.
+
+Beispiel:
+    python benchmarks/bench_hot_paths.py --sizes 1000,10000,100000 --output bench.json
+"""
+
+import os
+import sys
+import argparse
+import json
+import platform
+import time
+import warnings
+from datetime import datetime
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from elliott_wave import ElliottWaveAnalyzer, utils
+from elliott_wave.synthetic import generate_ohlcv
+from elliott_wave.utils import zigzag_filter, find_local_extrema, plot_waves
+
+# Größte Datenmenge je Benchmark, darüber wird er übersprungen (None = keine Grenze)
+MAX_SIZES = {
+    'zigzag_filter': None,
+    'find_local_extrema': None,
+    'analyze': None,
+    'find_current_wave': None,
+    'backtest': 1000000,
+    'plot_waves': 10000
+}
+
+def parse_args():
+    """
+    Parst die Kommandozeilenargumente.
+
+    Returns:
+        argparse.Namespace: Geparste Argumente
+    """
+    parser = argparse.ArgumentParser(description='Benchmarks der Elliott-Wellen-Analyse auf synthetischen Daten')
+
+    parser.add_argument('--sizes', type=str, default='1000,10000,100000,1000000,10000000',
+                        help='Kommagetrennte Anzahl der Bars je Lauf')
+
+    parser.add_argument('--model', type=str, choices=['gbm', 'random_walk'], default='gbm',
+                        help='Modell für die synthetischen Preise (Standard: gbm mit Regimewechseln)')
+
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Wiederholungen je Messung, gemeldet wird die schnellste (Standard: 3)')
+
+    parser.add_argument('--only', type=str, default=None,
+                        help='Kommagetrennte Auswahl der Benchmarks (Standard: alle)')
+
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Startwert des Zufallsgenerators (Standard: 0)')
+
+    parser.add_argument('--output', type=str, default=None,
+                        help='Speichert die Ergebnisse als JSON in der angegebenen Datei')
+
+    return parser.parse_args()
+
+def time_call(func, repeat, setup=None):
+    """
+    Misst die schnellste Laufzeit eines Aufrufs.
+
+    Args:
+        func (callable): Zu messende Funktion ohne Argumente
+        repeat (int): Anzahl der Wiederholungen
+        setup (callable, optional): Wird vor jeder Wiederholung ungemessen aufgerufen
+
+    Returns:
+        float: Schnellste Laufzeit in Sekunden
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def clear_caches():
+    # Der ZigZag-Cache würde ab der zweiten Wiederholung nur noch nachschlagen
+    utils._ZIGZAG_LADDER_CACHE.clear()
+
+def run_benchmarks(df, repeat, selected):
+    """
+    Führt alle ausgewählten Benchmarks auf einem DataFrame aus.
+
+    Args:
+        df (pandas.DataFrame): Synthetische OHLCV-Daten
+        repeat (int): Anzahl der Wiederholungen je Messung
+        selected (set): Namen der auszuführenden Benchmarks
+
+    Returns:
+        dict: Laufzeit in Sekunden je Benchmark (None, wenn übersprungen)
+    """
+    prices = df['Close'].values
+    n_bars = len(df)
+    results = {}
+
+    def enabled(name):
+        limit = MAX_SIZES[name]
+        return name in selected and (limit is None or n_bars <= limit)
+
+    if enabled('zigzag_filter'):
+        results['zigzag_filter'] = time_call(lambda: zigzag_filter(prices, threshold=0.03), repeat)
+
+    if enabled('find_local_extrema'):
+        results['find_local_extrema'] = time_call(lambda: find_local_extrema(prices, window=10), repeat)
+
+    if enabled('analyze'):
+        results['analyze'] = time_call(lambda: ElliottWaveAnalyzer(df).analyze(), repeat, setup=clear_caches)
+
+    if enabled('find_current_wave'):
+        analyzer = ElliottWaveAnalyzer(df)
+        results['find_current_wave'] = time_call(analyzer.find_current_wave, repeat)
+
+    if enabled('backtest'):
+        results['backtest'] = time_call(lambda: ElliottWaveAnalyzer(df).backtest(), repeat)
+
+    if enabled('plot_waves'):
+        waves = ElliottWaveAnalyzer(df).analyze()
+
+        def plot():
+            fig, _ = plot_waves(df, waves)
+            fig.canvas.draw()
+            plt.close(fig)
+
+        results['plot_waves'] = time_call(plot, repeat)
+
+    for name in selected:
+        results.setdefault(name, None)
+
+    return results
+
+def main():
+    """
+    Hauptfunktion der Benchmarks.
+    """
+    args = parse_args()
+
+    # Matplotlib warnt bei vielen Wellen vor langsamer Legendenplatzierung, das ist hier erwartet
+    warnings.filterwarnings('ignore', category=UserWarning)
+
+    sizes = [int(v) for v in args.sizes.split(',')]
+    selected = set(args.only.split(',')) if args.only else set(MAX_SIZES)
+    unknown = selected - set(MAX_SIZES)
+    if unknown:
+        print(f"Unbekannte Benchmarks: {', '.join(sorted(unknown))}")
+        sys.exit(1)
+
+    report = {
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'model': args.model,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'results': []
+    }
+
+    for n_bars in sizes:
+        df = generate_ohlcv(n_bars, model=args.model, seed=args.seed)
+        timings = run_benchmarks(df, args.repeat, selected)
+        report['results'].append({'n_bars': n_bars, 'seconds': timings})
+
+        print(f"\n{n_bars:,} Bars:")
+        for name in sorted(timings):
+            seconds = timings[name]
+            value = f"{seconds * 1000:12.2f} ms" if seconds is not None else "   übersprungen"
+            print(f"  {name:<20} {value}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nErgebnisse wurden in {args.output} gespeichert.")
+
+if __name__ == "__main__":
+    main()
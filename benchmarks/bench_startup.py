@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Misst die Startzeit von main.py und prüft, welche schweren Bibliotheken je Modus geladen werden.
+
+Jedes Szenario läuft in einem neuen Python-Prozess, damit bereits importierte Module
+die Messung nicht verfälschen.
+
+Beispiel:
+    python benchmarks/bench_startup.py --repeat 5 --output startup.json
+"""
+
+import os
+import sys
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from elliott_wave.synthetic import generate_ohlcv
+
+# Bibliotheken, die nur für GUI, Grafiken, Tabellen oder Yahoo Finance benötigt werden
+HEAVY_MODULES = [
+    'tkinter',
+    'matplotlib',
+    'matplotlib.pyplot',
+    'matplotlib.backends.backend_tkagg',
+    'yfinance',
+    'tabulate'
+]
+
+# Wird im Kindprozess ausgeführt: startet main.py mit den übergebenen Argumenten
+CHILD_CODE = """
+import json, os, runpy, sys, time
+start = time.perf_counter()
+argv = json.loads(sys.argv[1])
+sys.path.insert(0, {root!r})
+if argv is None:
+    import main
+else:
+    sys.argv = ['main.py'] + argv
+    try:
+        runpy.run_path(os.path.join({root!r}, 'main.py'), run_name='__main__')
+    except SystemExit:
+        pass
+elapsed = time.perf_counter() - start
+loaded = [name for name in {modules!r} if name in sys.modules]
+sys.__stdout__.write('\\n@@RESULT@@' + json.dumps({{'seconds': elapsed, 'modules': loaded}}) + '\\n')
+"""
+
+def parse_args():
+    """
+    Parst die Kommandozeilenargumente.
+
+    Returns:
+        argparse.Namespace: Geparste Argumente
+    """
+    parser = argparse.ArgumentParser(description='Startzeit-Benchmark der Kommandozeilenmodi')
+
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Wiederholungen je Szenario, gemeldet wird die schnellste (Standard: 5)')
+
+    parser.add_argument('--bars', type=int, default=2000,
+                        help='Anzahl der Bars der synthetischen CSV-Datei (Standard: 2000)')
+
+    parser.add_argument('--output', type=str, default=None,
+                        help='Speichert die Ergebnisse als JSON in der angegebenen Datei')
+
+    return parser.parse_args()
+
+def run_scenario(argv, workdir, repeat):
+    """
+    Führt ein Szenario mehrfach in neuen Prozessen aus.
+
+    Args:
+        argv (list): Argumente für main.py oder None für einen reinen Import
+        workdir (str): Arbeitsverzeichnis für Exportdateien
+        repeat (int): Anzahl der Wiederholungen
+
+    Returns:
+        dict: Schnellste Prozess- und Modulzeit in Sekunden sowie die geladenen schweren Module
+    """
+    code = CHILD_CODE.format(root=ROOT, modules=HEAVY_MODULES)
+    env = dict(os.environ, MPLBACKEND='Agg', EW_RESULT_CACHE_DIR=os.path.join(workdir, 'results'))
+
+    best_process = best_main = float('inf')
+    modules = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-c', code, json.dumps(argv)], cwd=workdir, env=env,
+                                   capture_output=True, text=True)
+        process_seconds = time.perf_counter() - start
+
+        marker = completed.stdout.rfind('@@RESULT@@')
+        if completed.returncode != 0 or marker < 0:
+            raise RuntimeError(f"Szenario {argv} fehlgeschlagen:\n{completed.stderr}")
+        result = json.loads(completed.stdout[marker + len('@@RESULT@@'):])
+
+        best_process = min(best_process, process_seconds)
+        best_main = min(best_main, result['seconds'])
+        modules = result['modules']
+
+    return {'process': best_process, 'main': best_main, 'modules': modules}
+
+def main():
+    """
+    Hauptfunktion des Benchmarks.
+    """
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, 'prices.csv')
+        generate_ohlcv(args.bars).to_csv(csv_path)
+
+        headless = ['--data', csv_path, '--no-plot', '--no-cache']
+        scenarios = {
+            'import': None,
+            'help': ['--help'],
+            'analyse_no_plot': headless + ['--mode', 'analyse'],
+            'backtest_json': headless + ['--mode', 'backtest', '--output', 'json']
+        }
+
+        report = {
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'results': {}
+        }
+
+        print(f"{'Szenario':<18} {'Prozess (ms)':>14} {'main (ms)':>12}  Schwere Module")
+        for name, argv in scenarios.items():
+            result = run_scenario(argv, workdir, args.repeat)
+            report['results'][name] = result
+            modules = ', '.join(result['modules']) or '-'
+            print(f"{name:<18} {result['process'] * 1000:>14.1f} {result['main'] * 1000:>12.1f}  {modules}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nErgebnisse wurden in {args.output} gespeichert.")
+
+if __name__ == "__main__":
+    main()
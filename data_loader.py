@@ -2,12 +2,18 @@
 # -*- coding: utf-8 -*-
 
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait as futures_wait
+import numpy as np
 import pandas as pd
-import yfinance as yf
 from datetime import datetime, timedelta
-import requests
 import json
 from dotenv import load_dotenv
+from elliott_wave.profiling import profiled
+import yahoo_http
+import providers
+from symbol_resolver import SymbolResolver
 
 # Lade Umgebungsvariablen aus .env-Datei
 load_dotenv()
@@ -41,6 +47,21 @@ class DataLoader:
         'NFLX', 'INTC', 'CSCO', 'VZ', 'PFE', 'KO', 'PEP', 'T', 'MRK', 'XOM'
     ]
     
+    # Liste gängiger deutscher Aktien
+    GERMAN_SYMBOLS = ['SAP', 'SIE', 'ALV', 'BAS', 'BMW', 'DAI', 'DBK', 'DTE', 'EOAN', 'FRE']
+    
+    # Deutsche Indizes und ihre Tickersymbole bei Yahoo Finance
+    GERMAN_INDEX_SYMBOLS = {
+        'DAX': '^GDAXI',
+        'MDAX': '^MDAXI',
+        'SDAX': '^SDAXI',
+        'TecDAX': '^TDXP',
+        'HDAX': '^HDAXI'
+    }
+    
+    # Liste der deutschen Indizes
+    GERMAN_INDICES = list(GERMAN_INDEX_SYMBOLS)
+    
     # Liste der US-Indizes
     US_INDICES = [
         '^GSPC',  # S&P 500
@@ -53,6 +74,83 @@ class DataLoader:
     # Standard-Börse für deutsche Aktien
     DEFAULT_GERMAN_EXCHANGE = 'XETR'
     
+    # Spalten, die beim blockweisen Lesen großer CSV-Dateien geladen werden
+    OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+    
+    # Lokaler Cache für heruntergeladene Kursdaten (Parquet-Datei pro Symbol)
+    CACHE_ENABLED = os.getenv('EW_CACHE', '1') != '0'
+    CACHE_DIR = os.getenv('EW_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'elliott_wave'))
+    
+    # Zeitlimits (Sekunden) für Live-Daten: Kursdaten bzw. zusätzliche Wartezeit auf Sentiment-Daten
+    LIVE_PRICE_TIMEOUT = 10
+    LIVE_SENTIMENT_TIMEOUT = 3
+    
+    # Wiederholungen bei vorübergehenden Fehlern im Live-Abruf (weniger als bei historischen
+    # Daten, da ein verspäteter Kurs wertlos ist)
+    LIVE_RETRIES = 1
+    
+    # Gültigkeit (Sekunden) zwischengespeicherter Live-Daten je Feldgruppe:
+    # Kurs, Stammdaten (info) und Optionskette
+    LIVE_CACHE_TTL = {
+        'price': float(os.getenv('EW_LIVE_TTL_PRICE', '5')),
+        'info': float(os.getenv('EW_LIVE_TTL_INFO', '900')),
+        'options': float(os.getenv('EW_LIVE_TTL_OPTIONS', '300'))
+    }
+    
+    # Zwischengespeicherte Live-Daten {(Symbol, Feldgruppe): (Zeitpunkt, Wert)} und laufende Abrufe
+    _live_cache = {}
+    _live_inflight = {}
+    _live_lock = threading.Lock()
+    
+    # Gemeinsamer Thread-Pool für parallele Anfragen
+    _executor = None
+    _executor_lock = threading.Lock()
+    
+    # Vorberechnete Symbolauflösung, optional erweitert um die Symbolliste aus EW_SYMBOL_UNIVERSE
+    _resolver = None
+    _resolver_lock = threading.Lock()
+    
+    @staticmethod
+    def get_resolver():
+        """
+        Liefert die gemeinsame Symbolauflösung und baut sie beim ersten Aufruf auf.
+        
+        Returns:
+            SymbolResolver: Symbolauflösung mit allen bekannten Symbolen
+        """
+        with DataLoader._resolver_lock:
+            if DataLoader._resolver is None:
+                resolver = SymbolResolver(
+                    DataLoader.US_SYMBOLS,
+                    DataLoader.US_INDICES,
+                    DataLoader.GERMAN_SYMBOLS,
+                    DataLoader.GERMAN_INDEX_SYMBOLS,
+                    DataLoader.GERMAN_EXCHANGES,
+                    DataLoader.DEFAULT_GERMAN_EXCHANGE
+                )
+                universe = os.getenv('EW_SYMBOL_UNIVERSE')
+                if universe:
+                    try:
+                        resolver.load(universe)
+                    except Exception as e:
+                        print(f"Symbolliste {universe} konnte nicht geladen werden: {str(e)}")
+                DataLoader._resolver = resolver
+            return DataLoader._resolver
+    
+    @staticmethod
+    def load_universe(path):
+        """
+        Erweitert die Symbolauflösung und Autovervollständigung um eine Symbolliste.
+        
+        Args:
+            path (str): CSV-Datei mit Spalte 'Symbol' (optional 'Market' mit US/DE) oder
+                        Textdatei mit einem Symbol pro Zeile
+            
+        Returns:
+            int: Anzahl der geladenen Symbole
+        """
+        return DataLoader.get_resolver().load(path)
+    
     @staticmethod
     def is_us_symbol(symbol):
         """
@@ -64,13 +162,7 @@ class DataLoader:
         Returns:
             bool: True, wenn es sich um ein US-Symbol handelt
         """
-        # Entferne mögliche Suffixe für den Vergleich
-        base_symbol = symbol.split('.')[0]
-        
-        # Prüfe, ob es ein bekanntes US-Symbol oder Index ist
-        return (base_symbol in DataLoader.US_SYMBOLS or 
-                symbol in DataLoader.US_INDICES or
-                symbol.startswith('^'))
+        return DataLoader.get_resolver().is_us_symbol(symbol)
     
     @staticmethod
     def format_german_symbol(symbol, exchange=None):
@@ -84,20 +176,7 @@ class DataLoader:
         Returns:
             str: Das formatierte Symbol (z.B. 'SAP.DE')
         """
-        # Wenn es ein US-Symbol ist, nicht formatieren
-        if DataLoader.is_us_symbol(symbol):
-            return symbol
-            
-        # Prüfe, ob bereits ein Suffix vorhanden ist
-        if any(suffix in symbol for suffix in DataLoader.GERMAN_EXCHANGES.values()):
-            return symbol
-            
-        # Wenn eine Börse angegeben wurde, verwende deren Suffix
-        if exchange and exchange in DataLoader.GERMAN_EXCHANGES:
-            return f"{symbol}{DataLoader.GERMAN_EXCHANGES[exchange]}"
-            
-        # Ansonsten verwende die Standardbörse
-        return f"{symbol}{DataLoader.GERMAN_EXCHANGES[DataLoader.DEFAULT_GERMAN_EXCHANGE]}"
+        return DataLoader.get_resolver().format_german_symbol(symbol, exchange)
     
     @staticmethod
     def is_german_index(symbol):
@@ -110,25 +189,21 @@ class DataLoader:
         Returns:
             bool: True, wenn es sich um einen deutschen Index handelt
         """
-        german_indices = [
-            'DAX', '^GDAXI',     # DAX
-            'MDAX', '^MDAXI',    # MDAX
-            'SDAX', '^SDAXI',    # SDAX
-            'TecDAX', '^TDXP',   # TecDAX
-            'HDAX', '^HDAXI',    # HDAX
-        ]
-        return symbol in german_indices
+        return DataLoader.get_resolver().is_german_index(symbol)
     
     @staticmethod
-    def load_data(source, start_date=None, end_date=None, exchange=None):
+    @profiled('data_load')
+    def load_data(source, start_date=None, end_date=None, exchange=None, columns=None, chunksize=None):
         """
-        Lädt Marktdaten aus einer Datei oder von Yahoo Finance.
+        Lädt Marktdaten aus einer Datei oder vom aktiven Provider (Standard: Yahoo Finance).
         
         Args:
             source (str): Dateipfad oder Tickersymbol
             start_date (str, optional): Startdatum im Format 'YYYY-MM-DD'
             end_date (str, optional): Enddatum im Format 'YYYY-MM-DD'
             exchange (str, optional): Deutsche Börse (z.B. 'XETR', 'FRA')
+            columns (list, optional): Nur diese Spalten aus einer Datei lesen
+            chunksize (int, optional): Liest CSV-Dateien blockweise mit dieser Zeilenzahl
             
         Returns:
             pandas.DataFrame: DataFrame mit OHLCV-Daten
@@ -139,48 +214,251 @@ class DataLoader:
             
         # Wenn source eine existierende Datei ist, lade aus der Datei
         if os.path.isfile(source):
-            return DataLoader._load_from_file(source)
+            return DataLoader._load_from_file(source, columns, chunksize)
         
-        # Andernfalls versuche, es als Symbol für Yahoo Finance zu interpretieren
+        # Andernfalls versuche, es als Symbol beim aktiven Provider zu laden
         else:
-            # Prüfe, ob es ein deutscher Index ist
-            if DataLoader.is_german_index(source):
-                # Verwende das korrekte Symbol für den Index
-                if source == 'DAX':
-                    source = '^GDAXI'
-                elif source == 'MDAX':
-                    source = '^MDAXI'
-                elif source == 'SDAX':
-                    source = '^SDAXI'
-                elif source == 'TecDAX':
-                    source = '^TDXP'
-                elif source == 'HDAX':
-                    source = '^HDAXI'
-            # Prüfe, ob es ein US-Symbol ist
-            elif DataLoader.is_us_symbol(source):
-                # Für US-Symbole keine weitere Formatierung
-                pass
-            # Ansonsten formatiere es als deutsches Aktien-Symbol, wenn keine Datei vorliegt
-            elif not any(suffix in source for suffix in DataLoader.GERMAN_EXCHANGES.values()):
-                source = DataLoader.format_german_symbol(source, exchange)
-                
-            return DataLoader._load_from_yahoo(source, start_date, end_date)
+            return providers.get_provider().history(DataLoader.resolve_symbol(source, exchange), start_date, end_date)
+    
+    @staticmethod
+    def resolve_symbol(source, exchange=None):
+        """
+        Wandelt ein eingegebenes Symbol in das Tickersymbol für Yahoo Finance um.
+        
+        Args:
+            source (str): Tickersymbol oder Indexname (z.B. 'SAP', 'DAX', 'AAPL')
+            exchange (str, optional): Deutsche Börse (z.B. 'XETR', 'FRA')
+            
+        Returns:
+            str: Aufgelöstes Tickersymbol (z.B. 'SAP.DE', '^GDAXI', 'AAPL')
+        """
+        return DataLoader.get_resolver().resolve(source, exchange)
+    
+    @staticmethod
+    @profiled('data_load_many')
+    def load_many(symbols, start_date=None, end_date=None, exchange=None, batch_size=50, threads=True):
+        """
+        Lädt Marktdaten für viele Symbole mit gebündelten Downloads.
+        
+        Alle Symbole werden vorab aufgelöst und pro fehlendem Zeitraum in Gruppen von
+        höchstens batch_size Tickern mit einem einzigen yf.download-Aufruf geladen.
+        Bereits im Cache vorhandene Zeiträume werden nicht erneut angefragt. Fehler
+        einzelner Symbole brechen den Batch nicht ab, sondern werden gesammelt.
+        
+        Args:
+            symbols (list): Dateipfade oder Tickersymbole
+            start_date (str, optional): Startdatum im Format 'YYYY-MM-DD'
+            end_date (str, optional): Enddatum im Format 'YYYY-MM-DD'
+            exchange (str, optional): Deutsche Börse (z.B. 'XETR', 'FRA')
+            batch_size (int): Maximale Anzahl der Ticker pro Download
+            threads (bool/int): Parallele Verbindungen je Download (wird an yf.download übergeben)
+            
+        Returns:
+            tuple: (Dictionary {Symbol: DataFrame}, Dictionary {Symbol: Fehlermeldung})
+        """
+        if end_date is None:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        histories = {}
+        failures = {}
+        
+        # Löse alle Symbole vorab auf, Dateien werden direkt gelesen
+        resolved = {}
+        for symbol in symbols:
+            if os.path.isfile(symbol):
+                try:
+                    histories[symbol] = DataLoader._load_from_file(symbol)
+                except Exception as e:
+                    failures[symbol] = str(e)
+            else:
+                resolved.setdefault(DataLoader.resolve_symbol(symbol, exchange), []).append(symbol)
+        
+        provider = providers.get_provider()
+        if not provider.batch_download:
+            # Provider ohne gebündelten Download werden je Symbol parallel angefragt
+            workers = threads if isinstance(threads, int) and not isinstance(threads, bool) else 8
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(resolved) or 1))) as executor:
+                futures = {ticker: executor.submit(provider.history, ticker, start_date, end_date)
+                           for ticker in resolved}
+            for ticker, originals in resolved.items():
+                try:
+                    df = futures[ticker].result()
+                except Exception as e:
+                    for symbol in originals:
+                        failures[symbol] = f"Fehler beim Laden der Daten für {ticker}: {str(e)}"
+                    continue
+                for symbol in originals:
+                    histories[symbol] = df
+            return histories, failures
+        
+        # Gruppiere die Ticker nach dem fehlenden Zeitraum, damit jede Gruppe gemeinsam geladen werden kann
+        groups = {}
+        for ticker in resolved:
+            if DataLoader.CACHE_ENABLED:
+                gaps = DataLoader._cache_gaps(ticker, start_date, end_date)
+            else:
+                gaps = [(start_date, end_date)]
+            for gap in gaps:
+                groups.setdefault(gap, []).append(ticker)
+        
+        downloaded = {}
+        for (gap_start, gap_end), tickers in groups.items():
+            for i in range(0, len(tickers), batch_size):
+                batch = tickers[i:i + batch_size]
+                print(f"Lade Daten für {len(batch)} Symbole ({gap_start or 'Beginn'} bis {gap_end})")
+                try:
+                    frames = DataLoader._download_batch(batch, gap_start, gap_end, threads)
+                except Exception as e:
+                    # Ohne Ergebnis des Batches werden die Symbole unten einzeln nachgeladen
+                    print(f"Batch-Download fehlgeschlagen: {str(e)}")
+                    continue
+                for ticker, frame in frames.items():
+                    downloaded[(ticker, gap_start, gap_end)] = frame
+        
+        def download(ticker, gap_start, gap_end):
+            frame = downloaded.get((ticker, gap_start, gap_end))
+            if frame is not None:
+                return frame
+            return yahoo_http.download(ticker, start=gap_start, end=gap_end)[0]
+        
+        # Führe die Batch-Ergebnisse mit dem Cache zusammen und schneide den angefragten Zeitraum aus
+        for ticker, originals in resolved.items():
+            try:
+                if DataLoader.CACHE_ENABLED:
+                    df = DataLoader._load_with_cache(ticker, start_date, end_date, download=download)
+                else:
+                    df = download(ticker, start_date, end_date)
+                if df.empty:
+                    raise yahoo_http.FetchError(ticker, yahoo_http.NOT_FOUND, f"Keine Daten für Symbol {ticker} gefunden")
+            except Exception as e:
+                error = yahoo_http.FetchError(ticker, yahoo_http.classify(e), getattr(e, 'message', str(e)))
+                for symbol in originals:
+                    failures[symbol] = f"Fehler beim Herunterladen der Daten für {ticker}: {str(error)}"
+                continue
+            for symbol in originals:
+                histories[symbol] = df
+        
+        return histories, failures
     
     @staticmethod
-    def _load_from_file(file_path):
+    def _download_batch(tickers, start_date, end_date, threads=True):
         """
-        Lädt Daten aus einer CSV- oder Excel-Datei.
+        Lädt mehrere Ticker mit einem yf.download-Aufruf und teilt das Ergebnis auf.
+        
+        Args:
+            tickers (list): Aufgelöste Tickersymbole
+            start_date (str): Startdatum im Format 'YYYY-MM-DD' oder None
+            end_date (str): Enddatum im Format 'YYYY-MM-DD' (exklusiv)
+            threads (bool/int): Parallele Verbindungen (wird an yf.download übergeben)
+            
+        Returns:
+            dict: Dictionary {Ticker: DataFrame} im selben Format wie ein Einzel-Download,
+                  leer für Ticker ohne Daten oder mit gemeldetem NOT_FOUND. Ticker mit anderen
+                  Fehlern (z.B. Rate-Limit oder unerwartete Fehler) fehlen, damit sie einzeln
+                  nachgeladen werden und der Einzel-Download den Fehler wiederholt oder meldet.
+        """
+        df, errors = yahoo_http.download(tickers, start=start_date, end=end_date, threads=threads)
+        
+        frames = {}
+        for ticker in tickers:
+            if ticker in errors and errors[ticker] != yahoo_http.NOT_FOUND:
+                continue
+            if df is None or df.empty or ticker not in df.columns.get_level_values(-1):
+                frames[ticker] = pd.DataFrame()
+                continue
+            # Behalte die Spaltenebene mit dem Ticker wie bei yf.download(ticker)
+            frame = df.xs(ticker, axis=1, level=-1, drop_level=False)
+            # Der gemeinsame Index enthält die Handelstage aller Ticker, fremde Tage sind leer
+            frames[ticker] = frame.dropna(how='all')
+        return frames
+    
+    @staticmethod
+    def load_symbol_list(source):
+        """
+        Lädt eine Liste von Symbolen für den Scan mehrerer Werte.
+        
+        Args:
+            source (str): Pfad zu einer Datei (ein Symbol pro Zeile oder CSV mit Spalte 'Symbol'),
+                          'US', 'DE', 'DEFAULT' (alle bekannten Symbole) oder kommagetrennte Symbole
+            
+        Returns:
+            list: Liste der Symbole ohne Duplikate
+        """
+        if os.path.isfile(source):
+            if source.endswith('.csv'):
+                df = pd.read_csv(source)
+                column = 'Symbol' if 'Symbol' in df.columns else df.columns[0]
+                symbols = df[column].dropna().astype(str).tolist()
+            else:
+                with open(source) as f:
+                    symbols = [line.split(',')[0] for line in f]
+        elif source.upper() == 'US':
+            symbols = DataLoader.US_SYMBOLS + DataLoader.US_INDICES
+        elif source.upper() == 'DE':
+            symbols = DataLoader.GERMAN_SYMBOLS + DataLoader.GERMAN_INDICES
+        elif source.upper() == 'DEFAULT':
+            symbols = (DataLoader.US_SYMBOLS + DataLoader.US_INDICES +
+                       DataLoader.GERMAN_SYMBOLS + DataLoader.GERMAN_INDICES)
+        elif source.upper() == 'ALL':
+            symbols = DataLoader.get_resolver().symbols
+        else:
+            symbols = source.split(',')
+        
+        # Leere Zeilen und Kommentare ignorieren, Reihenfolge beibehalten
+        symbols = [s.strip() for s in symbols]
+        return list(dict.fromkeys(s for s in symbols if s and not s.startswith('#')))
+    
+    @staticmethod
+    def _load_from_file(file_path, columns=None, chunksize=None):
+        """
+        Lädt Daten aus einer CSV-, Excel-, Parquet-, Feather-, HDF5- oder NumPy-Datei.
         
         Args:
             file_path (str): Pfad zur Datei
+            columns (list, optional): Nur diese Spalten lesen (die Datumsspalte wird immer gelesen)
+            chunksize (int, optional): Liest CSV-Dateien blockweise mit dieser Zeilenzahl und festen
+                                       Datentypen (nur Datum und OHLCV-Spalten bzw. columns)
             
         Returns:
             pandas.DataFrame: DataFrame mit OHLCV-Daten
         """
-        if file_path.endswith('.csv'):
-            df = pd.read_csv(file_path)
+        if file_path.endswith('.npy'):
+            return DataLoader._load_from_npy(file_path, columns)
+        
+        if file_path.endswith('.csv') and chunksize:
+            return pd.concat(DataLoader.iter_csv_chunks(file_path, chunksize=chunksize, columns=columns))
+        elif file_path.endswith('.csv'):
+            if columns:
+                names = pd.read_csv(file_path, nrows=0).columns
+                df = pd.read_csv(file_path, usecols=DataLoader._select_columns(names, columns))
+            else:
+                df = pd.read_csv(file_path)
         elif file_path.endswith(('.xls', '.xlsx')):
             df = pd.read_excel(file_path)
+        elif file_path.endswith(('.parquet', '.pq')):
+            # Spaltenauswahl direkt beim Lesen, ein gespeicherter Index wird automatisch wiederhergestellt
+            if columns:
+                import pyarrow.parquet as pq
+                names = pq.read_schema(file_path).names
+                df = pd.read_parquet(file_path, columns=DataLoader._select_columns(names, columns))
+            else:
+                df = pd.read_parquet(file_path)
+        elif file_path.endswith(('.feather', '.arrow')):
+            if columns:
+                import pyarrow.ipc as ipc
+                # Nur das Schema lesen, die Daten liest read_feather danach spaltenweise
+                with ipc.open_file(file_path) as reader:
+                    names = reader.schema.names
+                df = pd.read_feather(file_path, columns=DataLoader._select_columns(names, columns))
+            else:
+                df = pd.read_feather(file_path)
+        elif file_path.endswith(('.h5', '.hdf5', '.hdf')):
+            try:
+                df = pd.read_hdf(file_path)
+            except ImportError:
+                raise ValueError(f"Für HDF5-Dateien wird das Paket 'tables' benötigt: {file_path}")
+            if columns:
+                df = df[DataLoader._select_columns(df.columns, columns)]
         else:
             raise ValueError(f"Nicht unterstütztes Dateiformat: {file_path}")
         
@@ -192,11 +470,107 @@ class DataLoader:
         
         return df
     
+    @staticmethod
+    def _select_columns(names, columns):
+        """
+        Wählt die zu lesenden Spalten aus den vorhandenen Spalten einer Datei aus.
+        
+        Args:
+            names (list): Spalten der Datei
+            columns (list): Gewünschte Spalten
+            
+        Returns:
+            list: Vorhandene gewünschte Spalten plus Datumsspalte
+        """
+        wanted = set(columns) | {'Date', 'Datum'}
+        selected = [name for name in names if name in wanted]
+        if not any(name in columns for name in selected):
+            raise ValueError(f"Keine der Spalten {', '.join(columns)} vorhanden")
+        return selected
+    
+    @staticmethod
+    def _load_from_npy(file_path, columns=None):
+        """
+        Öffnet eine NumPy-Datei als Memory-Map, ohne die Daten zu kopieren.
+        
+        Erwartet wird ein strukturiertes Array mit den Feldern 'Date' (datetime64) und den
+        Preisspalten. Im Spaltenformat von save_data (ein Eintrag, jedes Feld ein Array der
+        Länge n) sind alle Spalten zusammenhängende Views auf die Datei, sodass z.B.
+        ElliottWaveAnalyzer.prices direkt auf die gemappten Daten zeigt. Ein Array mit einem
+        Eintrag pro Bar wird ebenfalls ohne Kopie, aber mit Schrittweite geöffnet.
+        
+        Args:
+            file_path (str): Pfad zur .npy-Datei
+            columns (list, optional): Nur diese Spalten übernehmen
+            
+        Returns:
+            pandas.DataFrame: DataFrame mit OHLCV-Daten (schreibgeschützt)
+        """
+        mapped = np.load(file_path, mmap_mode='r')
+        if mapped.dtype.names is None or mapped.ndim > 1:
+            raise ValueError(f"Die NumPy-Datei muss ein strukturiertes Array mit benannten Spalten enthalten: {file_path}")
+        
+        date_col = 'Date' if 'Date' in mapped.dtype.names else 'Datum' if 'Datum' in mapped.dtype.names else None
+        names = [name for name in mapped.dtype.names if name != date_col]
+        if columns:
+            names = DataLoader._select_columns(names, columns)
+        
+        data = {name: mapped[name] for name in names}
+        index = pd.DatetimeIndex(mapped[date_col], name=date_col, copy=False) if date_col else None
+        return pd.DataFrame(data, index=index, copy=False)
+    
+    @staticmethod
+    def iter_csv_chunks(file_path, chunksize=500000, columns=None, float32=False, date_format='ISO8601'):
+        """
+        Liest eine CSV-Datei blockweise mit festen Datentypen, z.B. für sehr große Intraday-Exporte.
+        
+        Es werden nur die Datumsspalte und die gewünschten Preisspalten gelesen. Die Datumsspalte
+        wird mit einem festen Format geparst, statt das Format für jeden Wert zu erraten; passt das
+        Format nicht, wird wie beim normalen Laden mit pandas.to_datetime ohne Format geparst.
+        
+        Args:
+            file_path (str): Pfad zur CSV-Datei
+            chunksize (int): Anzahl der Zeilen pro Block
+            columns (list, optional): Zu lesende Spalten (Standard: OHLCV_COLUMNS, soweit vorhanden)
+            float32 (bool): Liest die Preisspalten (ohne Volumen) als float32 statt float64
+            date_format (str): Format der Datumsspalte für pandas.to_datetime (Standard: 'ISO8601')
+            
+        Returns:
+            generator: DataFrames mit Datumsindex, einer pro Block
+        """
+        header = pd.read_csv(file_path, nrows=0).columns
+        date_col = 'Date' if 'Date' in header else 'Datum' if 'Datum' in header else None
+        value_cols = [col for col in (columns or DataLoader.OHLCV_COLUMNS) if col in header]
+        if not value_cols:
+            raise ValueError(f"Keine der Spalten {', '.join(columns or DataLoader.OHLCV_COLUMNS)} in {file_path} gefunden")
+        
+        float_type = np.float32 if float32 else np.float64
+        usecols = ([date_col] if date_col else []) + value_cols
+        # Volumen bleibt float64, float32 ist nur bis etwa 16 Mio. ganzzahlig exakt
+        dtype = {col: (np.float64 if col == 'Volume' else float_type) for col in value_cols}
+        if date_col:
+            dtype[date_col] = str
+        
+        for chunk in pd.read_csv(file_path, usecols=usecols, dtype=dtype, chunksize=chunksize):
+            if date_col:
+                dates = chunk.pop(date_col)
+                try:
+                    dates = pd.to_datetime(dates, format=date_format)
+                except ValueError:
+                    # Kein ISO-Format: für diesen und alle weiteren Blöcke das Format erraten lassen
+                    date_format = None
+                    dates = pd.to_datetime(dates)
+                chunk.index = pd.DatetimeIndex(dates, name=date_col)
+            yield chunk[value_cols]
+    
     @staticmethod
     def _load_from_yahoo(symbol, start_date, end_date):
         """
         Lädt historische Daten von Yahoo Finance.
         
+        Bereits heruntergeladene Zeiträume werden aus dem lokalen Cache gelesen,
+        nur fehlende Zeiträume werden nachgeladen und mit dem Cache zusammengeführt.
+        
         Args:
             symbol (str): Aktien-Tickersymbol
             start_date (str): Startdatum im Format 'YYYY-MM-DD'
@@ -206,21 +580,222 @@ class DataLoader:
             pandas.DataFrame: DataFrame mit OHLCV-Daten
         """
         try:
-            print(f"Lade Daten für Symbol: {symbol}")
-            df = yf.download(symbol, start=start_date, end=end_date)
+            if not DataLoader.CACHE_ENABLED:
+                print(f"Lade Daten für Symbol: {symbol}")
+                df = yahoo_http.download(symbol, start=start_date, end=end_date)[0]
+            else:
+                df = DataLoader._load_with_cache(symbol, start_date, end_date)
             
             # Überprüfe, ob Daten heruntergeladen wurden
             if df.empty:
-                raise ValueError(f"Keine Daten für Symbol {symbol} gefunden")
+                raise yahoo_http.FetchError(symbol, yahoo_http.NOT_FOUND, f"Keine Daten für Symbol {symbol} gefunden")
                 
             return df
         except Exception as e:
-            raise Exception(f"Fehler beim Herunterladen der Daten für {symbol}: {str(e)}")
+            # Die Kategorie bleibt erhalten, damit Aufrufer z.B. unbekannte Symbole überspringen können
+            raise yahoo_http.FetchError(symbol, yahoo_http.classify(e),
+                                        f"Fehler beim Herunterladen der Daten für {symbol}: {getattr(e, 'message', str(e))}") from e
+    
+    @staticmethod
+    def _cache_paths(symbol):
+        """
+        Liefert die Pfade der Cache-Dateien für ein aufgelöstes Symbol.
+        
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol (z.B. 'SAP.DE', '^GDAXI')
+            
+        Returns:
+            tuple: (Pfad der Parquet-Datei, Pfad der Metadaten-Datei)
+        """
+        safe_symbol = "".join(c if c.isalnum() or c in '.-_' else '_' for c in symbol)
+        base = os.path.join(DataLoader.CACHE_DIR, safe_symbol)
+        return f"{base}.parquet", f"{base}.json"
+    
+    @staticmethod
+    def _load_with_cache(symbol, start_date, end_date, download=None):
+        """
+        Lädt historische Daten über den lokalen Cache und füllt nur fehlende Zeiträume nach.
+        
+        In den Metadaten wird der bereits abgedeckte Zeitraum [start, end) gespeichert,
+        damit Wochenenden und Feiertage am Rand nicht bei jedem Aufruf erneut angefragt werden.
+        
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol
+            start_date (str): Startdatum im Format 'YYYY-MM-DD' oder None
+            end_date (str): Enddatum im Format 'YYYY-MM-DD' (exklusiv)
+            download (callable, optional): Funktion (Symbol, Start, Ende) -> DataFrame für
+                                           fehlende Zeiträume (Standard: yahoo_http.download)
+            
+        Returns:
+            pandas.DataFrame: DataFrame mit OHLCV-Daten für den angefragten Zeitraum
+        """
+        data_path, meta_path = DataLoader._cache_paths(symbol)
+        
+        cached = None
+        covered_start = covered_end = None
+        if os.path.isfile(data_path) and os.path.isfile(meta_path):
+            try:
+                cached = pd.read_parquet(data_path)
+                covered_start, covered_end = DataLoader._read_cache_meta(meta_path)
+            except Exception as e:
+                print(f"Cache für {symbol} nicht lesbar, lade neu: {str(e)}")
+                cached = None
+        
+        if cached is None:
+            gaps = [(start_date, end_date)]
+        else:
+            gaps = DataLoader._missing_ranges(covered_start, covered_end, start_date, end_date)
+        
+        frames = [cached] if cached is not None else []
+        for gap_start, gap_end in gaps:
+            if download is None:
+                print(f"Lade Daten für Symbol: {symbol} ({gap_start or 'Beginn'} bis {gap_end})")
+                frames.append(yahoo_http.download(symbol, start=gap_start, end=gap_end)[0])
+            else:
+                frames.append(download(symbol, gap_start, gap_end))
+        
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        
+        if gaps:
+            # Neuere Daten überschreiben ältere Einträge desselben Datums
+            df = df[~df.index.duplicated(keep='last')].sort_index()
+            
+            if cached is None:
+                new_start, new_end = start_date, end_date
+            else:
+                new_start = None if (start_date is None or covered_start is None) else min(start_date, covered_start)
+                new_end = max(end_date, covered_end)
+            # Zukünftige Tage und der laufende Handelstag gelten nicht als abgedeckt
+            new_end = min(new_end, DataLoader._cache_horizon())
+            
+            try:
+                os.makedirs(DataLoader.CACHE_DIR, exist_ok=True)
+                # Schreibe atomar, damit parallele Leser keine halbe Datei sehen
+                df.to_parquet(f"{data_path}.tmp")
+                os.replace(f"{data_path}.tmp", data_path)
+                with open(f"{meta_path}.tmp", 'w') as f:
+                    json.dump({'start': new_start, 'end': new_end}, f)
+                os.replace(f"{meta_path}.tmp", meta_path)
+            except Exception as e:
+                print(f"Cache für {symbol} konnte nicht geschrieben werden: {str(e)}")
+        
+        # Gib nur den angefragten Zeitraum zurück (Enddatum exklusiv wie bei yf.download)
+        mask = df.index < DataLoader._as_index_timestamp(end_date, df.index)
+        if start_date is not None:
+            mask &= df.index >= DataLoader._as_index_timestamp(start_date, df.index)
+        return df[mask]
+    
+    @staticmethod
+    def _missing_ranges(covered_start, covered_end, start_date, end_date):
+        """
+        Bestimmt die Zeiträume, die im Cache noch fehlen.
+        
+        Args:
+            covered_start (str): Beginn des abgedeckten Zeitraums oder None (Beginn der Historie)
+            covered_end (str): Ende des abgedeckten Zeitraums (exklusiv) oder None (nichts abgedeckt)
+            start_date (str): Angefragtes Startdatum oder None
+            end_date (str): Angefragtes Enddatum (exklusiv)
+            
+        Returns:
+            list: Liste von (Start, Ende)-Tupeln
+        """
+        # Ohne bekanntes Ende gilt der Cache als leer
+        if covered_end is None:
+            return [(start_date, end_date)]
+        
+        # None als Start bedeutet "ab Beginn der Historie"
+        gaps = []
+        if covered_start is not None and (start_date is None or start_date < covered_start):
+            gaps.append((start_date, covered_start))
+        if end_date > covered_end:
+            gaps.append((covered_end, end_date))
+        return gaps
     
     @staticmethod
+    def _cache_gaps(symbol, start_date, end_date):
+        """
+        Bestimmt anhand der Cache-Metadaten, welche Zeiträume für ein Symbol geladen werden müssen.
+        
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol
+            start_date (str): Startdatum im Format 'YYYY-MM-DD' oder None
+            end_date (str): Enddatum im Format 'YYYY-MM-DD' (exklusiv)
+            
+        Returns:
+            list: Liste von (Start, Ende)-Tupeln
+        """
+        data_path, meta_path = DataLoader._cache_paths(symbol)
+        if not (os.path.isfile(data_path) and os.path.isfile(meta_path)):
+            return [(start_date, end_date)]
+        try:
+            covered_start, covered_end = DataLoader._read_cache_meta(meta_path)
+        except Exception:
+            return [(start_date, end_date)]
+        return DataLoader._missing_ranges(covered_start, covered_end, start_date, end_date)
+    
+    @staticmethod
+    def _read_cache_meta(meta_path):
+        """
+        Liest den abgedeckten Zeitraum aus der Metadaten-Datei des Caches.
+        
+        Args:
+            meta_path (str): Pfad der Metadaten-Datei
+            
+        Returns:
+            tuple: (Beginn oder None für den Beginn der Historie, Ende (exklusiv))
+            
+        Raises:
+            ValueError: Wenn die Datei 'start' oder 'end' nicht enthält (z.B. abgeschnitten
+                        oder von Hand bearbeitet), der Cache wird dann neu geladen
+        """
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if not isinstance(meta, dict) or 'start' not in meta or not isinstance(meta.get('end'), str):
+            raise ValueError(f"Unvollständige Cache-Metadaten: {meta_path}")
+        if meta['start'] is not None and not isinstance(meta['start'], str):
+            raise ValueError(f"Unvollständige Cache-Metadaten: {meta_path}")
+        # Ältere Caches können ein Ende in der Zukunft enthalten
+        return meta['start'], min(meta['end'], DataLoader._cache_horizon())
+    
+    @staticmethod
+    def _cache_horizon():
+        """
+        Liefert das späteste Ende (exklusiv), bis zu dem der Cache als vollständig gilt.
+        
+        Der heutige Bar kann sich bis Handelsschluss noch ändern und wird deshalb bei jedem
+        Aufruf mit einem Enddatum nach heute erneut geladen.
+        
+        Returns:
+            str: Heutiges Datum im Format 'YYYY-MM-DD'
+        """
+        return datetime.now().strftime('%Y-%m-%d')
+    
+    @staticmethod
+    def _as_index_timestamp(date, index):
+        """
+        Wandelt ein Datum in einen Zeitstempel um, der mit dem Index vergleichbar ist.
+        
+        Args:
+            date (str): Datum im Format 'YYYY-MM-DD'
+            index (pandas.DatetimeIndex): Index der Kursdaten
+            
+        Returns:
+            pandas.Timestamp: Zeitstempel in der Zeitzone des Index
+        """
+        timestamp = pd.Timestamp(date)
+        if getattr(index, 'tz', None) is not None:
+            timestamp = timestamp.tz_localize(index.tz)
+        return timestamp
+    
+    @staticmethod
+    @profiled('get_live_data')
     def get_live_data(symbol, exchange=None):
         """
-        Holt aktuelle Live-Daten von Yahoo Finance API.
+        Holt aktuelle Live-Daten vom aktiven Provider (Standard: Yahoo Finance API).
         
         Args:
             symbol (str): Aktien-Tickersymbol
@@ -229,40 +804,161 @@ class DataLoader:
         Returns:
             dict: Aktuelle Marktdaten für das Symbol
         """
-        # Prüfe, ob es ein deutscher Index ist
-        if DataLoader.is_german_index(symbol):
-            # Verwende das korrekte Symbol für den Index
-            if symbol == 'DAX':
-                symbol = '^GDAXI'
-            elif symbol == 'MDAX':
-                symbol = '^MDAXI'
-            elif symbol == 'SDAX':
-                symbol = '^SDAXI'
-            elif symbol == 'TecDAX':
-                symbol = '^TDXP'
-            elif symbol == 'HDAX':
-                symbol = '^HDAXI'
-        # Prüfe, ob es ein US-Symbol ist
-        elif DataLoader.is_us_symbol(symbol):
-            # Für US-Symbole keine weitere Formatierung
-            pass
-        # Ansonsten formatiere es als deutsches Aktien-Symbol, wenn nötig
-        elif not any(suffix in symbol for suffix in DataLoader.GERMAN_EXCHANGES.values()):
-            symbol = DataLoader.format_german_symbol(symbol, exchange)
-            
+        symbol = DataLoader.resolve_symbol(symbol, exchange)
+        
+        provider = providers.get_provider()
+        
         # Da die API-Anfragen zu 401-Fehlern führen, nutzen wir direkt den Fallback
         # Prüfe nur, ob API-Schlüssel vorhanden sind, nutze sie aber nicht mehr direkt
-        if all([DataLoader.YAHOO_APP_ID, DataLoader.YAHOO_CLIENT_ID, DataLoader.YAHOO_CLIENT_SECRET]):
+        if isinstance(provider, providers.YahooProvider) and all([DataLoader.YAHOO_APP_ID, DataLoader.YAHOO_CLIENT_ID, DataLoader.YAHOO_CLIENT_SECRET]):
             print("Info: API-Schlüssel vorhanden, aber es wird yfinance als Datenquelle verwendet.")
         
-        # Verwende direkt den Fallback-Mechanismus
-        return DataLoader._get_live_data_fallback(symbol)
+        return provider.quote(symbol)
+    
+    @staticmethod
+    def _get_executor():
+        """
+        Liefert den gemeinsamen Thread-Pool für parallele Anfragen an Yahoo Finance.
+        
+        Returns:
+            concurrent.futures.ThreadPoolExecutor: Thread-Pool
+        """
+        with DataLoader._executor_lock:
+            if DataLoader._executor is None:
+                DataLoader._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='yahoo')
+            return DataLoader._executor
+    
+    @staticmethod
+    def _fetch_live_group(symbol, group, fetch):
+        """
+        Liefert eine Feldgruppe der Live-Daten aus dem Cache oder startet genau einen Abruf.
+        
+        Solange ein Abruf für Symbol und Feldgruppe läuft, erhalten weitere Aufrufer dasselbe
+        Future, statt Yahoo Finance erneut anzufragen. Nur erfolgreiche Abrufe mit Daten werden
+        für LIVE_CACHE_TTL[group] Sekunden zwischengespeichert; Ausnahmen und leere Ergebnisse
+        (None, leerer DataFrame oder leeres Dictionary) werden beim nächsten Aufruf neu abgerufen.
+        
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol
+            group (str): Feldgruppe ('price', 'info' oder 'options')
+            fetch (callable): Funktion ohne Argumente, die die Feldgruppe abruft
+            
+        Returns:
+            concurrent.futures.Future: Future mit dem Wert der Feldgruppe
+        """
+        key = (symbol, group)
+        ttl = DataLoader.LIVE_CACHE_TTL.get(group, 0)
+        
+        with DataLoader._live_lock:
+            cached = DataLoader._live_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                future = Future()
+                future.set_result(cached[1])
+                return future
+            
+            future = DataLoader._live_inflight.get(key)
+            if future is not None:
+                return future
+            
+            def run():
+                try:
+                    value = fetch()
+                    if ttl > 0 and not DataLoader._is_empty_live_value(value):
+                        with DataLoader._live_lock:
+                            DataLoader._live_cache[key] = (time.monotonic(), value)
+                    return value
+                finally:
+                    with DataLoader._live_lock:
+                        DataLoader._live_inflight.pop(key, None)
+            
+            future = DataLoader._get_executor().submit(run)
+            DataLoader._live_inflight[key] = future
+            return future
+    
+    @staticmethod
+    def _is_empty_live_value(value):
+        """
+        Returns:
+            bool: True, wenn ein Abruf keine Daten geliefert hat und nicht zwischengespeichert wird
+        """
+        if value is None:
+            return True
+        if isinstance(value, (pd.DataFrame, dict)):
+            return len(value) == 0
+        return False
+    
+    @staticmethod
+    def clear_live_cache(symbol=None):
+        """
+        Verwirft zwischengespeicherte Live-Daten, damit der nächste Aufruf neu abruft.
+        
+        Args:
+            symbol (str, optional): Nur die Daten dieses aufgelösten Symbols verwerfen (Standard: alle)
+        """
+        with DataLoader._live_lock:
+            if symbol is None:
+                DataLoader._live_cache.clear()
+            else:
+                for key in [key for key in DataLoader._live_cache if key[0] == symbol]:
+                    del DataLoader._live_cache[key]
+    
+    @staticmethod
+    def _fetch_options_data(ticker, symbol):
+        """
+        Holt die Optionsdaten des nächsten Verfallsdatums und berechnet das Put/Call-Verhältnis.
+        
+        Fehler beim Abruf werden nicht abgefangen, damit das Ergebnis nicht zwischengespeichert
+        wird (siehe _fetch_live_group).
+        
+        Args:
+            ticker (yfinance.Ticker): Ticker-Objekt
+            symbol (str): Aktien-Tickersymbol
+            
+        Returns:
+            tuple: (put_call_ratio, options_data)
+        """
+        put_call_ratio = None
+        options_data = {}
+        
+        # Prüfe, ob Optionen verfügbar sind
+        exp_dates = yahoo_http.call(lambda: ticker.options, symbol, retries=DataLoader.LIVE_RETRIES)
+        
+        if exp_dates:
+            # Nimm das nächste Verfallsdatum
+            nearest_date = exp_dates[0]
+            
+            # Hole Optionen für dieses Datum
+            options = yahoo_http.call(lambda: ticker.option_chain(nearest_date), symbol,
+                                      retries=DataLoader.LIVE_RETRIES)
+            
+            # Berechne Put/Call Ratio
+            total_calls_volume = options.calls['volume'].sum() if 'volume' in options.calls.columns else 0
+            total_puts_volume = options.puts['volume'].sum() if 'volume' in options.puts.columns else 0
+            
+            if total_calls_volume > 0:
+                put_call_ratio = total_puts_volume / total_calls_volume
+            
+            # Sammle weitere Optionsdaten
+            options_data = {
+                'expiry_date': nearest_date,
+                'calls_volume': total_calls_volume,
+                'puts_volume': total_puts_volume,
+                'total_options_volume': total_calls_volume + total_puts_volume
+            }
+        
+        return put_call_ratio, options_data
     
     @staticmethod
     def _get_live_data_fallback(symbol):
         """
         Fallback-Methode für Live-Daten, die yfinance verwendet.
         
+        Kursdaten, Stammdaten (info) und Optionsdaten werden parallel angefragt. Sobald die
+        Kursdaten vorliegen, wird höchstens LIVE_SENTIMENT_TIMEOUT Sekunden auf die übrigen
+        Anfragen gewartet; nicht rechtzeitig eingetroffene Felder bleiben None. Alle drei
+        Feldgruppen werden je Symbol zwischengespeichert und gleichzeitige Abrufe zusammengefasst
+        (siehe _fetch_live_group).
+        
         Args:
             symbol (str): Aktien-Tickersymbol
             
@@ -271,17 +967,47 @@ class DataLoader:
         """
         try:
             # Verwende yfinance als Fallback
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            ticker = yahoo_http.ticker(symbol)
+            retries = DataLoader.LIVE_RETRIES
+            
+            info_future = DataLoader._fetch_live_group(
+                symbol, 'info', lambda: yahoo_http.call(lambda: ticker.info, symbol, retries=retries))
+            history_future = DataLoader._fetch_live_group(
+                symbol, 'price', lambda: yahoo_http.call(lambda: ticker.history(period='1d'), symbol, retries=retries))
+            options_future = DataLoader._fetch_live_group(
+                symbol, 'options', lambda: DataLoader._fetch_options_data(ticker, symbol))
             
             # Hole die aktuellen Marktdaten
-            live_data = ticker.history(period='1d')
+            try:
+                live_data = history_future.result(timeout=DataLoader.LIVE_PRICE_TIMEOUT)
+            except FuturesTimeoutError:
+                raise TimeoutError(f"Zeitüberschreitung beim Abruf der Kursdaten nach {DataLoader.LIVE_PRICE_TIMEOUT} Sekunden")
             
             if live_data.empty:
                 raise ValueError(f"Keine Live-Daten für {symbol} verfügbar")
                 
             last_quote = live_data.iloc[-1]
             
+            # Warte begrenzt auf Stammdaten und Optionsdaten
+            futures_wait([info_future, options_future], timeout=DataLoader.LIVE_SENTIMENT_TIMEOUT)
+            
+            info = {}
+            if info_future.done() and info_future.exception() is None:
+                info = info_future.result() or {}
+            elif not info_future.done():
+                print(f"Info: Stammdaten für {symbol} noch nicht verfügbar, Felder bleiben leer.")
+            else:
+                print(f"Keine Stammdaten verfügbar für {symbol}: {str(info_future.exception())}")
+            
+            put_call_ratio = None
+            options_data = {}
+            if options_future.done() and options_future.exception() is None:
+                put_call_ratio, options_data = options_future.result()
+            elif not options_future.done():
+                print(f"Info: Optionsdaten für {symbol} noch nicht verfügbar, Felder bleiben leer.")
+            else:
+                print(f"Keine Optionsdaten verfügbar für {symbol}: {str(options_future.exception())}")
+            
             # Sammle Sentiment-Daten (Short Interest und Options-Daten)
             short_percent = info.get('shortPercentOfFloat', None)
             if short_percent is not None:
@@ -289,37 +1015,6 @@ class DataLoader:
                 if short_percent < 1:
                     short_percent = short_percent * 100
             
-            # Hole Optionsdaten, wenn verfügbar
-            put_call_ratio = None
-            options_data = {}
-            try:
-                # Prüfe, ob Optionen verfügbar sind
-                exp_dates = ticker.options
-                
-                if exp_dates:
-                    # Nimm das nächste Verfallsdatum
-                    nearest_date = exp_dates[0]
-                    
-                    # Hole Optionen für dieses Datum
-                    options = ticker.option_chain(nearest_date)
-                    
-                    # Berechne Put/Call Ratio
-                    total_calls_volume = options.calls['volume'].sum() if 'volume' in options.calls.columns else 0
-                    total_puts_volume = options.puts['volume'].sum() if 'volume' in options.puts.columns else 0
-                    
-                    if total_calls_volume > 0:
-                        put_call_ratio = total_puts_volume / total_calls_volume
-                    
-                    # Sammle weitere Optionsdaten
-                    options_data = {
-                        'expiry_date': nearest_date,
-                        'calls_volume': total_calls_volume,
-                        'puts_volume': total_puts_volume,
-                        'total_options_volume': total_calls_volume + total_puts_volume
-                    }
-            except Exception as e:
-                print(f"Keine Optionsdaten verfügbar für {symbol}: {str(e)}")
-            
             # Stelle sicher, dass alle Werte als native Python-Typen (nicht numpy) zurückgegeben werden
             return {
                 'symbol': symbol,
@@ -343,6 +1038,7 @@ class DataLoader:
             raise Exception(f"Fehler beim Abrufen der Live-Daten für {symbol}: {str(e)}")
     
     @staticmethod
+    @profiled('get_recent_data')
     def get_recent_data(symbol, days=60, exchange=None):
         """
         Holt die Daten der letzten X Tage für ein Symbol.
@@ -358,28 +1054,9 @@ class DataLoader:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        # Prüfe, ob es ein deutscher Index ist
-        if DataLoader.is_german_index(symbol):
-            # Verwende das korrekte Symbol für den Index
-            if symbol == 'DAX':
-                symbol = '^GDAXI'
-            elif symbol == 'MDAX':
-                symbol = '^MDAXI'
-            elif symbol == 'SDAX':
-                symbol = '^SDAXI'
-            elif symbol == 'TecDAX':
-                symbol = '^TDXP'
-            elif symbol == 'HDAX':
-                symbol = '^HDAXI'
-        # Prüfe, ob es ein US-Symbol ist
-        elif DataLoader.is_us_symbol(symbol):
-            # Für US-Symbole keine weitere Formatierung
-            pass
-        # Ansonsten formatiere es als deutsches Aktien-Symbol, wenn nötig
-        elif not any(suffix in symbol for suffix in DataLoader.GERMAN_EXCHANGES.values()):
-            symbol = DataLoader.format_german_symbol(symbol, exchange)
-            
-        return DataLoader._load_from_yahoo(
+        symbol = DataLoader.resolve_symbol(symbol, exchange)
+        
+        return providers.get_provider().history(
             symbol, 
             start_date.strftime('%Y-%m-%d'), 
             end_date.strftime('%Y-%m-%d')
@@ -388,17 +1065,38 @@ class DataLoader:
     @staticmethod
     def save_data(df, file_path):
         """
-        Speichert Daten in einer CSV-Datei.
+        Speichert Daten in einer CSV-, Parquet-, Feather- oder NumPy-Datei (nach Dateiendung).
+        
+        NumPy-Dateien werden im Spaltenformat gespeichert, das _load_from_npy ohne Kopie öffnet.
         
         Args:
             df (pandas.DataFrame): DataFrame mit den zu speichernden Daten
             file_path (str): Pfad zur Ausgabedatei
         """
         # Stelle sicher, dass das Verzeichnis existiert
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
         
         # Speichere die Daten
-        df.to_csv(file_path)
+        if file_path.endswith(('.parquet', '.pq')):
+            df.to_parquet(file_path)
+        elif file_path.endswith(('.feather', '.arrow')):
+            # Feather speichert keinen Index, das Datum wird zur Spalte
+            df.reset_index().to_feather(file_path)
+        elif file_path.endswith('.npy'):
+            columns = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+            fields = [(str(col), '<f8', (len(df),)) for col in columns]
+            if isinstance(df.index, pd.DatetimeIndex):
+                fields.insert(0, ('Date', '<M8[ns]', (len(df),)))
+            
+            record = np.zeros((), dtype=np.dtype(fields))
+            if isinstance(df.index, pd.DatetimeIndex):
+                dates = df.index.tz_convert(None) if df.index.tz is not None else df.index
+                record['Date'] = dates.as_unit('ns').values
+            for col in columns:
+                record[str(col)] = df[col].to_numpy(dtype=float)
+            np.save(file_path, record)
+        else:
+            df.to_csv(file_path)
         print(f"Daten wurden in {file_path} gespeichert.")
 
 
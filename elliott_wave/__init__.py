@@ -1,5 +1,5 @@
 from .analyzer import ElliottWaveAnalyzer
 from .patterns import WavePattern
-from .utils import calculate_fibonacci_levels
+from .utils import calculate_fibonacci_levels, StreamingZigZag, IncrementalZigZagLadder, zigzag_ladder
 
-__all__ = ["ElliottWaveAnalyzer", "WavePattern", "calculate_fibonacci_levels"] 
\ No newline at end of file
+__all__ = ["ElliottWaveAnalyzer", "WavePattern", "calculate_fibonacci_levels", "StreamingZigZag", "IncrementalZigZagLadder", "zigzag_ladder"] 
@@ -3,9 +3,11 @@
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from .patterns import WavePattern
-from .utils import find_local_extrema, calculate_fibonacci_levels, zigzag_filter
+from .patterns import WavePattern, validate_impulse_windows
+from .utils import find_local_extrema, calculate_fibonacci_levels, zigzag_ladder
+from .signals import WalkForwardEngine, detect_current_wave, predict_from_wave
+from .profiling import profiled
+from . import result_cache
 
 class ElliottWaveAnalyzer:
     """
@@ -30,23 +32,57 @@ class ElliottWaveAnalyzer:
             'diagonal': []
         }
         
-    def analyze(self, zigzag_threshold=0.03, window_size=10):
+    @profiled('analyze')
+    def analyze(self, zigzag_threshold=0.03, window_size=10, use_high_low=False):
         """
         Führt die Elliott-Wellen-Analyse durch.
         
         Args:
             zigzag_threshold (float): Mindestprozentsatz für eine Trendumkehrung im ZigZag-Filter
             window_size (int): Fenstergröße für die Extrema-Erkennung
+            use_high_low (bool): Sucht lokale Extrema in den Spalten High/Low statt in der Preisspalte
             
         Returns:
             dict: Dictionary mit identifizierten Wellen
         """
-        # Identifiziere die Wendepunkte mit dem ZigZag-Filter
-        pivot_points = zigzag_filter(self.prices, threshold=zigzag_threshold)
+        use_high_low = use_high_low and 'High' in self.data and 'Low' in self.data
+        
+        # Der Cache gilt nur für einen frischen Analyzer, da weitere Aufrufe an die Wellen anhängen
+        if any(self.waves.values()):
+            return self._compute_waves(zigzag_threshold, window_size, use_high_low)
+        
+        arrays = [self.prices]
+        if use_high_low:
+            arrays += [self.data['High'].values, self.data['Low'].values]
+        
+        self.waves = result_cache.memoize(
+            'analyze',
+            lambda: self._compute_waves(zigzag_threshold, window_size, use_high_low),
+            arrays,
+            zigzag_threshold=zigzag_threshold,
+            window_size=window_size,
+            use_high_low=use_high_low
+        )
+        return self.waves
+    
+    def _compute_waves(self, zigzag_threshold, window_size, use_high_low):
+        """
+        Berechnet die Wendepunkte und identifiziert die Wellen (siehe analyze).
+        
+        Returns:
+            dict: Dictionary mit identifizierten Wellen
+        """
+        # Identifiziere die Wendepunkte mit dem ZigZag-Filter (aus dem Cache, falls bereits berechnet)
+        pivot_points = zigzag_ladder(self.prices, [zigzag_threshold])[zigzag_threshold]
         
         # Oder alternativ lokale Extrema finden
         if len(pivot_points) < 5:  # Wenn ZigZag nicht genug Punkte liefert
-            maxima, minima = find_local_extrema(self.prices, window=window_size)
+            if use_high_low:
+                maxima, minima = find_local_extrema(self.prices, window=window_size,
+                                                    highs=self.data['High'].values,
+                                                    lows=self.data['Low'].values)
+            else:
+                maxima, minima = find_local_extrema(self.prices, window=window_size)
             pivot_points = sorted(list(maxima) + list(minima))
         
         # Identifiziere potenzielle Wellen
@@ -54,6 +90,7 @@ class ElliottWaveAnalyzer:
         
         return self.waves
     
+    @profiled('identify_waves')
     def _identify_waves(self, pivot_points):
         """
         Identifiziert potenzielle Elliott-Wellen anhand der Wendepunkte.
@@ -61,30 +98,33 @@ class ElliottWaveAnalyzer:
         Args:
             pivot_points (list): Liste mit Indizes der Wendepunkte
         """
-        # Um Wellen zu identifizieren, betrachten wir alle möglichen Sequenzen von 6 Punkten (5 Wellen)
-        for i in range(len(pivot_points) - 5):
+        # Um Wellen zu identifizieren, betrachten wir alle möglichen Sequenzen von 6 Punkten (5 Wellen).
+        # Die Impulsregeln werden für alle Fenster gleichzeitig geprüft, Muster-Objekte
+        # entstehen nur für gültige Fenster
+        num_windows = max(len(pivot_points) - 5, 0)
+        pivot_prices = self.prices[np.asarray(pivot_points, dtype=int)]
+        
+        for i in validate_impulse_windows(pivot_prices):
             points = [(idx, self.prices[idx]) for idx in pivot_points[i:i+6]]
-            
-            # Versuche, eine Impulswelle zu identifizieren
             impulse_pattern = WavePattern("impulse", points)
-            if impulse_pattern.is_valid:
-                self.waves['impulse'].append({
-                    'indices': pivot_points[i:i+6],
-                    'pattern': impulse_pattern,
-                    'wave_count': len(self.waves['impulse']) + 1
+            self.waves['impulse'].append({
+                'indices': pivot_points[i:i+6],
+                'pattern': impulse_pattern,
+                'wave_count': len(self.waves['impulse']) + 1
+            })
+        
+        # Versuche, Korrekturwellen zu identifizieren (mindestens 4 Punkte je Fenster)
+        for i in range(num_windows):
+            corr_points = [(idx, self.prices[idx]) for idx in pivot_points[i:i+4]]
+            corrective_pattern = WavePattern("corrective", corr_points)
+            if corrective_pattern.is_valid:
+                self.waves['corrective'].append({
+                    'indices': pivot_points[i:i+4],
+                    'pattern': corrective_pattern,
+                    'wave_count': len(self.waves['corrective']) + 1
                 })
-            
-            # Versuche, eine Korrekturwelle zu identifizieren
-            if i <= len(pivot_points) - 4:  # Mindestens 4 Punkte für eine Korrekturwelle
-                corr_points = [(idx, self.prices[idx]) for idx in pivot_points[i:i+4]]
-                corrective_pattern = WavePattern("corrective", corr_points)
-                if corrective_pattern.is_valid:
-                    self.waves['corrective'].append({
-                        'indices': pivot_points[i:i+4],
-                        'pattern': corrective_pattern,
-                        'wave_count': len(self.waves['corrective']) + 1
-                    })
     
+    @profiled('find_current_wave')
     def find_current_wave(self, look_back=30):
         """
         Versucht, die aktuelle Elliott-Welle im letzten Abschnitt der Daten zu identifizieren.
@@ -95,42 +135,7 @@ class ElliottWaveAnalyzer:
         Returns:
             dict: Informationen zur aktuellen Welle oder None, wenn keine gefunden wurde
         """
-        # Wir analysieren nur den letzten Teil der Daten
-        last_n_prices = self.prices[-look_back:]
-        
-        # Identifiziere Wendepunkte im betrachteten Abschnitt
-        pivot_points = zigzag_filter(last_n_prices, threshold=0.03)
-        
-        # Konvertiere relative Indizes zu absoluten Indizes
-        abs_pivot_points = [len(self.prices) - look_back + idx for idx in pivot_points]
-        
-        # Wenn wir mindestens 3 Wendepunkte haben, versuchen wir ein Muster zu erkennen
-        if len(abs_pivot_points) >= 3:
-            points = [(idx, self.prices[idx]) for idx in abs_pivot_points]
-            
-            # Prüfe auf typische Wellenmuster
-            
-            # 1. Wenn wir 5 oder mehr Punkte haben, könnte es eine Impulswelle sein
-            if len(points) >= 5:
-                impulse_pattern = WavePattern("impulse", points)
-                if impulse_pattern.is_valid:
-                    return {
-                        'type': 'impulse',
-                        'points': points,
-                        'next_target': impulse_pattern.get_next_target()
-                    }
-            
-            # 2. Wenn wir 3 oder mehr Punkte haben, könnte es eine Korrekturwelle sein
-            if len(points) >= 3:
-                corrective_pattern = WavePattern("corrective", points)
-                if corrective_pattern.is_valid:
-                    return {
-                        'type': 'corrective',
-                        'points': points,
-                        'next_target': corrective_pattern.get_next_target()
-                    }
-        
-        return None
+        return detect_current_wave(self.prices, look_back=look_back)
     
     def predict_next_move(self):
         """
@@ -139,40 +144,11 @@ class ElliottWaveAnalyzer:
         Returns:
             dict: Vorhersage für die nächste Bewegung
         """
-        current_wave = self.find_current_wave()
-        
-        if current_wave is None:
-            return {
-                'prediction': 'unbestimmt',
-                'confidence': 0.0,
-                'target': None
-            }
-        
-        wave_type = current_wave['type']
-        target = current_wave['next_target']
-        
-        if wave_type == 'impulse':
-            # Nach einer Impulswelle erwarten wir typischerweise eine Korrektur
-            return {
-                'prediction': 'Korrektur erwartet',
-                'confidence': 0.7,
-                'target': target
-            }
-        elif wave_type == 'corrective':
-            # Nach einer Korrekturwelle erwarten wir typischerweise eine Fortsetzung des übergeordneten Trends
-            return {
-                'prediction': 'Trendfortsetzung erwartet',
-                'confidence': 0.6,
-                'target': target
-            }
-        
-        return {
-            'prediction': 'unbestimmt',
-            'confidence': 0.0,
-            'target': None
-        }
+        return predict_from_wave(self.find_current_wave())
     
-    def backtest(self, start_date=None, end_date=None, invest_amount=10000):
+    @profiled('backtest')
+    def backtest(self, start_date=None, end_date=None, invest_amount=10000,
+                 zigzag_threshold=0.03, look_back=30, stop_loss=None):
         """
         Führt einen einfachen Backtest der Elliott-Wellen-Strategie durch.
         
@@ -180,116 +156,152 @@ class ElliottWaveAnalyzer:
             start_date (str): Startdatum für den Backtest
             end_date (str): Enddatum für den Backtest
             invest_amount (float): Anfänglicher Investitionsbetrag
+            zigzag_threshold (float): Schwellenwert für den ZigZag-Filter der Wellenerkennung
+            look_back (int): Anzahl der letzten Datenpunkte für die Wellenerkennung
+            stop_loss (float, optional): Verkauft, wenn der Kurs um diesen Anteil unter den Kaufkurs fällt
             
+        Returns:
+            dict: Ergebnisse des Backtests mit Kennzahlen, 'trades' (DataFrame mit den Spalten
+                  date, action, price, shares, value) und 'equity_curve' (DataFrame mit Datumsindex
+                  und den Spalten equity, position, cash)
+        """
+        return result_cache.memoize(
+            'backtest',
+            lambda: self._run_backtest(start_date, end_date, invest_amount,
+                                       zigzag_threshold, look_back, stop_loss),
+            [self.data[self.price_col].values, self.data.index.values],
+            index_tz=getattr(self.data.index, 'tz', None),
+            start_date=start_date,
+            end_date=end_date,
+            invest_amount=invest_amount,
+            zigzag_threshold=zigzag_threshold,
+            look_back=look_back,
+            stop_loss=stop_loss
+        )
+    
+    def _run_backtest(self, start_date, end_date, invest_amount, zigzag_threshold, look_back, stop_loss):
+        """
+        Führt den Backtest ohne Ergebnis-Cache durch (siehe backtest).
+        
         Returns:
             dict: Ergebnisse des Backtests
         """
         # Filtere Daten für den Backtest-Zeitraum
         if start_date:
-            start_idx = self.data.index.get_loc(pd.to_datetime(start_date), method='nearest')
+            start_idx = self.data.index.get_indexer([pd.to_datetime(start_date)], method='nearest')[0]
         else:
             start_idx = 0
             
         if end_date:
-            end_idx = self.data.index.get_loc(pd.to_datetime(end_date), method='nearest')
+            end_idx = self.data.index.get_indexer([pd.to_datetime(end_date)], method='nearest')[0]
         else:
             end_idx = len(self.data) - 1
         
         backtest_data = self.data.iloc[start_idx:end_idx+1]
         
-        # Initialisiere Backtest-Variablen
+        # Die Walk-Forward-Engine hält den Preis-Puffer inkrementell, statt für jeden Tag
+        # einen neuen Analyzer auf einem Slice der Daten zu erzeugen
+        prices = np.asarray(backtest_data[self.price_col].values, dtype=float).reshape(-1)
+        dates = backtest_data.index
+        engine = WalkForwardEngine(look_back=look_back, zigzag_threshold=zigzag_threshold)
+        engine.extend(prices[:60])
+        
+        # Zustand je Bar in vorab angelegten Arrays: Bargeld, Anteile und Aktion (1 Kauf, -1 Verkauf)
+        warmup = min(60, len(prices))  # Starte nach 60 Tagen, um genug Daten für die Analyse zu haben
+        num_bars = len(prices) - warmup
+        cash_history = np.empty(num_bars)
+        position_history = np.empty(num_bars)
+        actions = np.zeros(num_bars, dtype=np.int8)
+        
         cash = invest_amount
         shares = 0
-        trades = []
-        equity_curve = []
+        entry_price = None
         
         # Führe den Backtest durch, indem wir die Daten Tag für Tag durchlaufen
-        for i in range(60, len(backtest_data)):  # Starte nach 60 Tagen, um genug Daten für die Analyse zu haben
-            # Erstelle einen temporären Analyzer für die Daten bis zum aktuellen Tag
-            temp_analyzer = ElliottWaveAnalyzer(backtest_data.iloc[:i+1], self.price_col)
-            prediction = temp_analyzer.predict_next_move()
+        for k in range(num_bars):
+            current_price = prices[warmup + k]
+            prediction = engine.append(current_price)
             
-            current_price = backtest_data.iloc[i][self.price_col]
-            current_date = backtest_data.index[i]
+            # Stop-Loss prüfen, falls aktiviert
+            stop_hit = (stop_loss is not None and shares > 0 and
+                        current_price <= entry_price * (1 - stop_loss))
             
             # Entscheidungslogik basierend auf der Vorhersage
-            if prediction['prediction'] == 'Trendfortsetzung erwartet' and prediction['confidence'] > 0.5:
+            if prediction['prediction'] == 'Trendfortsetzung erwartet' and prediction['confidence'] > 0.5 and not stop_hit:
                 # Kaufen, wenn wir noch keine Aktien haben
                 if shares == 0 and cash > 0:
                     shares = cash / current_price
                     cash = 0
-                    trades.append({
-                        'date': current_date,
-                        'action': 'buy',
-                        'price': current_price,
-                        'shares': shares,
-                        'value': shares * current_price
-                    })
+                    entry_price = current_price
+                    actions[k] = 1
             
-            elif prediction['prediction'] == 'Korrektur erwartet' and prediction['confidence'] > 0.5:
+            elif (prediction['prediction'] == 'Korrektur erwartet' and prediction['confidence'] > 0.5) or stop_hit:
                 # Verkaufen, wenn wir Aktien haben
                 if shares > 0:
                     cash = shares * current_price
-                    trades.append({
-                        'date': current_date,
-                        'action': 'sell',
-                        'price': current_price,
-                        'shares': shares,
-                        'value': cash
-                    })
                     shares = 0
+                    actions[k] = -1
             
-            # Aktualisiere die Equity-Kurve
-            equity = cash + shares * current_price
-            equity_curve.append({
-                'date': current_date,
-                'equity': equity
-            })
+            cash_history[k] = cash
+            position_history[k] = shares
+        
+        # Equity-Kurve als Spalten statt einem Dictionary pro Bar
+        bar_prices = prices[warmup:]
+        equity = cash_history + position_history * bar_prices
+        equity_curve = pd.DataFrame({
+            'equity': equity,
+            'position': position_history,
+            'cash': cash_history
+        }, index=dates[warmup:])
+        
+        # Trades ergeben sich aus den Bars mit Kauf oder Verkauf
+        trade_bars = np.flatnonzero(actions)
+        # Bei einem Verkauf zählt der Bestand des vorherigen Bars (ein Verkauf folgt immer auf einen Kauf)
+        trade_shares = np.where(actions[trade_bars] == 1, position_history[trade_bars],
+                                position_history[trade_bars - 1])
+        trades = pd.DataFrame({
+            'date': dates[warmup:][trade_bars],
+            'action': np.where(actions[trade_bars] == 1, 'buy', 'sell'),
+            'price': bar_prices[trade_bars],
+            'shares': trade_shares,
+            'value': np.where(actions[trade_bars] == 1, trade_shares * bar_prices[trade_bars],
+                              cash_history[trade_bars])
+        })
         
         # Berechne Backtest-Metriken
         initial_equity = invest_amount
-        final_equity = equity_curve[-1]['equity'] if equity_curve else invest_amount
+        final_equity = equity[-1] if num_bars else invest_amount
         
         # Rendite berechnen
         total_return = (final_equity - initial_equity) / initial_equity * 100
         
-        # Maximal Drawdown berechnen
-        peak = invest_amount
-        drawdowns = []
+        # Maximal Drawdown berechnen (Höchststand beginnt beim Anfangskapital)
+        peak = np.maximum(np.maximum.accumulate(equity), invest_amount) if num_bars else equity
+        max_drawdown = ((peak - equity) / peak * 100).max() if num_bars else 0
         
-        for point in equity_curve:
-            equity = point['equity']
-            if equity > peak:
-                peak = equity
-            drawdown = (peak - equity) / peak * 100
-            drawdowns.append(drawdown)
+        # Gewinn/Verlust pro Trade: Käufe und Verkäufe wechseln sich ab, ein offener Kauf am Ende zählt nicht
+        trade_values = trades['value'].to_numpy()
+        num_closed = len(trade_values) // 2
+        buy_values = trade_values[0:2 * num_closed:2]
+        sell_values = trade_values[1:2 * num_closed:2]
+        trade_returns = (sell_values - buy_values) / buy_values * 100
         
-        max_drawdown = max(drawdowns) if drawdowns else 0
-        
-        # Gewinn/Verlust pro Trade
-        trade_returns = []
-        for i in range(0, len(trades) - 1, 2):
-            if i + 1 < len(trades) and trades[i]['action'] == 'buy' and trades[i+1]['action'] == 'sell':
-                buy_value = trades[i]['value']
-                sell_value = trades[i+1]['value']
-                trade_return = (sell_value - buy_value) / buy_value * 100
-                trade_returns.append(trade_return)
-        
-        avg_trade_return = sum(trade_returns) / len(trade_returns) if trade_returns else 0
-        win_rate = sum(1 for r in trade_returns if r > 0) / len(trade_returns) if trade_returns else 0
+        avg_trade_return = trade_returns.mean() if num_closed else 0
+        win_rate = (trade_returns > 0).mean() if num_closed else 0
         
         return {
             'initial_investment': invest_amount,
-            'final_equity': final_equity,
-            'total_return': total_return,
-            'max_drawdown': max_drawdown,
-            'num_trades': len(trades) // 2,  # Jeder vollständige Trade ist ein Kauf + Verkauf
-            'win_rate': win_rate * 100,  # In Prozent
-            'avg_trade_return': avg_trade_return,
+            'final_equity': float(final_equity),
+            'total_return': float(total_return),
+            'max_drawdown': float(max_drawdown),
+            'num_trades': num_closed,  # Jeder vollständige Trade ist ein Kauf + Verkauf
+            'win_rate': float(win_rate) * 100,  # In Prozent
+            'avg_trade_return': float(avg_trade_return),
             'trades': trades,
             'equity_curve': equity_curve
         }
     
+    @profiled('plot_backtest_results')
     def plot_backtest_results(self, backtest_results):
         """
         Plottet die Ergebnisse eines Backtests.
@@ -300,6 +312,8 @@ class ElliottWaveAnalyzer:
         Returns:
             matplotlib.figure.Figure: Figure-Objekt des Plots
         """
+        import matplotlib.pyplot as plt
+        
         trades = backtest_results['trades']
         equity_curve = backtest_results['equity_curve']
         
@@ -310,17 +324,17 @@ class ElliottWaveAnalyzer:
         ax1.plot(self.data.index, self.data[self.price_col], color='black', alpha=0.6, label='Preis')
         
         # Markiere Kauf- und Verkaufspunkte
-        for trade in trades:
-            if trade['action'] == 'buy':
-                ax1.scatter(trade['date'], trade['price'], color='green', marker='^', s=100, label='Kauf')
-                ax1.annotate(f"Kauf: {trade['price']:.2f}", 
-                           (trade['date'], trade['price']), 
+        for trade in trades.itertuples(index=False):
+            if trade.action == 'buy':
+                ax1.scatter(trade.date, trade.price, color='green', marker='^', s=100, label='Kauf')
+                ax1.annotate(f"Kauf: {trade.price:.2f}", 
+                           (trade.date, trade.price), 
                            xytext=(5, 5), 
                            textcoords='offset points')
             else:  # 'sell'
-                ax1.scatter(trade['date'], trade['price'], color='red', marker='v', s=100, label='Verkauf')
-                ax1.annotate(f"Verkauf: {trade['price']:.2f}", 
-                           (trade['date'], trade['price']), 
+                ax1.scatter(trade.date, trade.price, color='red', marker='v', s=100, label='Verkauf')
+                ax1.annotate(f"Verkauf: {trade.price:.2f}", 
+                           (trade.date, trade.price), 
                            xytext=(5, -15), 
                            textcoords='offset points')
         
@@ -334,10 +348,7 @@ class ElliottWaveAnalyzer:
         ax1.grid(True, alpha=0.3)
         
         # Plot 2: Equity-Kurve
-        equity_dates = [point['date'] for point in equity_curve]
-        equity_values = [point['equity'] for point in equity_curve]
-        
-        ax2.plot(equity_dates, equity_values, color='blue', label='Equity')
+        ax2.plot(equity_curve.index, equity_curve['equity'], color='blue', label='Equity')
         ax2.set_title('Equity-Kurve')
         ax2.set_xlabel('Datum')
         ax2.set_ylabel('Equity (€)')
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 class WavePattern:
     """
     Klasse zur Repräsentation und Validierung von Elliott-Wellen-Mustern.
@@ -163,4 +166,45 @@ class WavePattern:
             
             return (target_100, target_162)
         
-        return None 
\ No newline at end of file
+        return None
+
+def validate_impulse_windows(pivot_prices):
+    """
+    Validiert alle 6-Punkte-Fenster einer Pivot-Preisreihe gleichzeitig als Impulswellen.
+    
+    Wendet dieselben vier Regeln wie WavePattern.validate_impulse_wave an, jedoch als
+    NumPy-Masken über eine Sliding-Window-Sicht statt einer Schleife über WavePattern-Objekte.
+    
+    Args:
+        pivot_prices (array-like): Preise an den Wendepunkten
+        
+    Returns:
+        numpy.ndarray: Startoffsets der Fenster, die eine gültige Impulswelle bilden
+    """
+    pivot_prices = np.asarray(pivot_prices, dtype=float)
+    if len(pivot_prices) < 6:
+        return np.empty(0, dtype=int)
+    
+    windows = sliding_window_view(pivot_prices, 6)
+    p0, p2, p4, p5 = windows[:, 0], windows[:, 2], windows[:, 4], windows[:, 5]
+    
+    # Regel 1: Welle 2 darf nicht unter den Beginn von Welle 1 zurückgehen
+    valid = p2 > p0
+    
+    # Regel 2: Welle 3 muss länger sein als Welle 1 oder Welle 5
+    wave1_length = np.abs(p2 - p0)
+    wave3_length = np.abs(p4 - p2)
+    wave5_length = np.abs(p5 - p4)
+    valid &= (wave3_length > wave1_length) | (wave3_length > wave5_length)
+    
+    # Regel 3: Welle 3 darf nicht die kürzeste unter den Wellen 1, 3 und 5 sein
+    valid &= ~(wave3_length < np.minimum(wave1_length, wave5_length))
+    
+    # Regel 4: Welle 4 darf nicht in den Preisbereich von Welle 1 eindringen
+    up = p0 < p2
+    down = p0 > p2
+    in_trend = (up & (p4 < p2)) | (down & (p4 > p2))
+    overlap = (up & (p4 < p0)) | (down & (p4 > p0))
+    valid &= ~(in_trend & overlap)
+    
+    return np.flatnonzero(valid)
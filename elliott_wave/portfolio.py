@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from .signals import WalkForwardEngine
+from .profiling import profiled
+
+# Anzahl der ersten gültigen Kurse je Symbol, die nur zum Aufbau der Historie dienen (wie im Einzel-Backtest)
+WARMUP_BARS = 60
+
+def build_price_matrix(histories, price_col='Close'):
+    """
+    Richtet die Preisreihen vieler Symbole an einem gemeinsamen Datumsindex aus.
+
+    Args:
+        histories (dict): Dictionary {Symbol: DataFrame mit OHLCV-Daten}
+        price_col (str): Name der Spalte mit den Preisdaten
+
+    Returns:
+        pandas.DataFrame: Preis-Matrix (Datum x Symbol), NaN an Tagen ohne Kurs
+    """
+    columns = {}
+    for symbol, df in histories.items():
+        if df is None or df.empty or price_col not in df:
+            continue
+        index = df.index
+        # Börsen in verschiedenen Zeitzonen werden über das lokale Datum zusammengeführt
+        if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+            index = index.tz_localize(None)
+        series = pd.Series(np.asarray(df[price_col], dtype=float).reshape(-1), index=index)
+        columns[symbol] = series[~series.index.duplicated(keep='last')]
+
+    if not columns:
+        return pd.DataFrame()
+
+    return pd.DataFrame(columns).sort_index()
+
+def _symbol_signals(prices, look_back, zigzag_threshold):
+    """
+    Berechnet die Handelssignale eines Symbols im Worker-Prozess.
+
+    Args:
+        prices (numpy.ndarray): Preisspalte der Matrix (NaN an Tagen ohne Kurs)
+        look_back (int): Anzahl der letzten Datenpunkte für die Wellenerkennung
+        zigzag_threshold (float): Schwellenwert für den ZigZag-Filter
+
+    Returns:
+        tuple: (Signale als int8-Array mit 1 Kauf, -1 Verkauf, 0 kein Signal; Konfidenz als float-Array)
+    """
+    signals = np.zeros(len(prices), dtype=np.int8)
+    confidence = np.zeros(len(prices))
+
+    # Die Engine sieht nur die Tage, an denen das Symbol gehandelt wurde
+    valid = np.flatnonzero(~np.isnan(prices))
+    engine = WalkForwardEngine(look_back=look_back, zigzag_threshold=zigzag_threshold)
+    engine.extend(prices[valid[:WARMUP_BARS]])
+
+    for row in valid[WARMUP_BARS:]:
+        prediction = engine.append(prices[row])
+        if prediction['confidence'] <= 0.5:
+            continue
+        if prediction['prediction'] == 'Trendfortsetzung erwartet':
+            signals[row] = 1
+        elif prediction['prediction'] == 'Korrektur erwartet':
+            signals[row] = -1
+        confidence[row] = prediction['confidence']
+
+    return signals, confidence
+
+@profiled('portfolio_signals')
+def compute_signal_matrix(price_matrix, look_back=30, zigzag_threshold=0.03, workers=None):
+    """
+    Berechnet die Elliott-Signale aller Symbole parallel.
+
+    Args:
+        price_matrix (pandas.DataFrame): Preis-Matrix aus build_price_matrix
+        look_back (int): Anzahl der letzten Datenpunkte für die Wellenerkennung
+        zigzag_threshold (float): Schwellenwert für den ZigZag-Filter
+        workers (int): Anzahl der Prozesse (Standard: alle Kerne)
+
+    Returns:
+        tuple: (Signal-Matrix int8, Konfidenz-Matrix float) mit der Form der Preis-Matrix
+    """
+    values = price_matrix.to_numpy(dtype=float)
+    num_bars, num_symbols = values.shape
+    signals = np.zeros((num_bars, num_symbols), dtype=np.int8)
+    confidence = np.zeros((num_bars, num_symbols))
+    if num_symbols == 0:
+        return signals, confidence
+
+    workers = min(workers or os.cpu_count() or 1, num_symbols)
+    columns = [np.ascontiguousarray(values[:, j]) for j in range(num_symbols)]
+
+    if workers == 1:
+        results = [_symbol_signals(column, look_back, zigzag_threshold) for column in columns]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_symbol_signals, columns,
+                                        [look_back] * num_symbols, [zigzag_threshold] * num_symbols))
+
+    for j, (column_signals, column_confidence) in enumerate(results):
+        signals[:, j] = column_signals
+        confidence[:, j] = column_confidence
+
+    return signals, confidence
+
+@profiled('portfolio_backtest')
+def run_portfolio_backtest(price_matrix, invest_amount=10000, zigzag_threshold=0.03, look_back=30,
+                           max_positions=10, stop_loss=None, workers=None):
+    """
+    Führt einen Backtest der Elliott-Wellen-Strategie über viele Symbole mit gemeinsamem Kapital durch.
+
+    Für jedes Symbol werden die Signale wie im Einzel-Backtest berechnet. Kaufsignale werden
+    nach Konfidenz bedient, solange weniger als max_positions Positionen offen sind. Jede neue
+    Position erhält höchstens den Anteil 1/max_positions des aktuellen Portfoliowerts.
+
+    Args:
+        price_matrix (pandas.DataFrame): Preis-Matrix (Datum x Symbol) aus build_price_matrix
+        invest_amount (float): Anfänglicher Investitionsbetrag
+        zigzag_threshold (float): Schwellenwert für den ZigZag-Filter der Wellenerkennung
+        look_back (int): Anzahl der letzten Datenpunkte für die Wellenerkennung
+        max_positions (int): Maximale Anzahl gleichzeitig gehaltener Symbole
+        stop_loss (float, optional): Verkauft, wenn der Kurs um diesen Anteil unter den Kaufkurs fällt
+        workers (int): Anzahl der Prozesse für die Signalberechnung (Standard: alle Kerne)
+
+    Returns:
+        dict: Kennzahlen des Portfolios, 'trades' (DataFrame mit date, symbol, action, price,
+              shares, value), 'equity_curve' (DataFrame mit equity, cash, invested, positions),
+              'positions' (DataFrame mit den Anteilen je Symbol) und 'symbols' (Kennzahlen je Symbol)
+    """
+    if max_positions < 1:
+        raise ValueError("max_positions muss mindestens 1 sein")
+
+    symbols = list(price_matrix.columns)
+    prices = price_matrix.to_numpy(dtype=float)
+    num_bars, num_symbols = prices.shape
+
+    signals, confidence = compute_signal_matrix(price_matrix, look_back=look_back,
+                                                zigzag_threshold=zigzag_threshold, workers=workers)
+
+    # Für die Bewertung gilt an Tagen ohne Kurs der letzte bekannte Kurs
+    valuation_prices = np.nan_to_num(price_matrix.ffill().to_numpy(dtype=float), nan=0.0)
+    tradable = ~np.isnan(prices)
+
+    position_history = np.zeros((num_bars, num_symbols))
+    cash_history = np.empty(num_bars)
+
+    shares = np.zeros(num_symbols)
+    entry_prices = np.zeros(num_symbols)
+    cash = float(invest_amount)
+
+    for i in range(num_bars):
+        row_prices = prices[i]
+        held = shares > 0
+
+        # Verkäufe zuerst, damit das frei werdende Kapital am selben Tag neu angelegt werden kann
+        sell = held & tradable[i] & (signals[i] == -1)
+        if stop_loss is not None:
+            sell |= held & tradable[i] & (row_prices <= entry_prices * (1 - stop_loss))
+        if sell.any():
+            cash += float(np.sum(shares[sell] * row_prices[sell]))
+            shares[sell] = 0.0
+
+        # Käufe in der Reihenfolge der Konfidenz, begrenzt durch freie Positionen und Kapital
+        free_slots = max_positions - int(np.count_nonzero(shares))
+        buy = (shares == 0) & tradable[i] & (signals[i] == 1) & ~sell
+        if free_slots > 0 and cash > 0 and buy.any():
+            candidates = np.flatnonzero(buy)
+            # Stabile Sortierung: bei gleicher Konfidenz gewinnt die Reihenfolge der Symbole
+            candidates = candidates[np.argsort(-confidence[i, candidates], kind='stable')][:free_slots]
+
+            equity = cash + float(np.dot(shares, valuation_prices[i]))
+            amount = min(equity / max_positions, cash / len(candidates))
+            shares[candidates] = amount / row_prices[candidates]
+            entry_prices[candidates] = row_prices[candidates]
+            cash -= amount * len(candidates)
+
+        position_history[i] = shares
+        cash_history[i] = cash
+
+    # Portfolio-Kennzahlen vektorisiert über alle Symbole und Tage
+    holdings_value = position_history * valuation_prices
+    invested = holdings_value.sum(axis=1)
+    equity = cash_history + invested
+
+    dates = price_matrix.index
+    equity_curve = pd.DataFrame({
+        'equity': equity,
+        'cash': cash_history,
+        'invested': invested,
+        'positions': np.count_nonzero(position_history, axis=1)
+    }, index=dates)
+
+    final_equity = equity[-1] if num_bars else invest_amount
+    total_return = (final_equity - invest_amount) / invest_amount * 100
+
+    peak = np.maximum(np.maximum.accumulate(equity), invest_amount) if num_bars else equity
+    max_drawdown = ((peak - equity) / peak * 100).max() if num_bars else 0
+
+    trades = _derive_trades(position_history, prices, dates, symbols)
+    trade_returns = _closed_trade_returns(trades)
+
+    # Kennzahlen je Symbol: Anzahl abgeschlossener Trades und Summe der Gewinne
+    symbol_stats = trade_returns.groupby('symbol').agg(
+        num_trades=('return', 'size'),
+        win_rate=('return', lambda r: (r > 0).mean() * 100),
+        avg_trade_return=('return', 'mean'),
+        profit=('profit', 'sum')
+    ).reindex(symbols)
+    symbol_stats['num_trades'] = symbol_stats['num_trades'].fillna(0).astype(int)
+    symbol_stats['profit'] = symbol_stats['profit'].fillna(0.0)
+
+    num_closed = len(trade_returns)
+    return {
+        'initial_investment': invest_amount,
+        'final_equity': float(final_equity),
+        'total_return': float(total_return),
+        'max_drawdown': float(max_drawdown),
+        'num_trades': num_closed,
+        'win_rate': float((trade_returns['return'] > 0).mean() * 100) if num_closed else 0.0,
+        'avg_trade_return': float(trade_returns['return'].mean()) if num_closed else 0.0,
+        'num_symbols': num_symbols,
+        'max_positions': max_positions,
+        'trades': trades,
+        'equity_curve': equity_curve,
+        'positions': pd.DataFrame(position_history, index=dates, columns=symbols),
+        'symbols': symbol_stats
+    }
+
+def _derive_trades(position_history, prices, dates, symbols):
+    """
+    Leitet die Trades aus den Änderungen der Positionen ab.
+
+    Args:
+        position_history (numpy.ndarray): Anteile je Tag und Symbol
+        prices (numpy.ndarray): Preis-Matrix
+        dates (pandas.Index): Datumsindex
+        symbols (list): Symbole in Spaltenreihenfolge
+
+    Returns:
+        pandas.DataFrame: Trades mit date, symbol, action, price, shares, value (nach Datum sortiert)
+    """
+    previous = np.vstack([np.zeros((1, position_history.shape[1])), position_history[:-1]])
+    buys = (previous == 0) & (position_history > 0)
+    sells = (previous > 0) & (position_history == 0)
+
+    rows, cols = np.nonzero(buys | sells)
+    is_buy = buys[rows, cols]
+    trade_shares = np.where(is_buy, position_history[rows, cols], previous[rows, cols])
+    trade_prices = prices[rows, cols]
+
+    return pd.DataFrame({
+        'date': dates[rows],
+        'symbol': np.asarray(symbols, dtype=object)[cols],
+        'action': np.where(is_buy, 'buy', 'sell'),
+        'price': trade_prices,
+        'shares': trade_shares,
+        'value': trade_shares * trade_prices
+    })
+
+def _closed_trade_returns(trades):
+    """
+    Paart Käufe und Verkäufe je Symbol und berechnet die Rendite der abgeschlossenen Trades.
+
+    Args:
+        trades (pandas.DataFrame): Trades aus _derive_trades
+
+    Returns:
+        pandas.DataFrame: Spalten symbol, return (Prozent) und profit je abgeschlossenem Trade
+    """
+    if trades.empty:
+        return pd.DataFrame({'symbol': [], 'return': [], 'profit': []})
+
+    # Je Symbol wechseln sich Kauf und Verkauf ab, ein offener Kauf am Ende zählt nicht
+    ordered = trades.sort_values(['symbol', 'date'], kind='stable')
+    next_symbol = ordered['symbol'].shift(-1)
+    next_action = ordered['action'].shift(-1)
+    next_value = ordered['value'].shift(-1)
+
+    closed = (ordered['action'] == 'buy') & (next_action == 'sell') & (next_symbol == ordered['symbol'])
+    buy_values = ordered['value'][closed].to_numpy()
+    sell_values = next_value[closed].to_numpy()
+
+    return pd.DataFrame({
+        'symbol': ordered['symbol'][closed].to_numpy(),
+        'return': (sell_values - buy_values) / buy_values * 100,
+        'profit': sell_values - buy_values
+    })
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Gesammelte Messwerte je Stufe: {name: {'calls': int, 'wall': float, 'cpu': float}}
+_stats = {}
+_lock = threading.Lock()
+_enabled = False
+
+def enable(flag=True):
+    """
+    Schaltet die Messung der Verarbeitungsstufen ein oder aus.
+
+    Args:
+        flag (bool): True zum Einschalten, False zum Ausschalten
+    """
+    global _enabled
+    _enabled = flag
+
+def is_enabled():
+    """
+    Returns:
+        bool: True, wenn die Messung eingeschaltet ist
+    """
+    return _enabled
+
+def reset():
+    """Verwirft alle bisher gesammelten Messwerte."""
+    with _lock:
+        _stats.clear()
+
+@contextmanager
+def stage(name):
+    """
+    Misst Wall- und CPU-Zeit eines Codeabschnitts und zählt die Aufrufe.
+
+    Ist die Messung ausgeschaltet, entsteht praktisch kein Overhead.
+
+    Args:
+        name (str): Name der Verarbeitungsstufe
+    """
+    if not _enabled:
+        yield
+        return
+
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        with _lock:
+            entry = _stats.setdefault(name, {'calls': 0, 'wall': 0.0, 'cpu': 0.0})
+            entry['calls'] += 1
+            entry['wall'] += wall
+            entry['cpu'] += cpu
+
+def profiled(name):
+    """
+    Dekorator, der jeden Aufruf einer Funktion als Verarbeitungsstufe misst.
+
+    Args:
+        name (str): Name der Verarbeitungsstufe
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def get_report():
+    """
+    Liefert die gesammelten Messwerte, absteigend nach Wall-Zeit sortiert.
+
+    Returns:
+        list: Liste von Dictionaries mit 'stage', 'calls', 'wall', 'cpu' (Sekunden)
+    """
+    with _lock:
+        report = [
+            {'stage': name, 'calls': entry['calls'], 'wall': entry['wall'], 'cpu': entry['cpu']}
+            for name, entry in _stats.items()
+        ]
+    report.sort(key=lambda row: row['wall'], reverse=True)
+    return report
+
+def format_report():
+    """
+    Formatiert die Messwerte als Texttabelle.
+
+    Verschachtelte Stufen (z.B. zigzag_filter innerhalb von analyze) werden jeweils
+    vollständig gezählt, die Summen überlappen sich daher.
+
+    Returns:
+        str: Tabelle mit einer Zeile pro Verarbeitungsstufe
+    """
+    report = get_report()
+    if not report:
+        return "Keine Messwerte vorhanden."
+
+    width = max(len("Stufe"), max(len(row['stage']) for row in report))
+    lines = [f"{'Stufe':<{width}}  {'Aufrufe':>8}  {'Wall (ms)':>12}  {'CPU (ms)':>12}  {'Ø Wall (ms)':>12}"]
+    for row in report:
+        avg = row['wall'] / row['calls'] * 1000 if row['calls'] else 0.0
+        lines.append(
+            f"{row['stage']:<{width}}  {row['calls']:>8}  {row['wall'] * 1000:>12.2f}  "
+            f"{row['cpu'] * 1000:>12.2f}  {avg:>12.3f}"
+        )
+    return "\n".join(lines)
+
+def dump_json(file_path):
+    """
+    Speichert die Messwerte als JSON, z.B. zum Vergleich mehrerer Läufe.
+
+    Args:
+        file_path (str): Pfad zur Ausgabedatei
+    """
+    with open(file_path, 'w') as f:
+        json.dump({'stages': get_report()}, f, indent=2)
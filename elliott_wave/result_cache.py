@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Muss erhöht werden, wenn sich die Ergebnisse der gecachten Berechnungen ändern
+CACHE_VERSION = 2
+
+_cache_dir = os.getenv('EW_RESULT_CACHE_DIR',
+                       os.path.join(os.path.expanduser('~'), '.cache', 'elliott_wave', 'results'))
+_max_bytes = int(float(os.getenv('EW_RESULT_CACHE_MB', '256')) * 1024 * 1024)
+_lock = threading.Lock()
+_enabled = False
+
+def enable(flag=True, cache_dir=None, max_mb=None):
+    """
+    Schaltet den Ergebnis-Cache ein oder aus.
+
+    Args:
+        flag (bool): True zum Einschalten, False zum Ausschalten
+        cache_dir (str, optional): Verzeichnis für die Cache-Dateien
+        max_mb (float, optional): Maximale Größe des Caches in MB
+    """
+    global _enabled, _cache_dir, _max_bytes
+    _enabled = flag
+    if cache_dir is not None:
+        _cache_dir = cache_dir
+    if max_mb is not None:
+        _max_bytes = int(max_mb * 1024 * 1024)
+
+def is_enabled():
+    """
+    Returns:
+        bool: True, wenn der Ergebnis-Cache eingeschaltet ist
+    """
+    return _enabled
+
+def make_key(kind, arrays, **params):
+    """
+    Berechnet den Schlüssel eines Ergebnisses aus dem Inhalt der Eingabedaten und den Parametern.
+
+    Args:
+        kind (str): Art der Berechnung (z.B. 'analyze', 'backtest')
+        arrays (list): Eingabe-Arrays (Preise, Zeitstempel), None-Einträge werden übersprungen
+        **params: Parameter der Berechnung (müssen sich als JSON darstellen lassen)
+
+    Returns:
+        str: Hex-Digest des Schlüssels
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{kind}:{CACHE_VERSION}".encode())
+    for array in arrays:
+        if array is None:
+            continue
+        array = np.asarray(array)
+        if array.dtype == object:
+            # Objekt-Arrays (z.B. Datumsstrings) enthalten Zeiger, gehasht wird der Inhalt
+            array = pd.util.hash_array(array)
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+def _path(key):
+    return os.path.join(_cache_dir, f"{key}.pkl")
+
+def load(key):
+    """
+    Liest ein Ergebnis aus dem Cache und markiert es als zuletzt verwendet.
+
+    Args:
+        key (str): Schlüssel aus make_key
+
+    Returns:
+        tuple: (True, Ergebnis) bei einem Treffer, sonst (False, None)
+    """
+    path = _path(key)
+    try:
+        with open(path, 'rb') as f:
+            value = pickle.load(f)
+    except FileNotFoundError:
+        return False, None
+    except Exception as e:
+        print(f"Ergebnis-Cache-Eintrag {key[:12]} nicht lesbar, berechne neu: {str(e)}")
+        return False, None
+
+    # Die Änderungszeit dient als Zeitpunkt der letzten Verwendung für die LRU-Verdrängung
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return True, value
+
+def store(key, value):
+    """
+    Schreibt ein Ergebnis in den Cache und verdrängt bei Bedarf die ältesten Einträge.
+
+    Args:
+        key (str): Schlüssel aus make_key
+        value: Zu speicherndes Ergebnis (muss pickle-bar sein)
+    """
+    path = _path(key)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Schreibe atomar, damit parallele Leser keine halbe Datei sehen
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Ergebnis-Cache konnte nicht geschrieben werden: {str(e)}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+
+    _evict()
+
+def _evict():
+    """Löscht die am längsten nicht verwendeten Einträge, bis der Cache unter der Größengrenze liegt."""
+    with _lock:
+        entries = []
+        total = 0
+        try:
+            with os.scandir(_cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith('.pkl'):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+
+        if total <= _max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= _max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+def clear():
+    """Löscht alle Einträge des Ergebnis-Caches."""
+    with _lock:
+        if not os.path.isdir(_cache_dir):
+            return
+        for name in os.listdir(_cache_dir):
+            if name.endswith('.pkl'):
+                try:
+                    os.remove(os.path.join(_cache_dir, name))
+                except OSError:
+                    pass
+
+def memoize(kind, compute, arrays, **params):
+    """
+    Liefert das gecachte Ergebnis einer Berechnung oder berechnet und speichert es.
+
+    Ist der Cache ausgeschaltet, wird compute direkt aufgerufen.
+
+    Args:
+        kind (str): Art der Berechnung
+        compute (callable): Funktion ohne Argumente, die das Ergebnis berechnet
+        arrays (list): Eingabe-Arrays für den Schlüssel
+        **params: Parameter der Berechnung für den Schlüssel
+
+    Returns:
+        Ergebnis der Berechnung
+    """
+    if not _enabled:
+        return compute()
+
+    key = make_key(kind, arrays, **params)
+    found, value = load(key)
+    if found:
+        return value
+
+    value = compute()
+    store(key, value)
+    return value
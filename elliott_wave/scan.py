@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from .analyzer import ElliottWaveAnalyzer
+
+def _analyze_symbol(symbol, prices, last_date, zigzag_threshold, window_size):
+    """
+    Analysiert die Preisreihe eines Symbols im Worker-Prozess.
+
+    Args:
+        symbol (str): Tickersymbol
+        prices (numpy.ndarray): Schlusskurse
+        last_date (str): Datum des letzten Kurses
+        zigzag_threshold (float): Schwellenwert für den ZigZag-Filter
+        window_size (int): Fenstergröße für die Extrema-Erkennung
+
+    Returns:
+        dict: Ergebnis der Analyse oder None, wenn keine aktuelle Welle erkannt wurde
+    """
+    analyzer = ElliottWaveAnalyzer(pd.DataFrame({'Close': prices}))
+    waves = analyzer.analyze(zigzag_threshold=zigzag_threshold, window_size=window_size)
+    current_wave = analyzer.find_current_wave()
+
+    if current_wave is None:
+        return None
+
+    prediction = analyzer.predict_next_move()
+    target = prediction['target']
+
+    return {
+        'symbol': symbol,
+        'date': last_date,
+        'price': float(prices[-1]),
+        'wave_type': current_wave['type'],
+        'wave_points': len(current_wave['points']),
+        'prediction': prediction['prediction'],
+        'confidence': prediction['confidence'],
+        'target': tuple(float(t) for t in target) if isinstance(target, tuple) else target,
+        'impulse_count': len(waves['impulse']),
+        'corrective_count': len(waves['corrective'])
+    }
+
+def scan_universe(histories, zigzag_threshold=0.03, window_size=10, workers=None):
+    """
+    Analysiert viele Symbole parallel und liefert die Symbole mit einer gültigen aktuellen Welle.
+
+    Args:
+        histories (dict): Dictionary {Symbol: DataFrame mit OHLCV-Daten}
+        zigzag_threshold (float): Schwellenwert für den ZigZag-Filter
+        window_size (int): Fenstergröße für die Extrema-Erkennung
+        workers (int): Anzahl der Prozesse (Standard: alle Kerne)
+
+    Returns:
+        list: Ergebnisse je Symbol, sortiert nach Konfidenz, Wellentyp und Symbol
+    """
+    tasks = []
+    for symbol, df in histories.items():
+        if df is None or df.empty or 'Close' not in df:
+            continue
+        prices = np.asarray(df['Close'], dtype=float).reshape(-1)
+        last_date = df.index[-1].strftime('%Y-%m-%d') if isinstance(df.index, pd.DatetimeIndex) else str(df.index[-1])
+        tasks.append((symbol, prices, last_date))
+
+    if not tasks:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_analyze_symbol, symbol, prices, last_date, zigzag_threshold, window_size)
+            for symbol, prices, last_date in tasks
+        ]
+        results = []
+        for (symbol, _, _), future in zip(tasks, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Analyse für {symbol} fehlgeschlagen: {str(e)}")
+                continue
+            if result is not None:
+                results.append(result)
+
+    results.sort(key=lambda r: (-r['confidence'], r['wave_type'], r['symbol']))
+    return results
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from .patterns import WavePattern
+from .utils import zigzag_filter
+from .profiling import profiled
+
+@profiled('detect_current_wave')
+def detect_current_wave(prices, look_back=30, zigzag_threshold=0.03):
+    """
+    Erkennt die aktuelle Elliott-Welle im letzten Abschnitt einer Preisreihe.
+
+    Args:
+        prices (numpy.ndarray): Array mit Preisdaten (bis einschließlich des aktuellen Bars)
+        look_back (int): Anzahl der letzten Datenpunkte, die betrachtet werden sollen
+        zigzag_threshold (float): Schwellenwert für den ZigZag-Filter
+
+    Returns:
+        dict: Informationen zur aktuellen Welle oder None, wenn keine gefunden wurde
+    """
+    # Wir analysieren nur den letzten Teil der Daten
+    last_n_prices = prices[-look_back:]
+
+    # Identifiziere Wendepunkte im betrachteten Abschnitt
+    pivot_points = zigzag_filter(last_n_prices, threshold=zigzag_threshold)
+
+    # Konvertiere relative Indizes zu absoluten Indizes
+    abs_pivot_points = [len(prices) - look_back + idx for idx in pivot_points]
+
+    # Wenn wir mindestens 3 Wendepunkte haben, versuchen wir ein Muster zu erkennen
+    if len(abs_pivot_points) >= 3:
+        points = [(idx, prices[idx]) for idx in abs_pivot_points]
+
+        # 1. Wenn wir 5 oder mehr Punkte haben, könnte es eine Impulswelle sein
+        if len(points) >= 5:
+            impulse_pattern = WavePattern("impulse", points)
+            if impulse_pattern.is_valid:
+                return {
+                    'type': 'impulse',
+                    'points': points,
+                    'next_target': impulse_pattern.get_next_target()
+                }
+
+        # 2. Wenn wir 3 oder mehr Punkte haben, könnte es eine Korrekturwelle sein
+        if len(points) >= 3:
+            corrective_pattern = WavePattern("corrective", points)
+            if corrective_pattern.is_valid:
+                return {
+                    'type': 'corrective',
+                    'points': points,
+                    'next_target': corrective_pattern.get_next_target()
+                }
+
+    return None
+
+def predict_from_wave(current_wave):
+    """
+    Leitet aus der aktuellen Welle eine Vorhersage für die nächste Marktbewegung ab.
+
+    Args:
+        current_wave (dict): Ergebnis von detect_current_wave oder None
+
+    Returns:
+        dict: Vorhersage für die nächste Bewegung
+    """
+    if current_wave is None:
+        return {
+            'prediction': 'unbestimmt',
+            'confidence': 0.0,
+            'target': None
+        }
+
+    wave_type = current_wave['type']
+    target = current_wave['next_target']
+
+    if wave_type == 'impulse':
+        # Nach einer Impulswelle erwarten wir typischerweise eine Korrektur
+        return {
+            'prediction': 'Korrektur erwartet',
+            'confidence': 0.7,
+            'target': target
+        }
+    elif wave_type == 'corrective':
+        # Nach einer Korrekturwelle erwarten wir typischerweise eine Fortsetzung des übergeordneten Trends
+        return {
+            'prediction': 'Trendfortsetzung erwartet',
+            'confidence': 0.6,
+            'target': target
+        }
+
+    return {
+        'prediction': 'unbestimmt',
+        'confidence': 0.0,
+        'target': None
+    }
+
+class WalkForwardEngine:
+    """
+    Inkrementelle Walk-Forward-Auswertung der Elliott-Wellen-Signale.
+
+    Die Preise werden Bar für Bar angehängt. Statt für jeden Bar einen neuen
+    ElliottWaveAnalyzer auf einem DataFrame-Slice zu erzeugen, hält die Engine
+    einen wachsenden Preis-Puffer und wertet nur das Look-Back-Fenster am Ende
+    aus. Jeder Schritt kostet damit O(look_back) statt O(n), die Signale sind
+    identisch zu ElliottWaveAnalyzer.predict_next_move auf demselben Präfix.
+    """
+
+    def __init__(self, look_back=30, zigzag_threshold=0.03, capacity=1024):
+        """
+        Initialisiert die Engine.
+
+        Args:
+            look_back (int): Anzahl der letzten Datenpunkte für die Wellenerkennung
+            zigzag_threshold (float): Schwellenwert für den ZigZag-Filter
+            capacity (int): Anfangsgröße des Preis-Puffers
+        """
+        self.look_back = look_back
+        self.zigzag_threshold = zigzag_threshold
+        self._buffer = np.empty(max(int(capacity), 1), dtype=float)
+        self._size = 0
+        self.current_wave = None
+        self.prediction = predict_from_wave(None)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def prices(self):
+        """numpy.ndarray: Sicht auf alle bisher angehängten Preise (ohne Kopie)"""
+        return self._buffer[:self._size]
+
+    def _reserve(self, n):
+        # Puffer bei Bedarf verdoppeln, damit append amortisiert O(1) bleibt
+        if self._size + n > len(self._buffer):
+            new_capacity = max(len(self._buffer) * 2, self._size + n)
+            new_buffer = np.empty(new_capacity, dtype=float)
+            new_buffer[:self._size] = self._buffer[:self._size]
+            self._buffer = new_buffer
+
+    def extend(self, prices):
+        """
+        Hängt mehrere Preise an, ohne Signale zu berechnen (z.B. für die Aufwärmphase).
+
+        Args:
+            prices (array-like): Neue Preisdaten
+        """
+        prices = np.asarray(prices, dtype=float)
+        self._reserve(len(prices))
+        self._buffer[self._size:self._size + len(prices)] = prices
+        self._size += len(prices)
+
+    def append(self, price):
+        """
+        Hängt einen neuen Preis an und aktualisiert die aktuelle Welle und Vorhersage.
+
+        Args:
+            price (float): Neuer Preis
+
+        Returns:
+            dict: Vorhersage für die nächste Bewegung
+        """
+        self._reserve(1)
+        self._buffer[self._size] = price
+        self._size += 1
+
+        self.current_wave = detect_current_wave(self.prices, self.look_back, self.zigzag_threshold)
+        self.prediction = predict_from_wave(self.current_wave)
+        return self.prediction
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from .analyzer import ElliottWaveAnalyzer
+
+# Zustand der Worker-Prozesse: die aus dem Shared Memory rekonstruierte Preisreihe
+_worker_state = {}
+
+def _init_worker(shm_name, length, has_dates, tz, price_col):
+    """
+    Initialisiert einen Worker-Prozess, indem er die Preisreihe aus dem Shared Memory liest.
+
+    Args:
+        shm_name (str): Name des Shared-Memory-Blocks
+        length (int): Anzahl der Datenpunkte
+        has_dates (bool): True, wenn der Block zusätzlich Zeitstempel (ns) enthält
+        tz (str): Zeitzone des ursprünglichen Index oder None
+        price_col (str): Name der Preisspalte
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    prices = np.ndarray((length,), dtype=np.float64, buffer=shm.buf)
+
+    if has_dates:
+        dates = np.ndarray((length,), dtype=np.int64, buffer=shm.buf, offset=length * 8)
+        index = pd.DatetimeIndex(dates.view('datetime64[ns]'))
+        if tz is not None:
+            index = index.tz_localize('UTC').tz_convert(tz)
+    else:
+        index = pd.RangeIndex(length)
+
+    _worker_state['shm'] = shm
+    _worker_state['data'] = pd.DataFrame({price_col: prices}, index=index, copy=False)
+    _worker_state['price_col'] = price_col
+
+def _run_grid_point(params, start_date, end_date, invest_amount):
+    """
+    Führt den Backtest für einen Gitterpunkt im Worker-Prozess aus.
+
+    Returns:
+        dict: Parameter und Kennzahlen des Backtests
+    """
+    zigzag_threshold, look_back, stop_loss = params
+    analyzer = ElliottWaveAnalyzer(_worker_state['data'], _worker_state['price_col'])
+    results = analyzer.backtest(
+        start_date=start_date,
+        end_date=end_date,
+        invest_amount=invest_amount,
+        zigzag_threshold=zigzag_threshold,
+        look_back=look_back,
+        stop_loss=stop_loss
+    )
+
+    return {
+        'zigzag_threshold': zigzag_threshold,
+        'look_back': look_back,
+        'stop_loss': stop_loss,
+        'total_return': results['total_return'],
+        'max_drawdown': results['max_drawdown'],
+        'win_rate': results['win_rate'],
+        'num_trades': results['num_trades'],
+        'final_equity': results['final_equity']
+    }
+
+def run_parameter_sweep(data, thresholds, look_backs, stop_losses, start_date=None, end_date=None,
+                        invest_amount=10000, price_col='Close', workers=None):
+    """
+    Führt Backtests für alle Kombinationen der Parameter parallel auf allen Kernen durch.
+
+    Die Preisreihe wird einmal in einen Shared-Memory-Block geschrieben, den alle Worker
+    lesen, statt sie pro Aufgabe zu picklen.
+
+    Args:
+        data (pandas.DataFrame): DataFrame mit Preisdaten
+        thresholds (list): ZigZag-Schwellenwerte
+        look_backs (list): Look-Back-Fenster für die Wellenerkennung
+        stop_losses (list): Stop-Loss-Anteile (None für keinen Stop-Loss)
+        start_date (str): Startdatum für den Backtest
+        end_date (str): Enddatum für den Backtest
+        invest_amount (float): Anfänglicher Investitionsbetrag
+        price_col (str): Name der Spalte mit den Preisdaten
+        workers (int): Anzahl der Prozesse (Standard: alle Kerne)
+
+    Returns:
+        list: Ergebnisse je Gitterpunkt, absteigend nach Gesamtrendite sortiert
+    """
+    prices = np.ascontiguousarray(np.asarray(data[price_col], dtype=np.float64).reshape(-1))
+    length = len(prices)
+    has_dates = isinstance(data.index, pd.DatetimeIndex)
+    tz = str(data.index.tz) if has_dates and data.index.tz is not None else None
+
+    grid = list(itertools.product(thresholds, look_backs, stop_losses))
+
+    shm = shared_memory.SharedMemory(create=True, size=max(length * 8 * (2 if has_dates else 1), 1))
+    try:
+        np.ndarray((length,), dtype=np.float64, buffer=shm.buf)[:] = prices
+        if has_dates:
+            dates = data.index.tz_convert('UTC') if tz is not None else data.index
+            np.ndarray((length,), dtype=np.int64, buffer=shm.buf, offset=length * 8)[:] = dates.as_unit('ns').asi8
+
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(workers, len(grid)) or 1,
+                                 initializer=_init_worker,
+                                 initargs=(shm.name, length, has_dates, tz, price_col)) as executor:
+            futures = [
+                executor.submit(_run_grid_point, params, start_date, end_date, invest_amount)
+                for params in grid
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    # Rangfolge: höchste Rendite zuerst, bei Gleichstand geringerer Drawdown
+    results.sort(key=lambda r: (-r['total_return'], r['max_drawdown']))
+    return results
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+# Getrennte Zufallsströme, damit eine längere Reihe mit denselben Werten beginnt wie eine kürzere
+_REGIME_STREAM, _NOISE_STREAM, _SPREAD_STREAM, _VOLUME_STREAM = range(4)
+
+def _stream(seed, stream):
+    """Liefert den Zufallsgenerator eines Stroms für einen Startwert."""
+    return np.random.default_rng([stream, seed])
+
+def generate_prices(n_bars, model='gbm', start_price=100.0, drift=0.0002, volatility=0.015,
+                    regime_length=250, seed=0):
+    """
+    Erzeugt eine synthetische Schlusskursreihe.
+
+    Args:
+        n_bars (int): Anzahl der Datenpunkte
+        model (str): "gbm" (geometrische Brownsche Bewegung mit Regimewechseln) oder "random_walk"
+        start_price (float): Startpreis
+        drift (float): Mittlere Rendite pro Bar
+        volatility (float): Standardabweichung der Rendite pro Bar
+        regime_length (int): Mittlere Länge eines Regimes (nur für "gbm")
+        seed (int): Startwert des Zufallsgenerators für reproduzierbare Reihen
+
+    Returns:
+        numpy.ndarray: Array mit Preisdaten; für denselben seed sind die ersten Werte
+                       unabhängig von n_bars
+    """
+    noise = _stream(seed, _NOISE_STREAM)
+
+    if model == 'random_walk':
+        steps = noise.normal(0, volatility * start_price, n_bars)
+        steps[0] = 0
+        # Preise dürfen nicht negativ werden, der ZigZag-Filter arbeitet mit relativen Schwellen
+        return np.maximum(start_price + np.cumsum(steps), start_price * 0.01)
+
+    if model != 'gbm':
+        raise ValueError(f"Unbekanntes Modell: {model}")
+
+    # Regimewechsel: Drift und Volatilität wechseln nach zufälligen Abständen
+    regimes = _stream(seed, _REGIME_STREAM)
+    drifts = np.empty(n_bars)
+    vols = np.empty(n_bars)
+    i = 0
+    while i < n_bars:
+        length = max(1, int(regimes.exponential(regime_length)))
+        drifts[i:i + length] = drift * regimes.choice([-3.0, -1.0, 1.0, 3.0])
+        vols[i:i + length] = volatility * regimes.uniform(0.5, 2.0)
+        i += length
+
+    log_returns = (drifts - 0.5 * vols ** 2) + vols * noise.standard_normal(n_bars)
+    log_returns[0] = 0
+    return start_price * np.exp(np.cumsum(log_returns))
+
+def generate_ohlcv(n_bars, model='gbm', freq=None, start='2000-01-03', seed=0, **kwargs):
+    """
+    Erzeugt einen synthetischen OHLCV-DataFrame im Format des DataLoader.
+
+    Args:
+        n_bars (int): Anzahl der Datenpunkte
+        model (str): "gbm" oder "random_walk" (siehe generate_prices)
+        freq (str): Pandas-Frequenz des Index (Standard: Handelstage bis 50.000 Bars, sonst Minuten)
+        start (str): Startdatum des Index
+        seed (int): Startwert des Zufallsgenerators
+        **kwargs: Weitere Parameter für generate_prices
+
+    Returns:
+        pandas.DataFrame: DataFrame mit Open, High, Low, Close und Volume; für denselben seed
+                          sind die ersten Bars unabhängig von n_bars
+    """
+    close = generate_prices(n_bars, model=model, seed=seed, **kwargs)
+
+    open_ = np.empty(n_bars)
+    open_[0] = close[0]
+    open_[1:] = close[:-1]
+
+    # Hoch und Tief liegen um einen zufälligen Anteil außerhalb von Eröffnung und Schluss
+    spread = np.abs(_stream(seed, _SPREAD_STREAM).normal(0, 0.005, (n_bars, 2)))
+    high = np.maximum(open_, close) * (1 + spread[:, 0])
+    low = np.minimum(open_, close) * (1 - spread[:, 1])
+    volume = _stream(seed, _VOLUME_STREAM).lognormal(13, 0.5, n_bars).round()
+
+    if freq is None:
+        freq = 'B' if n_bars <= 50000 else 'min'
+    index = pd.date_range(start=start, periods=n_bars, freq=freq, name='Date')
+
+    return pd.DataFrame({
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Volume': volume
+    }, index=index)
@@ -1,27 +1,75 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import hashlib
+import threading
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
-from scipy.signal import find_peaks, argrelextrema
-import matplotlib.pyplot as plt
+from .profiling import profiled
 
-def find_local_extrema(prices, window=5):
+def _strict_window_maxima(values, window):
+    """
+    Liefert die Indizes, deren Wert echt größer ist als alle Nachbarn im Abstand bis window.
+    
+    Die Fenstermaxima links und rechts jedes Punktes werden mit gleitenden Maxima
+    (pandas rolling, intern eine monotone Deque) in O(n) unabhängig von window berechnet.
+    
+    Args:
+        values (numpy.ndarray): Array mit Preisdaten
+        window (int): Anzahl der Nachbarn auf jeder Seite
+        
+    Returns:
+        numpy.ndarray: Indizes der lokalen Maxima
+    """
+    n = len(values)
+    if n < 3:
+        return np.array([], dtype=np.intp)
+    
+    # Maximum der letzten window Werte bis einschließlich Index k, am Rand gekürzt
+    trailing = pd.Series(values).rolling(window, min_periods=1).max().to_numpy()
+    leading = pd.Series(values[::-1]).rolling(window, min_periods=1).max().to_numpy()[::-1]
+    
+    # Randpunkte haben nur auf einer Seite Nachbarn und zählen wie bei argrelextrema nicht als Extremum
+    inner = values[1:-1]
+    is_max = (inner > trailing[:-2]) & (inner > leading[2:])
+    
+    # NaN im Fenster verhindert ein Extremum, da Vergleiche mit NaN immer falsch sind
+    nan_mask = np.isnan(values)
+    if nan_mask.any():
+        nan_count = pd.Series(nan_mask).rolling(2 * window + 1, center=True, min_periods=1).sum().to_numpy()
+        is_max &= nan_count[1:-1] == 0
+    
+    return np.flatnonzero(is_max) + 1
+
+@profiled('find_local_extrema')
+def find_local_extrema(prices, window=5, highs=None, lows=None):
     """
     Findet lokale Maxima und Minima in einer Preisreihe.
     
+    Ein Punkt ist ein Maximum (Minimum), wenn er echt größer (kleiner) ist als alle Punkte
+    im Abstand bis window. Das Ergebnis entspricht scipy.signal.argrelextrema(order=window).
+    
     Args:
         prices (array-like): Array mit Preisdaten
         window (int): Fenstergröße für die Extrema-Erkennung
+        highs (array-like, optional): Hochs für die Suche nach Maxima statt prices
+        lows (array-like, optional): Tiefs für die Suche nach Minima statt prices
         
     Returns:
         tuple: (maxima_indices, minima_indices) Arrays mit Indizes der Extrema
     """
-    prices = np.array(prices)
+    if window < 1:
+        raise ValueError("window muss mindestens 1 sein")
+    
+    prices = np.asarray(prices, dtype=float).reshape(-1)
+    highs = prices if highs is None else np.asarray(highs, dtype=float).reshape(-1)
+    lows = prices if lows is None else np.asarray(lows, dtype=float).reshape(-1)
+    
     # Lokale Maxima finden
-    maxima_indices = argrelextrema(prices, np.greater, order=window)[0]
-    # Lokale Minima finden
-    minima_indices = argrelextrema(prices, np.less, order=window)[0]
+    maxima_indices = _strict_window_maxima(highs, window)
+    # Lokale Minima finden (Maxima der negierten Reihe)
+    minima_indices = _strict_window_maxima(-lows, window)
     
     return maxima_indices, minima_indices
 
@@ -54,6 +102,7 @@ def calculate_fibonacci_levels(start_price, end_price):
     
     return levels
 
+@profiled('plot_waves')
 def plot_waves(df, waves, title="Elliott Wellen Analyse"):
     """
     Plottet die identifizierten Elliott-Wellen auf einem Preischart.
@@ -63,6 +112,8 @@ def plot_waves(df, waves, title="Elliott Wellen Analyse"):
         waves (dict): Dictionary mit Welleninfos (von ElliottWaveAnalyzer)
         title (str): Titel des Plots
     """
+    import matplotlib.pyplot as plt
+    
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # Preisdaten plotten
@@ -116,6 +167,8 @@ def plot_fibonacci_levels(df, start_idx, end_idx, title="Fibonacci Retracement")
         end_idx (int): Endindex für das Retracement
         title (str): Titel des Plots
     """
+    import matplotlib.pyplot as plt
+    
     start_price = df['Close'].iloc[start_idx]
     end_price = df['Close'].iloc[end_idx]
     
@@ -149,6 +202,218 @@ def plot_fibonacci_levels(df, start_idx, end_idx, title="Fibonacci Retracement")
     plt.tight_layout()
     return fig, ax
 
+class StreamingZigZag:
+    """
+    Zustandsbehafteter ZigZag-Filter, der neue Preise inkrementell verarbeitet.
+    
+    Hält den aktuellen Trend, den letzten Extremwert und die bestätigten Wendepunkte,
+    sodass bei neuen Bars nur diese verarbeitet werden müssen statt der gesamten Reihe.
+    """
+    
+    def __init__(self, threshold=0.05):
+        """
+        Initialisiert den Filter.
+        
+        Args:
+            threshold (float): Mindestprozentsatz für eine Trendumkehrung (0.05 = 5%)
+        """
+        self.threshold = threshold
+        self.up_trend = True
+        self.last_extreme = None
+        self.last_extreme_idx = None
+        self.turning_points = []
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def append(self, price):
+        """
+        Verarbeitet einen neuen Preis.
+        
+        Args:
+            price (float): Neuer Preis
+            
+        Returns:
+            int: Index des dadurch bestätigten Wendepunkts oder None
+        """
+        confirmed = self.extend([price])
+        return confirmed[0] if confirmed else None
+    
+    def extend(self, prices):
+        """
+        Verarbeitet mehrere neue Preise.
+        
+        Der Zustand wird für die Schleife in lokale Variablen übernommen, sodass pro Preis
+        nur Vergleiche anfallen und keine Methodenaufrufe oder Attributzugriffe.
+        
+        Args:
+            prices (array-like): Neue Preisdaten
+            
+        Returns:
+            list: Indizes der dadurch bestätigten Wendepunkte
+        """
+        values = prices if isinstance(prices, list) else np.asarray(prices).tolist()
+        if not values:
+            return []
+        
+        turning_points = self.turning_points
+        start = self._count
+        self._count += len(values)
+        
+        if start == 0:
+            # Start mit dem ersten Punkt
+            self.last_extreme = values[0]
+            self.last_extreme_idx = 0
+            turning_points.append(0)
+            values = values[1:]
+            start = 1
+        
+        confirmed_from = len(turning_points)
+        up_trend = self.up_trend
+        last_extreme = self.last_extreme
+        last_extreme_idx = self.last_extreme_idx
+        lower = 1 - self.threshold
+        upper = 1 + self.threshold
+        
+        for i, price in enumerate(values, start):
+            if up_trend:
+                # In einem Aufwärtstrend suchen wir nach höheren Hochs oder niedrigeren Tiefs
+                if price > last_extreme:
+                    # Neues Hoch gefunden
+                    last_extreme = price
+                    last_extreme_idx = i
+                elif price < last_extreme * lower:
+                    # Umkehr gefunden - füge den letzten Extremwert hinzu und wechsle zu Abwärtstrend
+                    turning_points.append(last_extreme_idx)
+                    up_trend = False
+                    last_extreme = price
+                    last_extreme_idx = i
+            else:
+                # In einem Abwärtstrend suchen wir nach niedrigeren Tiefs oder höheren Hochs
+                if price < last_extreme:
+                    # Neues Tief gefunden
+                    last_extreme = price
+                    last_extreme_idx = i
+                elif price > last_extreme * upper:
+                    # Umkehr gefunden - füge den letzten Extremwert hinzu und wechsle zu Aufwärtstrend
+                    turning_points.append(last_extreme_idx)
+                    up_trend = True
+                    last_extreme = price
+                    last_extreme_idx = i
+        
+        self.up_trend = up_trend
+        self.last_extreme = last_extreme
+        self.last_extreme_idx = last_extreme_idx
+        return turning_points[confirmed_from:]
+    
+    def copy(self):
+        """
+        Erstellt eine unabhängige Kopie des Zustands, z.B. um einen noch nicht
+        abgeschlossenen Bar probeweise anzuhängen.
+        
+        Returns:
+            StreamingZigZag: Kopie des Filters
+        """
+        clone = StreamingZigZag(self.threshold)
+        clone.up_trend = self.up_trend
+        clone.last_extreme = self.last_extreme
+        clone.last_extreme_idx = self.last_extreme_idx
+        clone.turning_points = list(self.turning_points)
+        clone._count = self._count
+        return clone
+    
+    @property
+    def confirmed_pivots(self):
+        """list: Bestätigte Wendepunkte (ändern sich durch neue Bars nicht mehr)"""
+        return list(self.turning_points)
+    
+    @property
+    def provisional_pivot(self):
+        """int: Aktueller Extremwert, der noch nicht als Wendepunkt bestätigt ist, oder None"""
+        if self.last_extreme_idx is None or self.last_extreme_idx == self.turning_points[-1]:
+            return None
+        return self.last_extreme_idx
+    
+    @property
+    def pivots(self):
+        """list: Bestätigte Wendepunkte plus vorläufiger Endpunkt (wie zigzag_filter)"""
+        pivots = self.confirmed_pivots
+        if self.provisional_pivot is not None:
+            pivots.append(self.provisional_pivot)
+        return pivots
+
+@profiled('reduce_to_pivots')
+def reduce_to_pivots(chunks, threshold=0.03, price_col='Close', tail_bars=60):
+    """
+    Reduziert eine blockweise gelesene Kursreihe auf ihre ZigZag-Wendepunkte und die letzten Bars.
+    
+    Die Blöcke werden nacheinander in einen StreamingZigZag eingespeist, ohne die gesamte
+    Reihe im Speicher zu halten. Das Ergebnis enthält die Zeilen der Wendepunkte, den noch
+    nicht bestätigten Extremwert und die letzten tail_bars Bars. Ein ZigZag-Filter mit
+    demselben Schwellenwert liefert darauf dieselben Wendepunkte wie auf der vollen Reihe,
+    und die Erkennung der aktuellen Welle sieht (für look_back <= tail_bars) dieselben Bars.
+    
+    Args:
+        chunks (iterable): DataFrames mit aufeinanderfolgenden Abschnitten der Kursreihe
+        threshold (float): Mindestprozentsatz für eine Trendumkehrung (0.03 = 3%)
+        price_col (str): Name der Spalte mit den Preisdaten
+        tail_bars (int): Anzahl der letzten Bars, die vollständig erhalten bleiben
+        
+    Returns:
+        pandas.DataFrame: Reduzierte Kursreihe mit der zusätzlichen Spalte 'Bar' (Position in der vollen Reihe)
+    """
+    zigzag = StreamingZigZag(threshold)
+    kept = []
+    tail = None
+    extreme_row = None  # Zeile des aktuellen Extremwerts, falls er in einem früheren Block liegt
+    offset = 0
+    
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        prices = np.asarray(chunk[price_col], dtype=float)
+        positions = []
+        
+        if offset == 0:
+            # Der erste Punkt ist immer ein Wendepunkt
+            positions.append(0)
+        
+        for idx in zigzag.extend(prices):
+            if idx >= offset:
+                positions.append(idx - offset)
+            else:
+                # Bestätigt wurde der Extremwert am Ende des vorherigen Blocks
+                kept.append(extreme_row)
+        
+        if positions:
+            kept.append(chunk.iloc[positions].assign(Bar=np.asarray(positions) + offset))
+        
+        if zigzag.last_extreme_idx >= offset:
+            extreme_row = chunk.iloc[[zigzag.last_extreme_idx - offset]].assign(Bar=zigzag.last_extreme_idx)
+        
+        chunk_tail = chunk.iloc[-tail_bars:].assign(Bar=np.arange(offset + len(chunk) - min(tail_bars, len(chunk)),
+                                                                  offset + len(chunk)))
+        if tail is None or len(chunk) >= tail_bars:
+            tail = chunk_tail
+        else:
+            tail = pd.concat([tail, chunk_tail]).iloc[-tail_bars:]
+        
+        offset += len(chunk)
+    
+    if tail is None:
+        return pd.DataFrame()
+    
+    # Der vorläufige Endpunkt gehört wie bei zigzag_filter zu den Wendepunkten
+    if zigzag.provisional_pivot is not None:
+        kept.append(extreme_row)
+    kept.append(tail)
+    
+    reduced = pd.concat(kept)
+    reduced = reduced[~reduced['Bar'].duplicated(keep='first')].sort_values('Bar', kind='stable')
+    return reduced
+
+@profiled('zigzag_filter')
 def zigzag_filter(prices, threshold=0.05):
     """
     Implementiert einen ZigZag-Filter, um Trendumkehrungen zu identifizieren.
@@ -161,39 +426,118 @@ def zigzag_filter(prices, threshold=0.05):
         list: Liste mit Indizes der Wendepunkte
     """
     prices = np.array(prices)
-    up_trend = True
-    last_extreme = prices[0]
-    last_extreme_idx = 0
-    turning_points = [0]  # Start mit dem ersten Punkt
-    
-    for i in range(1, len(prices)):
-        if up_trend:
-            # In einem Aufwärtstrend suchen wir nach höheren Hochs oder niedrigeren Tiefs
-            if prices[i] > last_extreme:
-                # Neues Hoch gefunden
-                last_extreme = prices[i]
-                last_extreme_idx = i
-            elif prices[i] < last_extreme * (1 - threshold):
-                # Umkehr gefunden - füge den letzten Extremwert hinzu und wechsle zu Abwärtstrend
-                turning_points.append(last_extreme_idx)
-                up_trend = False
-                last_extreme = prices[i]
-                last_extreme_idx = i
-        else:
-            # In einem Abwärtstrend suchen wir nach niedrigeren Tiefs oder höheren Hochs
-            if prices[i] < last_extreme:
-                # Neues Tief gefunden
-                last_extreme = prices[i]
-                last_extreme_idx = i
-            elif prices[i] > last_extreme * (1 + threshold):
-                # Umkehr gefunden - füge den letzten Extremwert hinzu und wechsle zu Aufwärtstrend
-                turning_points.append(last_extreme_idx)
-                up_trend = True
-                last_extreme = prices[i]
-                last_extreme_idx = i
-    
-    # Füge den letzten Punkt hinzu, wenn er noch nicht in der Liste ist
-    if last_extreme_idx != turning_points[-1]:
-        turning_points.append(last_extreme_idx)
-    
-    return turning_points 
\ No newline at end of file
+    if len(prices) == 0:
+        raise IndexError("zigzag_filter benötigt mindestens einen Preis")
+    
+    zigzag = StreamingZigZag(threshold)
+    zigzag.extend(prices)
+    return zigzag.pivots
+
+# Cache für zigzag_ladder: Hash der Preisreihe -> {threshold: Wendepunkte}
+_ZIGZAG_LADDER_CACHE = OrderedDict()
+_ZIGZAG_LADDER_CACHE_SIZE = 32
+# zigzag_ladder wird z.B. vom Dashboard-Thread und vom Tk-Thread gleichzeitig aufgerufen
+_ZIGZAG_LADDER_LOCK = threading.Lock()
+
+@profiled('zigzag_ladder')
+def zigzag_ladder(prices, thresholds):
+    """
+    Berechnet die ZigZag-Wendepunkte für mehrere Schwellenwerte.
+    
+    Die Ergebnisse werden pro Preisreihe zwischengespeichert, sodass ein erneuter Aufruf
+    mit bereits berechneten Schwellenwerten nur noch ein Nachschlagen ist.
+    
+    Args:
+        prices (array-like): Array mit Preisdaten
+        thresholds (iterable): Schwellenwerte (z.B. [0.01, 0.02, 0.03, 0.05, 0.1])
+        
+    Returns:
+        dict: Dictionary {threshold: Liste mit Indizes der Wendepunkte}
+    """
+    prices = np.ascontiguousarray(prices, dtype=float)
+    if len(prices) == 0:
+        raise IndexError("zigzag_ladder benötigt mindestens einen Preis")
+    
+    key = hashlib.sha1(prices.tobytes()).hexdigest()
+    with _ZIGZAG_LADDER_LOCK:
+        entry = _ZIGZAG_LADDER_CACHE.setdefault(key, {})
+        _ZIGZAG_LADDER_CACHE.move_to_end(key)
+        while len(_ZIGZAG_LADDER_CACHE) > _ZIGZAG_LADDER_CACHE_SIZE:
+            _ZIGZAG_LADDER_CACHE.popitem(last=False)
+        cached = dict(entry)
+    
+    missing = [t for t in dict.fromkeys(thresholds) if t not in cached]
+    if missing:
+        # Die Preise werden einmal in Python-Zahlen umgewandelt, jeder Filter läuft als enge Schleife
+        values = prices.tolist()
+        for threshold in missing:
+            zigzag = StreamingZigZag(threshold)
+            zigzag.extend(values)
+            cached[threshold] = zigzag.pivots
+        with _ZIGZAG_LADDER_LOCK:
+            entry.update((t, cached[t]) for t in missing)
+    
+    return {t: list(cached[t]) for t in thresholds}
+
+class IncrementalZigZagLadder:
+    """
+    Schreibt die ZigZag-Filter mehrerer Schwellenwerte über eine wiederholt abgerufene Kursreihe fort.
+    
+    Bei einer Aktualisierung (z.B. im Dashboard) werden nur die seit dem letzten Aufruf neuen
+    Bars verarbeitet, solange die bereits verarbeiteten Preise unverändert am Anfang der neuen
+    Reihe stehen; andernfalls wird neu begonnen. Der letzte Bar ändert sich bis zum Handelsschluss
+    und wird nur probeweise an eine Kopie der Filter angehängt. Die Ergebnisse werden in den
+    Cache von zigzag_ladder übernommen, sodass ElliottWaveAnalyzer.analyze sie nur nachschlägt.
+    """
+    
+    def __init__(self, thresholds):
+        """
+        Args:
+            thresholds (iterable): Schwellenwerte (z.B. [0.01, 0.02, 0.03, 0.05, 0.1])
+        """
+        self.thresholds = list(dict.fromkeys(thresholds))
+        self._zigzags = None
+        self._closed = np.empty(0)
+    
+    def update(self, prices):
+        """
+        Verarbeitet die aktuelle Kursreihe.
+        
+        Args:
+            prices (array-like): Vollständige Kursreihe einschließlich des laufenden Bars
+            
+        Returns:
+            dict: Dictionary {threshold: Liste mit Indizes der Wendepunkte} wie bei zigzag_ladder
+        """
+        prices = np.ascontiguousarray(prices, dtype=float)
+        if len(prices) == 0:
+            raise IndexError("IncrementalZigZagLadder benötigt mindestens einen Preis")
+        
+        closed = prices[:-1]
+        done = len(self._closed)
+        if (self._zigzags is None or len(closed) < done or
+                not np.array_equal(closed[:done], self._closed, equal_nan=True)):
+            self._zigzags = [StreamingZigZag(t) for t in self.thresholds]
+            done = 0
+        
+        new = closed[done:].tolist()
+        if new:
+            for zigzag in self._zigzags:
+                zigzag.extend(new)
+        self._closed = closed.copy()
+        
+        last = prices[-1:].tolist()
+        pivots = {}
+        for zigzag in self._zigzags:
+            provisional = zigzag.copy()
+            provisional.extend(last)
+            pivots[zigzag.threshold] = provisional.pivots
+        
+        key = hashlib.sha1(prices.tobytes()).hexdigest()
+        with _ZIGZAG_LADDER_LOCK:
+            _ZIGZAG_LADDER_CACHE.setdefault(key, {}).update(pivots)
+            _ZIGZAG_LADDER_CACHE.move_to_end(key)
+            while len(_ZIGZAG_LADDER_CACHE) > _ZIGZAG_LADDER_CACHE_SIZE:
+                _ZIGZAG_LADDER_CACHE.popitem(last=False)
+        
+        return {t: list(pivots[t]) for t in self.thresholds}
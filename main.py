@@ -6,18 +6,21 @@ import sys
 import argparse
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from datetime import datetime
-from tabulate import tabulate
+from datetime import datetime, timedelta
 import threading
-import time
-import tkinter as tk
-from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
+import queue
 
 from data_loader import DataLoader
 from elliott_wave import ElliottWaveAnalyzer
+from elliott_wave.utils import IncrementalZigZagLadder
+from elliott_wave import profiling
+from elliott_wave import result_cache
+
+# Auswählbare ZigZag-Schwellenwerte im Dashboard
+ZIGZAG_THRESHOLDS = (0.01, 0.02, 0.03, 0.05, 0.1)
+
+# Maximale Anzahl der Vorschläge im Suchfeld des Dashboards
+AUTOCOMPLETE_LIMIT = 100
 
 def parse_args():
     """
@@ -28,11 +31,11 @@ def parse_args():
     """
     parser = argparse.ArgumentParser(description='Elliott Wave Analyzer - Ein Tool zur Analyse von Aktien mit der Elliott-Wellen-Theorie')
     
-    parser.add_argument('--data', type=str, required=True,
-                        help='Dateipfad oder Ticker-Symbol für die zu analysierenden Daten')
+    parser.add_argument('--data', type=str, default=None,
+                        help='Dateipfad oder Ticker-Symbol für die zu analysierenden Daten (im Serve-Modus optionales Standardsymbol)')
     
-    parser.add_argument('--mode', type=str, choices=['analyse', 'backtest', 'live', 'dashboard'], default='analyse',
-                        help='Betriebsmodus: "analyse" für Elliott-Wellen-Analyse, "backtest" für Backtesting, "live" für Live-Analyse, "dashboard" für interaktives Dashboard')
+    parser.add_argument('--mode', type=str, choices=['analyse', 'backtest', 'live', 'dashboard', 'sweep', 'scan', 'portfolio', 'serve'], default='analyse',
+                        help='Betriebsmodus: "analyse" für Elliott-Wellen-Analyse, "backtest" für Backtesting, "live" für Live-Analyse, "dashboard" für interaktives Dashboard, "sweep" für Parameter-Sweeps von Backtests, "scan" für das Durchsuchen vieler Symbole, "portfolio" für einen Backtest über viele Symbole mit gemeinsamem Kapital, "serve" für einen lokalen HTTP-Analysedienst')
     
     parser.add_argument('--start', type=str, default=None,
                         help='Startdatum im Format YYYY-MM-DD')
@@ -46,9 +49,21 @@ def parse_args():
     parser.add_argument('--window', type=int, default=10,
                         help='Fenstergröße für die Extrema-Erkennung (Standard: 10)')
     
+    parser.add_argument('--high-low', action='store_true',
+                        help='Sucht lokale Extrema in den Hochs und Tiefs statt in den Schlusskursen')
+    
     parser.add_argument('--save', type=str, default=None,
                         help='Speichert die Analysegrafik in der angegebenen Datei')
     
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='Liest CSV-Dateien blockweise mit dieser Zeilenzahl und nur den OHLCV-Spalten; im Analyse-Modus bleiben nur Wendepunkte und die letzten Bars (für sehr große Dateien)')
+    
+    parser.add_argument('--float32', action='store_true',
+                        help='Liest Preisspalten beim blockweisen Lesen als float32')
+    
+    parser.add_argument('--no-plot', action='store_true',
+                        help='Überspringt die Visualisierung, z.B. für Exporte ohne Anzeige')
+    
     parser.add_argument('--invest', type=float, default=10000,
                         help='Anfänglicher Investitionsbetrag für Backtests (Standard: 10000)')
     
@@ -59,12 +74,58 @@ def parse_args():
                         help='Anzahl der Tage für die Live-Analyse (Standard: 90)')
     
     parser.add_argument('--risk', type=float, default=0.02,
-                        help='Risikotoleranz für Handelsempfehlungen (Standard: 0.02 = 2%)')
+                        help='Risikotoleranz für Handelsempfehlungen (Standard: 0.02 = 2%%)')
     
     parser.add_argument('--refresh', type=int, default=60,
-                        help='Aktualisierungsintervall in Sekunden für das Dashboard (Standard: 60)')
+                        help='Aktualisierungsintervall in Sekunden für das Dashboard bzw. Gültigkeit der Kursdaten im Serve-Modus (Standard: 60)')
+    
+    parser.add_argument('--sweep-thresholds', type=str, default='0.01,0.02,0.03,0.05,0.1',
+                        help='Kommagetrennte ZigZag-Schwellenwerte für den Sweep-Modus')
+    
+    parser.add_argument('--sweep-windows', type=str, default='20,30,60',
+                        help='Kommagetrennte Look-Back-Fenster der Wellenerkennung für den Sweep-Modus')
+    
+    parser.add_argument('--sweep-risks', type=str, default='0,0.02,0.05,0.1',
+                        help='Kommagetrennte Stop-Loss-Risiken für den Sweep-Modus (0 = kein Stop-Loss)')
+    
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Anzahl der Prozesse für den Sweep-, Scan- und Portfolio-Modus (Standard: alle Kerne)')
+    
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Maximale Anzahl gleichzeitiger Downloads im Scan- und Portfolio-Modus (Standard: 8)')
+    
+    parser.add_argument('--universe', type=str, default=None,
+                        help='Symbolliste (CSV mit Spalte Symbol und optional Market, oder ein Symbol pro Zeile) für Symbolauflösung, Autovervollständigung und --data ALL im Scan-Modus')
+    
+    parser.add_argument('--provider', type=str, default=None,
+                        help='Datenquelle für Symbole: "yahoo", "file:VERZEICHNIS" oder "replay[:VERZEICHNIS][?latency=0.1&jitter=0.05&seed=0]" (Standard: EW_PROVIDER bzw. yahoo)')
+    
+    parser.add_argument('--rate-limit', type=float, default=None,
+                        help='Maximale Anfragen pro Sekunde an Yahoo Finance (Standard: EW_YAHOO_RATE bzw. 4, 0 = unbegrenzt)')
+    
+    parser.add_argument('--max-positions', type=int, default=10,
+                        help='Maximale Anzahl gleichzeitig gehaltener Symbole im Portfolio-Modus (Standard: 10)')
+    
+    parser.add_argument('--host', type=str, default='127.0.0.1',
+                        help='Adresse des HTTP-Dienstes im Serve-Modus (Standard: 127.0.0.1)')
     
-    return parser.parse_args()
+    parser.add_argument('--port', type=int, default=8765,
+                        help='Port des HTTP-Dienstes im Serve-Modus (Standard: 8765)')
+    
+    parser.add_argument('--profile', action='store_true',
+                        help='Misst die Laufzeit der Verarbeitungsstufen und gibt eine Übersicht aus')
+    
+    parser.add_argument('--profile-json', type=str, default=None,
+                        help='Speichert die Laufzeitmessung zusätzlich als JSON in der angegebenen Datei')
+    
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Berechnet Analyse- und Backtest-Ergebnisse neu, statt sie aus dem Ergebnis-Cache zu lesen')
+    
+    args = parser.parse_args()
+    if args.data is None and args.mode != 'serve':
+        parser.error('--data ist erforderlich')
+    
+    return args
 
 def ensure_native_type(value):
     """
@@ -80,6 +141,7 @@ def ensure_native_type(value):
         return value.item()
     return value
 
+@profiling.profiled('get_trade_recommendations')
 def get_trade_recommendations(current_wave, prediction, current_price, risk_tolerance=0.02):
     """
     Generiert Handelsempfehlungen basierend auf der aktuellen Wellenanalyse und Vorhersage.
@@ -270,7 +332,17 @@ def run_analysis(args):
     # Lade die Daten
     try:
         print(f"Lade Daten für {args.data}...")
-        data = DataLoader.load_data(args.data, args.start, args.end)
+        if args.chunksize and os.path.isfile(args.data) and args.data.endswith('.csv'):
+            # Große Dateien werden blockweise gelesen und direkt auf die Wendepunkte reduziert
+            from elliott_wave.utils import reduce_to_pivots
+            
+            chunks = DataLoader.iter_csv_chunks(args.data, chunksize=args.chunksize, float32=args.float32)
+            data = reduce_to_pivots(chunks, threshold=args.threshold)
+            if not data.empty:
+                print(f"Datei gestreamt: {int(data['Bar'].iloc[-1]) + 1} Datenpunkte, "
+                      f"reduziert auf {len(data)} Wendepunkte und letzte Bars")
+        else:
+            data = DataLoader.load_data(args.data, args.start, args.end, chunksize=args.chunksize)
         
         if data.empty:
             print(f"Fehler: Keine Daten für {args.data} gefunden.")
@@ -286,7 +358,7 @@ def run_analysis(args):
     
     # Führe die Analyse durch
     print("Analysiere Elliott-Wellen-Muster...")
-    waves = analyzer.analyze(zigzag_threshold=args.threshold, window_size=args.window)
+    waves = analyzer.analyze(zigzag_threshold=args.threshold, window_size=args.window, use_high_low=args.high_low)
     
     # Zeige die Ergebnisse an
     print("\nGefundene Elliott-Wellen-Muster:")
@@ -316,6 +388,7 @@ def run_analysis(args):
             
             # Zeige die Tabelle an
             headers = ["#", "Start-Datum", "End-Datum", "Start-Preis", "End-Preis", "Änderung"]
+            from tabulate import tabulate
             print(tabulate(table_data, headers=headers, tablefmt="grid"))
     
     if pattern_count == 0:
@@ -373,8 +446,12 @@ def run_analysis(args):
         for i, rr in enumerate(recommendations['risk_reward']):
             print(f"  Risk/Reward (Ziel {i+1}): {rr:.2f}")
     
+    if args.no_plot:
+        return
+    
     # Visualisierung
     print("\nErstelle Visualisierung...")
+    import matplotlib.pyplot as plt
     from elliott_wave.utils import plot_waves
     fig, _ = plot_waves(data, waves, title=f"Elliott-Wellen-Analyse: {args.data}")
     
@@ -398,7 +475,7 @@ def run_backtest(args):
     # Lade die Daten
     try:
         print(f"Lade Daten für {args.data}...")
-        data = DataLoader.load_data(args.data, args.start, args.end)
+        data = DataLoader.load_data(args.data, args.start, args.end, chunksize=args.chunksize)
         
         if data.empty:
             print(f"Fehler: Keine Daten für {args.data} gefunden.")
@@ -431,33 +508,35 @@ def run_backtest(args):
     print(f"  Ø Trade-Rendite: {backtest_results['avg_trade_return']:.2f}%")
     
     # Detaillierte Trade-Informationen
-    if backtest_results['trades']:
+    if not backtest_results['trades'].empty:
         print("\nTrade-Historie:")
         trade_data = []
         
-        for trade in backtest_results['trades']:
+        for trade in backtest_results['trades'].itertuples(index=False):
             trade_data.append([
-                trade['date'].strftime('%Y-%m-%d'),
-                trade['action'].capitalize(),
-                f"{trade['price']:.2f}€",
-                f"{trade['shares']:.4f}",
-                f"{trade['value']:.2f}€"
+                trade.date.strftime('%Y-%m-%d'),
+                trade.action.capitalize(),
+                f"{trade.price:.2f}€",
+                f"{trade.shares:.4f}",
+                f"{trade.value:.2f}€"
             ])
         
         headers = ["Datum", "Aktion", "Preis", "Anteile", "Wert"]
+        from tabulate import tabulate
         print(tabulate(trade_data, headers=headers, tablefmt="grid"))
     
     # Visualisierung
-    print("\nErstelle Backtest-Visualisierung...")
-    fig = analyzer.plot_backtest_results(backtest_results)
-    
-    # Speichere die Grafik, falls gewünscht
-    if args.save:
-        try:
-            fig.savefig(args.save)
-            print(f"Grafik wurde in {args.save} gespeichert.")
-        except Exception as e:
-            print(f"Fehler beim Speichern der Grafik: {str(e)}")
+    if not args.no_plot:
+        print("\nErstelle Backtest-Visualisierung...")
+        fig = analyzer.plot_backtest_results(backtest_results)
+        
+        # Speichere die Grafik, falls gewünscht
+        if args.save:
+            try:
+                fig.savefig(args.save)
+                print(f"Grafik wurde in {args.save} gespeichert.")
+            except Exception as e:
+                print(f"Fehler beim Speichern der Grafik: {str(e)}")
     
     # Exportiere die Ergebnisse im gewünschten Format
     if args.output != 'table':
@@ -475,13 +554,13 @@ def run_backtest(args):
             'trades': []
         }
         
-        for trade in backtest_results['trades']:
+        for trade in backtest_results['trades'].itertuples(index=False):
             output_data['trades'].append({
-                'date': trade['date'].strftime('%Y-%m-%d'),
-                'action': trade['action'],
-                'price': trade['price'],
-                'shares': trade['shares'],
-                'value': trade['value']
+                'date': trade.date.strftime('%Y-%m-%d'),
+                'action': trade.action,
+                'price': float(trade.price),
+                'shares': float(trade.shares),
+                'value': float(trade.value)
             })
         
         # Erstelle einen Dateinamen basierend auf dem Symbol und Datum
@@ -519,7 +598,315 @@ def run_backtest(args):
             
             print(f"Ergebnisse wurden exportiert als {output_file}")
     
-    plt.show()
+    if not args.no_plot:
+        import matplotlib.pyplot as plt
+        plt.show()
+
+def run_sweep(args):
+    """
+    Führt Backtests für ein Gitter aus ZigZag-Schwellenwerten, Look-Back-Fenstern und
+    Stop-Loss-Risiken parallel durch und zeigt eine Rangliste der Ergebnisse.
+    
+    Args:
+        args (argparse.Namespace): Kommandozeilenargumente
+    """
+    # Lade die Daten einmalig für alle Gitterpunkte
+    try:
+        print(f"Lade Daten für {args.data}...")
+        data = DataLoader.load_data(args.data, args.start, args.end, chunksize=args.chunksize)
+        
+        if data.empty:
+            print(f"Fehler: Keine Daten für {args.data} gefunden.")
+            sys.exit(1)
+            
+        print(f"Daten geladen: {len(data)} Datenpunkte von {data.index[0].strftime('%Y-%m-%d')} bis {data.index[-1].strftime('%Y-%m-%d')}")
+    except Exception as e:
+        print(f"Fehler beim Laden der Daten: {str(e)}")
+        sys.exit(1)
+    
+    try:
+        thresholds = [float(v) for v in args.sweep_thresholds.split(',')]
+        look_backs = [int(v) for v in args.sweep_windows.split(',')]
+        stop_losses = [float(v) or None for v in args.sweep_risks.split(',')]
+    except ValueError as e:
+        print(f"Fehler: Ungültige Sweep-Parameter: {str(e)}")
+        sys.exit(1)
+    
+    from elliott_wave.sweep import run_parameter_sweep
+    
+    num_points = len(thresholds) * len(look_backs) * len(stop_losses)
+    print(f"Führe {num_points} Backtests mit Anfangsinvestition von {args.invest:.2f}€ durch...")
+    results = run_parameter_sweep(
+        data,
+        thresholds,
+        look_backs,
+        stop_losses,
+        start_date=args.start,
+        end_date=args.end,
+        invest_amount=args.invest,
+        workers=args.workers
+    )
+    
+    # Zeige die Rangliste an
+    print("\nSweep-Ergebnisse (sortiert nach Gesamtrendite):")
+    table_data = []
+    for rank, result in enumerate(results, start=1):
+        table_data.append([
+            rank,
+            result['zigzag_threshold'],
+            result['look_back'],
+            result['stop_loss'] if result['stop_loss'] is not None else "-",
+            f"{result['total_return']:.2f}%",
+            f"{result['max_drawdown']:.2f}%",
+            f"{result['win_rate']:.2f}%",
+            result['num_trades']
+        ])
+    
+    headers = ["#", "Threshold", "Look-Back", "Risiko", "Rendite", "Max. Drawdown", "Gewinnrate", "Trades"]
+    from tabulate import tabulate
+    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    
+    # Exportiere die Ergebnisse im gewünschten Format
+    if args.output != 'table':
+        output_data = [
+            {key: ensure_native_type(value) for key, value in result.items()}
+            for result in results
+        ]
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        symbol = os.path.basename(args.data).split('.')[0]
+        
+        if args.output == 'csv':
+            import csv
+            
+            output_file = f"sweep_{symbol}_{timestamp}.csv"
+            with open(output_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(output_data[0].keys()))
+                writer.writeheader()
+                writer.writerows(output_data)
+            
+            print(f"Ergebnisse wurden exportiert als {output_file}")
+            
+        elif args.output == 'json':
+            import json
+            
+            output_file = f"sweep_{symbol}_{timestamp}.json"
+            with open(output_file, 'w') as f:
+                json.dump(output_data, f, indent=2)
+            
+            print(f"Ergebnisse wurden exportiert als {output_file}")
+
+def run_scan(args):
+    """
+    Durchsucht viele Symbole nach aktuell gültigen Impuls- oder Korrekturwellen.
+    
+    Args:
+        args (argparse.Namespace): Kommandozeilenargumente
+    """
+    symbols = DataLoader.load_symbol_list(args.data)
+    if not symbols:
+        print(f"Fehler: Keine Symbole in {args.data} gefunden.")
+        sys.exit(1)
+    
+    start_date = args.start or (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d')
+    
+    # Lade die Historien gebündelt mit begrenzter Parallelität
+    print(f"Lade Daten für {len(symbols)} Symbole (max. {args.concurrency} gleichzeitig)...")
+    histories, failures = DataLoader.load_many(symbols, start_date, args.end, threads=max(args.concurrency, 1))
+    
+    print(f"Daten geladen: {len(histories)} Symbole, {len(failures)} Fehler")
+    
+    # Analysiere alle Symbole parallel
+    from elliott_wave.scan import scan_universe
+    
+    print("Analysiere Elliott-Wellen-Muster...")
+    results = scan_universe(histories, zigzag_threshold=args.threshold, window_size=args.window, workers=args.workers)
+    
+    print(f"\nSymbole mit gültigem Wellenmuster: {len(results)} von {len(histories)}")
+    if results:
+        table_data = []
+        for result in results:
+            target = result['target']
+            if isinstance(target, tuple):
+                target_text = f"{target[0]:.2f} - {target[1]:.2f}"
+            else:
+                target_text = f"{target:.2f}" if target is not None else "-"
+            
+            table_data.append([
+                result['symbol'],
+                result['date'],
+                f"{result['price']:.2f}",
+                result['wave_type'].capitalize(),
+                result['prediction'],
+                f"{result['confidence']:.2f}",
+                target_text
+            ])
+        
+        headers = ["Symbol", "Datum", "Preis", "Welle", "Vorhersage", "Konfidenz", "Kursziele"]
+        from tabulate import tabulate
+        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    
+    if failures:
+        print("\nFehler beim Laden:")
+        for symbol, error in sorted(failures.items()):
+            print(f"  {symbol}: {error}")
+    
+    # Exportiere die Ergebnisse im gewünschten Format
+    if args.output != 'table' and results:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        if args.output == 'csv':
+            import csv
+            
+            output_file = f"scan_{timestamp}.csv"
+            with open(output_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+                writer.writeheader()
+                writer.writerows(results)
+            
+            print(f"Ergebnisse wurden exportiert als {output_file}")
+            
+        elif args.output == 'json':
+            import json
+            
+            output_file = f"scan_{timestamp}.json"
+            with open(output_file, 'w') as f:
+                json.dump(results, f, indent=2)
+            
+            print(f"Ergebnisse wurden exportiert als {output_file}")
+
+def run_portfolio(args):
+    """
+    Führt einen Backtest der Elliott-Wellen-Strategie über viele Symbole mit gemeinsamem Kapital durch.
+    
+    Args:
+        args (argparse.Namespace): Kommandozeilenargumente
+    """
+    symbols = DataLoader.load_symbol_list(args.data)
+    if not symbols:
+        print(f"Fehler: Keine Symbole in {args.data} gefunden.")
+        sys.exit(1)
+    
+    print(f"Lade Daten für {len(symbols)} Symbole (max. {args.concurrency} gleichzeitig)...")
+    histories, failures = DataLoader.load_many(symbols, args.start, args.end, threads=max(args.concurrency, 1))
+    
+    if failures:
+        print("\nFehler beim Laden:")
+        for symbol, error in sorted(failures.items()):
+            print(f"  {symbol}: {error}")
+    
+    from elliott_wave.portfolio import build_price_matrix, run_portfolio_backtest
+    
+    price_matrix = build_price_matrix(histories)
+    if price_matrix.empty:
+        print("Fehler: Keine Kursdaten für den Portfolio-Backtest vorhanden.")
+        sys.exit(1)
+    
+    print(f"Preis-Matrix: {price_matrix.shape[0]} Tage x {price_matrix.shape[1]} Symbole "
+          f"von {price_matrix.index[0].strftime('%Y-%m-%d')} bis {price_matrix.index[-1].strftime('%Y-%m-%d')}")
+    print(f"Führe Portfolio-Backtest mit Anfangsinvestition von {args.invest:.2f}€ "
+          f"und max. {args.max_positions} Positionen durch...")
+    results = run_portfolio_backtest(
+        price_matrix,
+        invest_amount=args.invest,
+        zigzag_threshold=args.threshold,
+        max_positions=args.max_positions,
+        workers=args.workers
+    )
+    
+    # Zeige die Ergebnisse an
+    print("\nPortfolio-Ergebnisse:")
+    print(f"  Anfangsinvestition: {results['initial_investment']:.2f}€")
+    print(f"  Endwert: {results['final_equity']:.2f}€")
+    print(f"  Gesamtrendite: {results['total_return']:.2f}%")
+    print(f"  Max. Drawdown: {results['max_drawdown']:.2f}%")
+    print(f"  Anzahl Trades: {results['num_trades']}")
+    print(f"  Gewinnrate: {results['win_rate']:.2f}%")
+    print(f"  Ø Trade-Rendite: {results['avg_trade_return']:.2f}%")
+    
+    # Beiträge der einzelnen Symbole, größter Gewinn zuerst
+    symbol_stats = results['symbols'].sort_values('profit', ascending=False)
+    table_data = []
+    for symbol, row in symbol_stats.iterrows():
+        table_data.append([
+            symbol,
+            row['num_trades'],
+            f"{row['win_rate']:.2f}%" if row['num_trades'] else "-",
+            f"{row['avg_trade_return']:.2f}%" if row['num_trades'] else "-",
+            f"{row['profit']:.2f}€"
+        ])
+    
+    print("\nErgebnisse je Symbol:")
+    headers = ["Symbol", "Trades", "Gewinnrate", "Ø Trade-Rendite", "Gewinn"]
+    from tabulate import tabulate
+    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    
+    # Exportiere die Ergebnisse im gewünschten Format
+    if args.output != 'table':
+        summary = {key: results[key] for key in ('initial_investment', 'final_equity', 'total_return',
+                                                 'max_drawdown', 'num_trades', 'win_rate',
+                                                 'avg_trade_return', 'num_symbols', 'max_positions')}
+        trades = results['trades'].assign(date=results['trades']['date'].dt.strftime('%Y-%m-%d'))
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        if args.output == 'csv':
+            import csv
+            
+            summary_file = f"portfolio_summary_{timestamp}.csv"
+            with open(summary_file, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Metrik', 'Wert'])
+                for key, value in summary.items():
+                    writer.writerow([key, value])
+            
+            trades_file = f"portfolio_trades_{timestamp}.csv"
+            trades.to_csv(trades_file, index=False)
+            
+            print(f"Ergebnisse wurden exportiert als {summary_file} und {trades_file}")
+            
+        elif args.output == 'json':
+            import json
+            
+            output_file = f"portfolio_{timestamp}.json"
+            with open(output_file, 'w') as f:
+                json.dump({
+                    'portfolio_summary': summary,
+                    # Symbole ohne Trades haben keine Gewinnrate, NaN ist kein gültiges JSON
+                    'symbols': results['symbols'].reset_index().astype(object)
+                                                  .where(results['symbols'].reset_index().notna(), None)
+                                                  .to_dict('records'),
+                    'trades': trades.to_dict('records')
+                }, f, indent=2, default=float)
+            
+            print(f"Ergebnisse wurden exportiert als {output_file}")
+
+def run_serve(args):
+    """
+    Startet den lokalen HTTP-Analysedienst, der Kursdaten und Analysen im Speicher hält.
+    
+    Args:
+        args (argparse.Namespace): Kommandozeilenargumente
+    """
+    import asyncio
+    from service import AnalysisService, serve
+    
+    # Die Kommandozeilenparameter dienen als Standardwerte der Anfragen
+    defaults = {
+        'symbol': args.data,
+        'start': args.start,
+        'end': args.end,
+        'exchange': None,
+        'threshold': args.threshold,
+        'window': args.window,
+        'risk': args.risk,
+        'invest': args.invest
+    }
+    service = AnalysisService(get_trade_recommendations, history_ttl=args.refresh)
+    
+    try:
+        asyncio.run(serve(service, defaults, host=args.host, port=args.port, workers=args.workers))
+    except KeyboardInterrupt:
+        print("\nAnalysedienst beendet.")
 
 def run_live_analysis(args):
     """
@@ -565,7 +952,7 @@ def run_live_analysis(args):
         
         # Führe die Analyse durch
         print("Analysiere Elliott-Wellen-Muster...")
-        waves = analyzer.analyze(zigzag_threshold=args.threshold, window_size=args.window)
+        waves = analyzer.analyze(zigzag_threshold=args.threshold, window_size=args.window, use_high_low=args.high_low)
         
         # Aktuelle Wellenanalyse und Vorhersage
         current_wave = analyzer.find_current_wave()
@@ -641,8 +1028,12 @@ def run_live_analysis(args):
             for i, rr in enumerate(recommendations['risk_reward']):
                 print(f"  Risk/Reward (Ziel {i+1}): {rr:.2f}")
         
+        if args.no_plot:
+            return
+        
         # Visualisierung
         print("\nErstelle Visualisierung...")
+        import matplotlib.pyplot as plt
         from elliott_wave.utils import plot_waves
         fig, ax = plot_waves(hist_data, waves, title=f"Elliott-Wellen-Analyse: {symbol} (Live)")
         
@@ -728,6 +1119,13 @@ def run_dashboard(args):
     Args:
         args (argparse.Namespace): Kommandozeilenargumente
     """
+    # GUI-Bibliotheken werden nur für das Dashboard geladen
+    import tkinter as tk
+    from tkinter import ttk
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.figure import Figure
+    
     symbol = args.data
     
     # Überprüfe, ob es sich um ein Tickersymbol handelt
@@ -808,19 +1206,10 @@ def run_dashboard(args):
     search_frame = ttk.Frame(header_frame)
     search_frame.pack(side=tk.LEFT, padx=10)
     
-    # Kombiniere alle verfügbaren Symbole für Autocomplete
-    all_symbols = DataLoader.US_SYMBOLS.copy()
-    all_symbols.extend(DataLoader.US_INDICES)
-    
-    # Füge gängige deutsche Aktien hinzu
-    common_german_symbols = ['SAP', 'SIE', 'ALV', 'BAS', 'BMW', 'DAI', 'DBK', 'DTE', 'EOAN', 'FRE']
-    all_symbols.extend(common_german_symbols)
-    
-    # Füge deutsche Indizes hinzu
-    all_symbols.extend(['DAX', 'MDAX', 'SDAX', 'TecDAX', 'HDAX'])
-    
-    # Sortiere alle Symbole alphabetisch
-    all_symbols.sort()
+    # Vorschläge kommen aus dem Präfixbaum der Symbolauflösung, die Liste bleibt auch bei
+    # großen Symbollisten auf AUTOCOMPLETE_LIMIT Einträge begrenzt
+    resolver = DataLoader.get_resolver()
+    all_symbols = resolver.complete('', limit=AUTOCOMPLETE_LIMIT)
     
     ttk.Label(search_frame, text="Symbol:").pack(side=tk.LEFT, padx=2)
     
@@ -833,8 +1222,7 @@ def run_dashboard(args):
         if value == '':
             search_dropdown['values'] = all_symbols
         else:
-            matches = [s for s in all_symbols if value.upper() in s.upper()]
-            search_dropdown['values'] = matches
+            search_dropdown['values'] = resolver.complete(value, limit=AUTOCOMPLETE_LIMIT)
 
     # Funktion zum Ändern des Symbols
     def on_symbol_change(event):
@@ -903,7 +1291,7 @@ def run_dashboard(args):
     row2.pack(fill=tk.X, pady=2)
     
     ttk.Label(row2, text="ZigZag:").pack(side=tk.LEFT, padx=2)
-    threshold_combo = ttk.Combobox(row2, textvariable=threshold, values=[0.01, 0.02, 0.03, 0.05, 0.1], width=5)
+    threshold_combo = ttk.Combobox(row2, textvariable=threshold, values=list(ZIGZAG_THRESHOLDS), width=5)
     threshold_combo.pack(side=tk.LEFT, padx=2)
     
     ttk.Label(row2, text="Risiko:").pack(side=tk.LEFT, padx=2)
@@ -989,8 +1377,9 @@ def run_dashboard(args):
     status_bar = ttk.Label(root, textvariable=status_message, relief=tk.SUNKEN, anchor=tk.W)
     status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
-    # Daten-Cache und Thread-Steuerung
+    # Daten-Cache (wird nur im Tk-Hauptthread verändert) und Worker-Steuerung
     data_cache = {
+        'params': None,
         'live_data': None,
         'hist_data': None,
         'waves': None,
@@ -1000,57 +1389,186 @@ def run_dashboard(args):
     }
     
     stop_thread = threading.Event()
+    request_queue = queue.Queue()
+    result_queue = queue.Queue()
+    request_state = {'generation': 0}
     update_thread = None
+    refresh_job = None
+    
+    def submit_request(fetch):
+        """Erfasst die aktuellen Einstellungen im Tk-Hauptthread und übergibt sie dem Worker"""
+        request_state['generation'] += 1
+        request_queue.put({
+            'generation': request_state['generation'],
+            'fetch': fetch,
+            'symbol': symbol,
+            'is_us_symbol': is_us_symbol,
+            # Für US-Symbole verwende kein Exchange-Parameter
+            'exchange': None if is_us_symbol else exchange.get(),
+            'days': current_days.get(),
+            'threshold': threshold.get(),
+            'risk': risk.get()
+        })
+        status_message.set("Aktualisiere Daten..." if fetch else "Aktualisiere Analyse...")
     
     def update_data():
-        """Aktualisiert die Daten und die Anzeige"""
-        try:
-            status_message.set("Aktualisiere Daten...")
-            
-            # Hole Live-Daten
-            # Für US-Symbole verwende kein Exchange-Parameter
-            if is_us_symbol:
-                data_cache['live_data'] = DataLoader.get_live_data(symbol)
-            else:
-                data_cache['live_data'] = DataLoader.get_live_data(symbol, exchange=exchange.get())
-            
-            # Hole historische Daten für die Analyse
-            days = current_days.get()
-            if is_us_symbol:
-                data_cache['hist_data'] = DataLoader.get_recent_data(symbol, days=days)
-            else:
-                data_cache['hist_data'] = DataLoader.get_recent_data(symbol, days=days, exchange=exchange.get())
+        """Fordert neue Marktdaten samt Analyse beim Worker an"""
+        submit_request(fetch=True)
+    
+    def update_analysis():
+        """Fordert eine neue Analyse der zwischengespeicherten Daten beim Worker an"""
+        submit_request(fetch=False)
+    
+    def analysis_worker():
+        """Lädt und analysiert Daten im Hintergrund, ohne den Tk-Hauptthread zu blockieren"""
+        fetched = {'key': None, 'live_data': None, 'hist_data': None}
+        carry_fetch = False
+        # ZigZag-Filter aller Schwellenwerte der Auswahl, die bei jedem Abruf nur um neue Bars fortgeschrieben werden
+        zigzags = IncrementalZigZagLadder(ZIGZAG_THRESHOLDS)
+        
+        def is_stale(request):
+            # Eine neuere Anfrage macht die laufende überflüssig
+            return request['generation'] != request_state['generation'] or stop_thread.is_set()
+        
+        while not stop_thread.is_set():
+            request = request_queue.get()
+            if request is None:
+                break
             
-            # Erstelle den Analyzer
-            analyzer = ElliottWaveAnalyzer(data_cache['hist_data'])
+            # Fasse schnell aufeinanderfolgende Anfragen zusammen, nur die neueste wird bearbeitet
+            fetch = request['fetch'] or carry_fetch
+            while True:
+                try:
+                    newer = request_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    return
+                fetch = fetch or newer['fetch']
+                request = newer
             
-            # Führe die Analyse durch
-            data_cache['waves'] = analyzer.analyze(
-                zigzag_threshold=threshold.get(), 
-                window_size=args.window
-            )
+            key = (request['symbol'], request['exchange'], request['days'])
+            fetch = fetch or fetched['key'] != key
+            carry_fetch = fetch
             
-            # Aktuelle Wellenanalyse und Vorhersage
-            data_cache['current_wave'] = analyzer.find_current_wave()
-            data_cache['prediction'] = analyzer.predict_next_move()
+            try:
+                if fetch:
+                    # Hole Live-Daten
+                    live_data = DataLoader.get_live_data(request['symbol'], exchange=request['exchange'])
+                    if is_stale(request):
+                        continue
+                    
+                    # Hole historische Daten für die Analyse
+                    hist_data = DataLoader.get_recent_data(request['symbol'], days=request['days'], exchange=request['exchange'])
+                    if is_stale(request):
+                        continue
+                    
+                    # Schreibe die Wendepunkte für alle ZigZag-Schwellenwerte der Auswahl fort, damit Analyse
+                    # und Wechsel des Schwellenwerts nur noch ein Nachschlagen im Cache sind
+                    zigzags.update(hist_data['Close'].values)
+                    
+                    fetched.update(key=key, live_data=live_data, hist_data=hist_data)
+                    carry_fetch = False
+                
+                live_data = fetched['live_data']
+                hist_data = fetched['hist_data']
+                
+                # Erstelle den Analyzer und führe die Analyse durch
+                analyzer = ElliottWaveAnalyzer(hist_data)
+                waves = analyzer.analyze(
+                    zigzag_threshold=request['threshold'], 
+                    window_size=args.window
+                )
+                
+                # Aktuelle Wellenanalyse und Vorhersage
+                current_wave = analyzer.find_current_wave()
+                prediction = analyzer.predict_next_move()
+                
+                # Generiere Handelsempfehlungen
+                recommendations = get_trade_recommendations(
+                    current_wave, 
+                    prediction, 
+                    live_data['price'], 
+                    request['risk']
+                )
+                
+                if is_stale(request):
+                    continue
+                
+                # Das Ergebnis wird nach der Übergabe nicht mehr verändert
+                result_queue.put({
+                    'generation': request['generation'],
+                    'data': {
+                        'params': request,
+                        'live_data': live_data,
+                        'hist_data': hist_data,
+                        'waves': waves,
+                        'current_wave': current_wave,
+                        'prediction': prediction,
+                        'recommendations': recommendations
+                    }
+                })
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
+                result_queue.put({'generation': request['generation'], 'error': str(e)})
+    
+    def poll_results():
+        """Übernimmt fertige Ergebnisse des Workers im Tk-Hauptthread"""
+        while True:
+            try:
+                result = result_queue.get_nowait()
+            except queue.Empty:
+                break
             
-            # Generiere Handelsempfehlungen
-            current_price = data_cache['live_data']['price']
-            data_cache['recommendations'] = get_trade_recommendations(
-                data_cache['current_wave'], 
-                data_cache['prediction'], 
-                current_price, 
-                risk.get()
-            )
+            # Ergebnisse veralteter Anfragen verwerfen
+            if result['generation'] != request_state['generation']:
+                continue
             
-            # Aktualisiere die Anzeige
-            update_display()
+            if 'error' in result:
+                status_message.set(f"Fehler bei der Aktualisierung: {result['error']}")
+                continue
             
-            status_message.set(f"Aktualisiert: {datetime.now().strftime('%H:%M:%S')} | Nächstes Update in {refresh_interval.get()} Sek.")
-        except Exception as e:
-            status_message.set(f"Fehler bei der Aktualisierung: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            try:
+                data_cache.update(result['data'])
+                with profiling.stage('update_display'):
+                    update_display()
+                status_message.set(f"Aktualisiert: {datetime.now().strftime('%H:%M:%S')} | Nächstes Update in {refresh_interval.get()} Sek.")
+            except Exception as e:
+                status_message.set(f"Fehler bei der Anzeige: {str(e)}")
+                import traceback
+                traceback.print_exc()
+        
+        if not stop_thread.is_set():
+            root.after(100, poll_results)
+    
+    # Persistente Chart-Artists, die bei jeder Aktualisierung wiederverwendet werden
+    chart = {
+        'price_line': None,
+        'price_hline': ax.axhline(y=0, color='white', linestyle='-', alpha=0.7, visible=False),
+        'price_label': ax.annotate("", (0, 0), xytext=(10, 0), textcoords='offset points',
+                                   color='white', fontweight='bold', visible=False),
+        'waves': {},
+        'levels': {},
+        'layout_done': False
+    }
+    
+    # Statische Formatierung des Plots
+    ax.set_xlabel('DATUM', color='white')
+    ax.set_ylabel('PREIS', color='white')
+    ax.tick_params(axis='x', colors='white')
+    ax.tick_params(axis='y', colors='white')
+    ax.grid(True, alpha=0.3, color='gray')
+    
+    def remove_stale_artists(artist_map, keep_keys):
+        """Entfernt Artists, deren Schlüssel nicht mehr benötigt wird, und meldet, ob etwas entfernt wurde"""
+        removed = False
+        for key in list(artist_map):
+            if key not in keep_keys:
+                for artist in artist_map.pop(key):
+                    artist.remove()
+                removed = True
+        return removed
     
     def update_display():
         """Aktualisiert die Anzeige mit den neuesten Daten"""
@@ -1062,7 +1580,8 @@ def run_dashboard(args):
         
         live_data = data_cache['live_data']
         market_data.insert("", "end", text="Symbol", values=(live_data['symbol'],))
-        market_data.insert("", "end", text="Börse", values=("US" if is_us_symbol else exchange.get(),))
+        params = data_cache['params']
+        market_data.insert("", "end", text="Börse", values=("US" if params['is_us_symbol'] else params['exchange'],))
         market_data.insert("", "end", text="Zeitstempel", values=(live_data['timestamp'],))
         market_data.insert("", "end", text="Aktueller Preis", values=(f"{live_data['price']:.2f}",))
         
@@ -1205,11 +1724,15 @@ def run_dashboard(args):
         rec_text.tag_configure('red', foreground=colors['down'])
         rec_text.tag_configure('yellow', foreground=colors['neutral'])
         
-        # Aktualisiere Chart
-        ax.clear()
+        # Aktualisiere Chart: bestehende Artists werden aktualisiert statt die Achse neu aufzubauen
+        hist_data = data_cache['hist_data']
+        last_date = hist_data.index[-1]
         
-        # Preisdaten plotten
-        ax.plot(data_cache['hist_data'].index, data_cache['hist_data']['Close'], color='white', alpha=0.8, label='Preis')
+        # Preisdaten aktualisieren (die Linie wird beim ersten Mal angelegt, damit die Datumsachse registriert wird)
+        if chart['price_line'] is None:
+            chart['price_line'], = ax.plot(hist_data.index, hist_data['Close'], color='white', alpha=0.8, label='Preis')
+        else:
+            chart['price_line'].set_data(hist_data.index, hist_data['Close'])
         
         # Farbcodes für verschiedene Wellentypen
         wave_colors = {
@@ -1219,7 +1742,9 @@ def run_dashboard(args):
             'diagonal': '#BA55D3'    # Medium Orchid
         }
         
-        # Wellen plotten
+        # Wellen-Overlays: nur neue Wellen zeichnen, nicht mehr vorhandene entfernen
+        wave_keys = set()
+        waves_changed = False
         for wave_type, wave_list in data_cache['waves'].items():
             if wave_type in wave_colors and wave_list:
                 for wave in wave_list:
@@ -1228,36 +1753,40 @@ def run_dashboard(args):
                         continue
                     
                     # Extrahiere die Preispunkte an den Wellenindizes
-                    x_points = [data_cache['hist_data'].index[i] for i in indices if i < len(data_cache['hist_data'])]
-                    y_points = [data_cache['hist_data']['Close'].iloc[i] for i in indices if i < len(data_cache['hist_data'])]
+                    x_points = [hist_data.index[i] for i in indices if i < len(hist_data)]
+                    y_points = [hist_data['Close'].iloc[i] for i in indices if i < len(hist_data)]
+                    
+                    key = (wave_type, wave['wave_count'], tuple(x_points), tuple(y_points))
+                    wave_keys.add(key)
+                    if key in chart['waves']:
+                        continue
                     
                     # Plotte die Wellenpunkte und verbinde sie
-                    ax.plot(x_points, y_points, 'o-', color=wave_colors[wave_type], alpha=0.7, 
-                            label=f"{wave_type.capitalize()} Wave {wave['wave_count']}")
+                    line, = ax.plot(x_points, y_points, 'o-', color=wave_colors[wave_type], alpha=0.7, 
+                                    label=f"{wave_type.capitalize()} Wave {wave['wave_count']}")
                     
                     # Beschrifte die Wellenpunkte
+                    artists = [line]
                     for i, (x, y) in enumerate(zip(x_points, y_points)):
-                        ax.annotate(f"{i+1}", (x, y), xytext=(5, 5), textcoords='offset points', color='white')
+                        artists.append(ax.annotate(f"{i+1}", (x, y), xytext=(5, 5), textcoords='offset points', color='white'))
+                    chart['waves'][key] = artists
+                    waves_changed = True
+        
+        waves_changed = remove_stale_artists(chart['waves'], wave_keys) or waves_changed
         
         # Aktuellen Preis markieren
-        ax.axhline(y=live_data['price'], color='white', linestyle='-', alpha=0.7)
-        ax.annotate(f"Aktueller Preis: {live_data['price']:.2f}", 
-                   (data_cache['hist_data'].index[-1], live_data['price']), 
-                   xytext=(10, 0), 
-                   textcoords='offset points',
-                   color='white',
-                   fontweight='bold')
+        chart['price_hline'].set_ydata([live_data['price'], live_data['price']])
+        chart['price_label'].set_text(f"Aktueller Preis: {live_data['price']:.2f}")
+        chart['price_label'].xy = (last_date, live_data['price'])
+        chart['price_hline'].set_visible(True)
+        chart['price_label'].set_visible(True)
         
         # Formatierung des Plots
-        market_text = "US-MARKT" if is_us_symbol else f"{exchange.get()}"
-        ax.set_title(f"{symbol} ({market_text}) - {current_days.get()} TAGE", color='white')
-        ax.set_xlabel('DATUM', color='white')
-        ax.set_ylabel('PREIS', color='white')
-        ax.tick_params(axis='x', colors='white')
-        ax.tick_params(axis='y', colors='white')
-        ax.grid(True, alpha=0.3, color='gray')
+        market_text = "US-MARKT" if params['is_us_symbol'] else f"{params['exchange']}"
+        ax.set_title(f"{params['symbol']} ({market_text}) - {params['days']} TAGE", color='white')
         
-        # Füge Handelsempfehlungen zur Visualisierung hinzu
+        # Handelsempfehlungen als Linien: Schlüssel (Beschriftung, Farbe, Preis) -> Artists
+        level_specs = []
         if recommendations['empfehlung'] != 'Neutral' and recommendations['stop_loss']:
             # Bestimme, ob es sich um eine Long- oder Short-Position handelt
             is_long = recommendations['empfehlung'] in ['Kaufen', 'Gewinne mitnehmen']
@@ -1278,13 +1807,7 @@ def run_dashboard(args):
                 stop_loss_label = f"SL: {stop_loss_value:.2f}"
                 stop_loss_color = colors['neutral']
             
-            ax.axhline(y=stop_loss_value, color=stop_loss_color, linestyle='--', alpha=0.7)
-            ax.annotate(stop_loss_label, 
-                       (data_cache['hist_data'].index[-1], stop_loss_value), 
-                       xytext=(10, 0), 
-                       textcoords='offset points',
-                       color=stop_loss_color,
-                       fontweight='bold')
+            level_specs.append((stop_loss_label, stop_loss_color, stop_loss_value, 'bold'))
             
             # Kursziele
             if recommendations['ziele']:
@@ -1301,30 +1824,45 @@ def run_dashboard(args):
                     else:
                         ziel_color = '#00FFFF'  # Cyan
                     
-                    ax.axhline(y=ziel_preis, color=ziel_color, linestyle='--', alpha=0.7)
-                    ax.annotate(f"Z{i+1}: {ziel_preis:.2f} ({ziel['änderung']})", 
-                               (data_cache['hist_data'].index[-1], ziel_preis), 
+                    level_specs.append((f"Z{i+1}: {ziel_preis:.2f} ({ziel['änderung']})", ziel_color, ziel_preis, 'normal'))
+        
+        level_keys = set()
+        for label, color, value, weight in level_specs:
+            key = (label, color, value, last_date)
+            level_keys.add(key)
+            if key not in chart['levels']:
+                chart['levels'][key] = [
+                    ax.axhline(y=value, color=color, linestyle='--', alpha=0.7),
+                    ax.annotate(label, 
+                               (last_date, value), 
                                xytext=(10, 0), 
                                textcoords='offset points',
-                               color=ziel_color)
+                               color=color,
+                               fontweight=weight)
+                ]
+        remove_stale_artists(chart['levels'], level_keys)
+        
+        # Achsen an die neuen Daten anpassen
+        ax.relim()
+        ax.autoscale_view()
+        
+        # Legende und Layout nur neu berechnen, wenn sich die Wellen geändert haben bzw. beim ersten Mal
+        if waves_changed or not chart['layout_done']:
+            ax.legend(loc='upper left')
+        if not chart['layout_done']:
+            fig.tight_layout()
+            chart['layout_done'] = True
         
-        ax.legend(loc='upper left')
-        fig.tight_layout()
-        canvas.draw()
+        canvas.draw_idle()
         
         # Aktualisiere die Toolbar
         toolbar.update()
     
     def periodic_update():
-        """Periodische Aktualisierung der Daten"""
-        while not stop_thread.is_set():
-            update_data()
-            
-            # Warte für das angegebene Intervall oder bis stop_thread gesetzt wird
-            for _ in range(refresh_interval.get()):
-                if stop_thread.is_set():
-                    break
-                time.sleep(1)
+        """Periodische Aktualisierung der Daten über die Tk-Ereignisschleife"""
+        nonlocal refresh_job
+        update_data()
+        refresh_job = root.after(max(refresh_interval.get(), 1) * 1000, periodic_update)
     
     def on_update_button():
         """Manuelles Update bei Knopfdruck"""
@@ -1365,8 +1903,10 @@ def run_dashboard(args):
     def on_closing():
         """Wird beim Schließen des Fensters aufgerufen"""
         stop_thread.set()
-        if update_thread:
-            update_thread.join()
+        request_queue.put(None)
+        if refresh_job is not None:
+            root.after_cancel(refresh_job)
+        # Nicht auf den Worker warten, er kann noch in einer Netzwerkanfrage hängen
         root.destroy()
     
     def on_timeframe_changed(event):
@@ -1387,17 +1927,18 @@ def run_dashboard(args):
     refresh_combo.bind("<<ComboboxSelected>>", on_refresh_changed)
     if not is_us_symbol:
         exchange_combo.bind("<<ComboboxSelected>>", on_exchange_changed)
-    threshold_combo.bind("<<ComboboxSelected>>", lambda e: update_data())
-    risk_combo.bind("<<ComboboxSelected>>", lambda e: update_data())
+    threshold_combo.bind("<<ComboboxSelected>>", lambda e: update_analysis())
+    risk_combo.bind("<<ComboboxSelected>>", lambda e: update_analysis())
     root.protocol("WM_DELETE_WINDOW", on_closing)
     
-    # Initialer Daten-Load und Start des Update-Threads
-    update_data()
-    
-    update_thread = threading.Thread(target=periodic_update)
+    # Start des Worker-Threads, initialer Daten-Load und periodische Aktualisierung
+    update_thread = threading.Thread(target=analysis_worker)
     update_thread.daemon = True
     update_thread.start()
     
+    periodic_update()
+    poll_results()
+    
     # Starte das GUI
     root.mainloop()
 
@@ -1409,17 +1950,62 @@ def main():
     
     print("=== Elliott Wave Analyzer ===")
     
-    if args.mode == 'analyse':
-        run_analysis(args)
-    elif args.mode == 'backtest':
-        run_backtest(args)
-    elif args.mode == 'live':
-        run_live_analysis(args)
-    elif args.mode == 'dashboard':
-        run_dashboard(args)
-    else:
-        print(f"Unbekannter Modus: {args.mode}")
-        sys.exit(1)
+    if args.profile or args.profile_json:
+        profiling.enable()
+    
+    if args.universe:
+        try:
+            count = DataLoader.load_universe(args.universe)
+            print(f"Symbolliste geladen: {count} Symbole aus {args.universe}")
+        except Exception as e:
+            print(f"Fehler beim Laden der Symbolliste: {str(e)}")
+            sys.exit(1)
+    
+    if args.provider:
+        import providers
+        try:
+            providers.set_provider(args.provider)
+        except ValueError as e:
+            print(f"Fehler: {str(e)}")
+            sys.exit(1)
+    
+    if args.rate_limit is not None:
+        import yahoo_http
+        yahoo_http.configure(rate=args.rate_limit)
+    
+    # Ergebnisse für unveränderte Daten und Parameter werden auf der Festplatte zwischengespeichert,
+    # in den Live-Modi ändern sich die Daten ständig
+    if args.mode in ('analyse', 'backtest', 'sweep', 'scan', 'serve') and not args.no_cache:
+        result_cache.enable()
+    
+    try:
+        if args.mode == 'analyse':
+            run_analysis(args)
+        elif args.mode == 'backtest':
+            run_backtest(args)
+        elif args.mode == 'live':
+            run_live_analysis(args)
+        elif args.mode == 'dashboard':
+            run_dashboard(args)
+        elif args.mode == 'sweep':
+            run_sweep(args)
+        elif args.mode == 'scan':
+            run_scan(args)
+        elif args.mode == 'portfolio':
+            run_portfolio(args)
+        elif args.mode == 'serve':
+            run_serve(args)
+        else:
+            print(f"Unbekannter Modus: {args.mode}")
+            sys.exit(1)
+    finally:
+        if profiling.is_enabled():
+            print("\nLaufzeitprofil:")
+            print(profiling.format_report())
+            
+            if args.profile_json:
+                profiling.dump_json(args.profile_json)
+                print(f"Laufzeitprofil wurde in {args.profile_json} gespeichert.")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
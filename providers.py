@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Austauschbare Quellen für Marktdaten.
+
+DataLoader.load_data, get_recent_data, get_live_data und load_many fragen Kursdaten und
+Live-Kurse beim aktiven Provider an. Verfügbar sind:
+
+    yahoo              Yahoo Finance (Standard)
+    file:VERZEICHNIS   Lokale Dateien je Symbol (z.B. VERZEICHNIS/SAP.DE.csv oder SAP.parquet)
+    replay             Deterministische synthetische Kurse und Live-Kurse ohne Netzwerk
+    replay:VERZEICHNIS Aufgezeichnete Dateien, fehlende Symbole werden synthetisch erzeugt
+
+Optionen werden als Query-String angehängt, z.B. "replay?latency=0.2&jitter=0.1&seed=7".
+Der Provider wird über --provider oder die Umgebungsvariable EW_PROVIDER gewählt.
+"""
+
+import os
+import random
+import threading
+import time
+import zlib
+from datetime import datetime
+from urllib.parse import parse_qsl
+
+import numpy as np
+import pandas as pd
+
+class MarketDataProvider:
+    """
+    Basisklasse der Provider.
+
+    Alle Methoden erhalten bereits aufgelöste Tickersymbole (z.B. 'SAP.DE', '^GDAXI').
+    """
+
+    name = 'base'
+
+    # True, wenn der Provider viele Symbole mit einem Aufruf laden kann (siehe DataLoader.load_many)
+    batch_download = False
+
+    def history(self, symbol, start_date, end_date):
+        """
+        Liefert historische Kursdaten.
+
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol
+            start_date (str): Startdatum im Format 'YYYY-MM-DD' oder None
+            end_date (str): Enddatum im Format 'YYYY-MM-DD' (exklusiv)
+
+        Returns:
+            pandas.DataFrame: DataFrame mit OHLCV-Daten
+        """
+        raise NotImplementedError
+
+    def quote(self, symbol):
+        """
+        Liefert aktuelle Marktdaten im Format von DataLoader.get_live_data.
+
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol
+
+        Returns:
+            dict: Aktuelle Marktdaten für das Symbol
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+class YahooProvider(MarketDataProvider):
+    """
+    Kursdaten und Live-Kurse von Yahoo Finance (mit lokalem Cache, Ratenbegrenzung und Wiederholung).
+    """
+
+    name = 'yahoo'
+    batch_download = True
+
+    def history(self, symbol, start_date, end_date):
+        from data_loader import DataLoader
+        return DataLoader._load_from_yahoo(symbol, start_date, end_date)
+
+    def quote(self, symbol):
+        from data_loader import DataLoader
+        return DataLoader._get_live_data_fallback(symbol)
+
+def _slice(df, start_date, end_date):
+    """Schneidet den Zeitraum [start_date, end_date) aus (Enddatum exklusiv wie bei yf.download)."""
+    if start_date is not None:
+        df = df[df.index >= pd.Timestamp(start_date)]
+    if end_date is not None:
+        df = df[df.index < pd.Timestamp(end_date)]
+    return df
+
+def _quote_from_bars(symbol, price, bar, previous_close, volume=None, day_high=None, day_low=None):
+    """Erzeugt ein Dictionary im Format von DataLoader.get_live_data aus einem Bar."""
+    open_ = float(bar['Open']) if 'Open' in bar else price
+    return {
+        'symbol': symbol,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'price': float(price),
+        'change': float(price - open_),
+        'change_percent': float((price / open_ - 1) * 100) if open_ else 0.0,
+        'volume': float(volume if volume is not None else bar.get('Volume', 0)),
+        'market_cap': None,
+        'previous_close': float(previous_close) if previous_close is not None else None,
+        'open': open_,
+        'day_high': float(day_high if day_high is not None else bar.get('High', price)),
+        'day_low': float(day_low if day_low is not None else bar.get('Low', price)),
+        'short_percent': None,
+        'short_ratio': None,
+        'put_call_ratio': None,
+        'options_data': {}
+    }
+
+class FileProvider(MarketDataProvider):
+    """
+    Liest Kursdaten aus einer Datei je Symbol in einem Verzeichnis.
+
+    Gesucht wird nach dem aufgelösten Symbol und dem Basissymbol ohne Börsensuffix
+    (z.B. SAP.DE.csv, dann SAP.csv) in allen von DataLoader unterstützten Formaten.
+    Als Live-Kurs dient der letzte Bar der Datei.
+    """
+
+    name = 'file'
+    EXTENSIONS = ('.parquet', '.feather', '.npy', '.csv', '.xlsx', '.h5')
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def find(self, symbol):
+        """
+        Sucht die Datei eines Symbols.
+
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol
+
+        Returns:
+            str: Pfad der Datei oder None
+        """
+        base = symbol.lstrip('^').split('.')[0]
+        for name in dict.fromkeys([symbol, symbol.lstrip('^'), base]):
+            for ext in self.EXTENSIONS:
+                path = os.path.join(self.directory, f"{name}{ext}")
+                if os.path.isfile(path):
+                    return path
+        return None
+
+    def load(self, symbol):
+        """
+        Lädt die vollständige Datei eines Symbols (zwischengespeichert, bis sich die Datei ändert).
+
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol
+
+        Returns:
+            pandas.DataFrame: DataFrame mit OHLCV-Daten oder None, wenn keine Datei existiert
+        """
+        from data_loader import DataLoader
+
+        path = self.find(symbol)
+        if path is None:
+            return None
+
+        key = (path, os.path.getmtime(path))
+        with self._lock:
+            df = self._frames.get(key)
+        if df is None:
+            df = DataLoader._load_from_file(path).sort_index()
+            with self._lock:
+                self._frames[key] = df
+        return df
+
+    def history(self, symbol, start_date, end_date):
+        df = self.load(symbol)
+        if df is None:
+            raise ValueError(f"Keine Datei für Symbol {symbol} in {self.directory} gefunden")
+        df = _slice(df, start_date, end_date)
+        if df.empty:
+            raise ValueError(f"Keine Daten für Symbol {symbol} gefunden")
+        return df
+
+    def quote(self, symbol):
+        df = self.history(symbol, None, None)
+        last = df.iloc[-1]
+        previous_close = df['Close'].iloc[-2] if len(df) > 1 else None
+        return _quote_from_bars(symbol, float(last['Close']), last, previous_close)
+
+    def __repr__(self):
+        return f"FileProvider({self.directory!r})"
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Deterministischer Provider für Tests, Benchmarks und Lasttests ohne Netzwerk.
+
+    Historische Daten stammen aus aufgezeichneten Dateien (optional, wie FileProvider) oder
+    werden je Symbol reproduzierbar synthetisch erzeugt (Handelstage ab 2000-01-03 bis heute).
+    Live-Kurse setzen den letzten Schlusskurs mit einem reproduzierbaren Random Walk fort,
+    jeder Aufruf von quote liefert den nächsten Tick. Jeder Aufruf wartet latency Sekunden
+    plus eine zufällige Streuung bis jitter Sekunden.
+    """
+
+    name = 'replay'
+
+    # Standardabweichung der relativen Kursänderung je Live-Tick
+    TICK_VOLATILITY = 0.002
+
+    def __init__(self, source=None, latency=0.0, jitter=0.0, seed=0, start='2000-01-03', model='gbm'):
+        """
+        Args:
+            source (str, optional): Verzeichnis mit aufgezeichneten Dateien je Symbol
+            latency (float): Feste Wartezeit je Aufruf in Sekunden
+            jitter (float): Maximale zusätzliche, zufällige Wartezeit je Aufruf in Sekunden
+            seed (int): Startwert für die synthetischen Kurse und die Streuung der Wartezeit
+            start (str): Erstes Datum der synthetischen Kurse
+            model (str): Modell der synthetischen Kurse ("gbm" oder "random_walk")
+        """
+        self.files = FileProvider(source) if source else None
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        self.start = start
+        self.model = model
+        self._frames = {}
+        self._ticks = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+
+    def _symbol_seed(self, symbol):
+        # crc32 statt hash(), da hash() für Strings je Prozess zufällig ist
+        return self.seed * 1000003 + zlib.crc32(symbol.encode())
+
+    def _wait(self):
+        delay = self.latency
+        if self.jitter > 0:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def bars(self, symbol, end_date=None):
+        """
+        Liefert die vollständige Kurshistorie eines Symbols (aufgezeichnet oder synthetisch).
+
+        Args:
+            symbol (str): Aufgelöstes Tickersymbol
+            end_date (str, optional): Synthetische Kurse reichen mindestens bis zu diesem Datum
+
+        Returns:
+            pandas.DataFrame: DataFrame mit OHLCV-Daten
+        """
+        if self.files is not None:
+            recorded = self.files.load(symbol)
+            if recorded is not None:
+                return recorded
+
+        end = max(pd.Timestamp(end_date) if end_date else pd.Timestamp.now(), pd.Timestamp.now()).normalize()
+        with self._lock:
+            df = self._frames.get(symbol)
+            if df is not None and df.index[-1] >= end - pd.tseries.offsets.BDay(1):
+                return df
+
+        from elliott_wave.synthetic import generate_ohlcv
+
+        seed = self._symbol_seed(symbol)
+        n_bars = len(pd.bdate_range(self.start, end))
+        start_price = 10 + seed % 490
+        df = generate_ohlcv(n_bars, model=self.model, freq='B', start=self.start, seed=seed,
+                            start_price=float(start_price))
+        with self._lock:
+            self._frames[symbol] = df
+        return df
+
+    def history(self, symbol, start_date, end_date):
+        self._wait()
+        df = _slice(self.bars(symbol, end_date), start_date, end_date)
+        if df.empty:
+            raise ValueError(f"Keine Daten für Symbol {symbol} gefunden")
+        return df
+
+    def quote(self, symbol):
+        self._wait()
+        df = self.bars(symbol)
+        last = df.iloc[-1]
+        last_close = float(last['Close'])
+
+        with self._lock:
+            state = self._ticks.get(symbol)
+            if state is None:
+                state = self._ticks[symbol] = {
+                    'rng': np.random.default_rng(self._symbol_seed(symbol) + 1),
+                    'price': last_close,
+                    'high': last_close,
+                    'low': last_close,
+                    'volume': 0.0
+                }
+            state['price'] *= float(np.exp(state['rng'].normal(0, self.TICK_VOLATILITY)))
+            state['high'] = max(state['high'], state['price'])
+            state['low'] = min(state['low'], state['price'])
+            state['volume'] += float(state['rng'].lognormal(8, 0.5))
+            price, high, low, volume = state['price'], state['high'], state['low'], state['volume']
+
+        # Der Handelstag beginnt mit dem letzten Schlusskurs
+        bar = {'Open': last_close, 'High': high, 'Low': low, 'Volume': volume}
+        return _quote_from_bars(symbol, price, bar, last_close, volume=volume, day_high=high, day_low=low)
+
+    def reset(self):
+        """Setzt alle Live-Kurse auf den letzten Schlusskurs zurück."""
+        with self._lock:
+            self._ticks.clear()
+
+    def __repr__(self):
+        source = self.files.directory if self.files else None
+        return f"ReplayProvider(source={source!r}, latency={self.latency}, jitter={self.jitter}, seed={self.seed})"
+
+def create_provider(spec):
+    """
+    Erzeugt einen Provider aus einer Beschreibung wie "yahoo", "file:daten" oder "replay?latency=0.1".
+
+    Args:
+        spec (str): Name, optional mit ":Verzeichnis" und "?Option=Wert&..."
+
+    Returns:
+        MarketDataProvider: Neuer Provider
+    """
+    spec, _, query = spec.partition('?')
+    name, _, location = spec.partition(':')
+    options = dict(parse_qsl(query))
+    name = name.strip().lower()
+
+    try:
+        if name == 'yahoo':
+            return YahooProvider()
+        if name == 'file':
+            if not location:
+                raise ValueError("Für den Datei-Provider wird ein Verzeichnis benötigt (file:VERZEICHNIS)")
+            return FileProvider(location)
+        if name == 'replay':
+            return ReplayProvider(
+                source=location or None,
+                latency=float(options.get('latency', 0)),
+                jitter=float(options.get('jitter', 0)),
+                seed=int(options.get('seed', 0)),
+                start=options.get('start', '2000-01-03'),
+                model=options.get('model', 'gbm')
+            )
+    except ValueError as e:
+        raise ValueError(f"Ungültige Provider-Angabe '{spec}': {str(e)}")
+    raise ValueError(f"Unbekannter Provider: {name} (verfügbar: yahoo, file, replay)")
+
+_provider = None
+_provider_lock = threading.Lock()
+
+def get_provider():
+    """
+    Liefert den aktiven Provider (Standard: EW_PROVIDER bzw. Yahoo Finance).
+
+    Returns:
+        MarketDataProvider: Aktiver Provider
+    """
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = create_provider(os.getenv('EW_PROVIDER', 'yahoo'))
+        return _provider
+
+def set_provider(provider):
+    """
+    Setzt den aktiven Provider.
+
+    Args:
+        provider (MarketDataProvider oder str): Provider oder Beschreibung für create_provider
+    """
+    global _provider
+    if isinstance(provider, str):
+        provider = create_provider(provider)
+    with _provider_lock:
+        _provider = provider
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lokaler HTTP-Dienst für die Elliott-Wellen-Analyse.
+
+Der Dienst läuft dauerhaft und hält aufgelöste Symbole, Kursdaten und berechnete Wellen im
+Speicher, sodass wiederholte Anfragen ohne Prozessstart, Import und erneuten Download
+beantwortet werden. Alle Endpunkte werden per GET mit Query-Parametern aufgerufen und
+liefern JSON:
+
+    /analyse          Gefundene Wellenmuster
+    /current-wave     Aktuelle Welle
+    /prediction       Vorhersage der nächsten Bewegung
+    /recommendations  Handelsempfehlung (Parameter risk)
+    /backtest         Backtest-Kennzahlen und Trades (Parameter invest, stop_loss)
+    /health           Status und Cache-Statistik
+
+Gemeinsame Parameter: symbol (Tickersymbol oder Dateipfad), start, end, exchange,
+threshold, window, high_low.
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+import pandas as pd
+
+import providers
+from data_loader import DataLoader
+from elliott_wave import ElliottWaveAnalyzer
+
+# Obergrenze für Anfragezeile und Header, größere Anfragen werden abgewiesen
+MAX_HEADER_BYTES = 16384
+
+# Obergrenze für einen (nicht ausgewerteten) Anfragerumpf
+MAX_BODY_BYTES = 65536
+
+HTTP_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error'
+}
+
+class ServiceError(Exception):
+    """Fehler einer Anfrage, der mit dem angegebenen HTTP-Status beantwortet wird."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+class _LRUCache:
+    """
+    Threadsicherer LRU-Cache, der gleichzeitige Berechnungen desselben Schlüssels zusammenfasst.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, compute, is_fresh=None):
+        """
+        Liefert den Eintrag zu key oder berechnet ihn genau einmal.
+
+        Args:
+            key (tuple): Schlüssel des Eintrags
+            compute (callable): Funktion ohne Argumente, die den Wert berechnet
+            is_fresh (callable, optional): Prüft einen vorhandenen Wert, veraltete Werte werden neu berechnet
+
+        Returns:
+            Wert des Eintrags
+        """
+        with self.lock:
+            if key in self.entries and (is_fresh is None or is_fresh(self.entries[key])):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+
+            event = self.pending.get(key)
+            owner = event is None
+            if owner:
+                event = self.pending[key] = threading.Event()
+                self.misses += 1
+
+        if not owner:
+            # Eine andere Anfrage berechnet denselben Schlüssel bereits
+            event.wait()
+            return self.get_or_compute(key, compute, is_fresh)
+
+        try:
+            value = compute()
+            with self.lock:
+                self.entries[key] = value
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+            return value
+        finally:
+            with self.lock:
+                del self.pending[key]
+            event.set()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+def to_json_value(value):
+    """
+    Wandelt NumPy- und Pandas-Werte rekursiv in JSON-taugliche Python-Typen um.
+
+    Args:
+        value: Beliebiger Wert aus einem Analyseergebnis
+
+    Returns:
+        JSON-tauglicher Wert (NaN wird zu None)
+    """
+    if isinstance(value, dict):
+        return {str(k): to_json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_json_value(v) for v in value]
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.strftime('%Y-%m-%d %H:%M:%S') if value.time() != datetime.min.time() else value.strftime('%Y-%m-%d')
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+class AnalysisService:
+    """
+    Hält Kursdaten, Analyzer und Ergebnisse zwischen Anfragen im Speicher.
+    """
+
+    def __init__(self, recommend, history_ttl=300, max_entries=256):
+        """
+        Args:
+            recommend (callable): Funktion (current_wave, prediction, current_price, risk) für Handelsempfehlungen
+            history_ttl (float): Sekunden, nach denen Kursdaten des Providers neu geladen werden
+            max_entries (int): Maximale Anzahl der Einträge je Cache
+        """
+        self.recommend = recommend
+        self.history_ttl = history_ttl
+        self.started = time.time()
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+
+        self.symbols = _LRUCache(max_entries * 16)
+        self.histories = _LRUCache(max_entries)
+        self.analyzers = _LRUCache(max_entries)
+        self.backtests = _LRUCache(max_entries)
+
+    def resolve(self, source, exchange=None):
+        """
+        Löst ein Symbol einmalig auf, Dateipfade bleiben unverändert.
+
+        Args:
+            source (str): Tickersymbol oder Dateipfad
+            exchange (str, optional): Deutsche Börse
+
+        Returns:
+            str: Aufgelöstes Tickersymbol oder Dateipfad
+        """
+        if os.path.isfile(source):
+            return source
+        return self.symbols.get_or_compute((source, exchange), lambda: DataLoader.resolve_symbol(source, exchange))
+
+    def load_history(self, source, start=None, end=None, exchange=None):
+        """
+        Liefert die Kursdaten eines Symbols oder einer Datei aus dem Speicher oder lädt sie.
+
+        Dateien werden neu gelesen, sobald sich ihre Änderungszeit ändert, Kursdaten des
+        aktiven Providers (z.B. Yahoo Finance) nach Ablauf von history_ttl.
+
+        Args:
+            source (str): Tickersymbol oder Dateipfad
+            start (str, optional): Startdatum im Format 'YYYY-MM-DD'
+            end (str, optional): Enddatum im Format 'YYYY-MM-DD'
+            exchange (str, optional): Deutsche Börse
+
+        Returns:
+            tuple: (Schlüssel der Kursdaten, DataFrame)
+        """
+        if os.path.isfile(source):
+            key = ('file', os.path.abspath(source), os.path.getmtime(source), start, end)
+
+            def load():
+                return time.time(), DataLoader.load_data(source, start, end)
+
+            is_fresh = None
+        else:
+            symbol = self.resolve(source, exchange)
+            provider = providers.get_provider()
+            key = (provider.name, symbol, start, end)
+
+            def load():
+                return time.time(), provider.history(symbol, start, end or datetime.now().strftime('%Y-%m-%d'))
+
+            def is_fresh(entry):
+                return time.time() - entry[0] < self.history_ttl
+
+        loaded_at, data = self.histories.get_or_compute(key, load, is_fresh)
+        if data is None or data.empty:
+            raise ServiceError(f"Keine Daten für {source} gefunden", status=404)
+        # Der Ladezeitpunkt gehört zum Schlüssel, damit abgeleitete Ergebnisse mit den Daten verfallen
+        return key + (loaded_at,), data
+
+    def analyzer(self, params):
+        """
+        Liefert einen Analyzer mit fertiger Wellenanalyse, aktueller Welle und Vorhersage.
+
+        Args:
+            params (dict): Geparste Anfrageparameter
+
+        Returns:
+            dict: Kursdaten, Analyzer, Wellen, aktuelle Welle und Vorhersage
+        """
+        history_key, data = self.load_history(params['symbol'], params['start'], params['end'], params['exchange'])
+        key = (history_key, params['threshold'], params['window'], params['high_low'])
+
+        def compute():
+            analyzer = ElliottWaveAnalyzer(data)
+            waves = analyzer.analyze(zigzag_threshold=params['threshold'], window_size=params['window'],
+                                     use_high_low=params['high_low'])
+            current_wave = analyzer.find_current_wave()
+            return {
+                'data': data,
+                'analyzer': analyzer,
+                'waves': waves,
+                'current_wave': current_wave,
+                'prediction': analyzer.predict_next_move()
+            }
+
+        return self.analyzers.get_or_compute(key, compute)
+
+    def _describe(self, params, data):
+        return {
+            'symbol': params['symbol'],
+            'bars': len(data),
+            'first_date': to_json_value(data.index[0]),
+            'last_date': to_json_value(data.index[-1]),
+            'last_price': to_json_value(data['Close'].iloc[-1])
+        }
+
+    def analyse(self, params):
+        """
+        Endpunkt /analyse: Liefert alle gefundenen Wellenmuster.
+        """
+        state = self.analyzer(params)
+        data = state['data']
+
+        # Die Wellenliste wird nur einmal je Analyse in JSON-Form gebracht
+        waves = state.get('waves_json')
+        if waves is None:
+            dates = [to_json_value(date) for date in data.index]
+            prices = data['Close'].to_numpy(dtype=float)
+            waves = {}
+            for wave_type, wave_list in state['waves'].items():
+                waves[wave_type] = []
+                for wave in wave_list:
+                    indices = [int(i) for i in wave['indices'] if i < len(data)]
+                    waves[wave_type].append({
+                        'wave_count': wave['wave_count'],
+                        'dates': [dates[i] for i in indices],
+                        'prices': [float(prices[i]) for i in indices]
+                    })
+            state['waves_json'] = waves
+
+        result = self._describe(params, data)
+        result['waves'] = waves
+        result['current_wave'] = to_json_value(state['current_wave'])
+        result['prediction'] = to_json_value(state['prediction'])
+        return result
+
+    def current_wave(self, params):
+        """
+        Endpunkt /current-wave: Liefert die aktuelle Welle.
+        """
+        state = self.analyzer(params)
+        result = self._describe(params, state['data'])
+        result['current_wave'] = to_json_value(state['current_wave'])
+        return result
+
+    def prediction(self, params):
+        """
+        Endpunkt /prediction: Liefert die Vorhersage der nächsten Bewegung.
+        """
+        state = self.analyzer(params)
+        result = self._describe(params, state['data'])
+        result['prediction'] = to_json_value(state['prediction'])
+        return result
+
+    def recommendations(self, params):
+        """
+        Endpunkt /recommendations: Liefert die Handelsempfehlung für die angegebene Risikotoleranz.
+        """
+        state = self.analyzer(params)
+        data = state['data']
+        current_price = float(data['Close'].iloc[-1])
+        result = self._describe(params, data)
+        result['recommendations'] = to_json_value(
+            self.recommend(state['current_wave'], state['prediction'], current_price, params['risk']))
+        return result
+
+    def backtest(self, params):
+        """
+        Endpunkt /backtest: Liefert die Backtest-Kennzahlen und die Trades.
+        """
+        history_key, data = self.load_history(params['symbol'], params['start'], params['end'], params['exchange'])
+        key = (history_key, params['invest'], params['threshold'], params['stop_loss'])
+
+        def compute():
+            results = ElliottWaveAnalyzer(data).backtest(
+                start_date=params['start'],
+                end_date=params['end'],
+                invest_amount=params['invest'],
+                zigzag_threshold=params['threshold'],
+                stop_loss=params['stop_loss']
+            )
+            summary = {name: value for name, value in results.items()
+                       if name not in ('trades', 'equity_curve')}
+            trades = [
+                {
+                    'date': to_json_value(trade.date),
+                    'action': trade.action,
+                    'price': float(trade.price),
+                    'shares': float(trade.shares),
+                    'value': float(trade.value)
+                }
+                for trade in results['trades'].itertuples(index=False)
+            ]
+            return {'backtest_summary': to_json_value(summary), 'trades': trades}
+
+        result = self._describe(params, data)
+        result.update(self.backtests.get_or_compute(key, compute))
+        return result
+
+    def health(self, params):
+        """
+        Endpunkt /health: Liefert Laufzeit und Cache-Statistik.
+        """
+        return {
+            'status': 'ok',
+            'uptime': round(time.time() - self.started, 1),
+            'requests': self.requests,
+            'caches': {
+                'symbols': self.symbols.stats(),
+                'histories': self.histories.stats(),
+                'analyses': self.analyzers.stats(),
+                'backtests': self.backtests.stats()
+            }
+        }
+
+    ROUTES = {
+        '/analyse': 'analyse',
+        '/current-wave': 'current_wave',
+        '/prediction': 'prediction',
+        '/recommendations': 'recommendations',
+        '/backtest': 'backtest',
+        '/health': 'health'
+    }
+
+    def handle(self, path, query, defaults):
+        """
+        Beantwortet eine Anfrage.
+
+        Args:
+            path (str): Pfad der Anfrage (z.B. '/analyse')
+            query (dict): Query-Parameter (Name -> Liste der Werte)
+            defaults (dict): Standardwerte der Parameter
+
+        Returns:
+            dict: JSON-taugliches Ergebnis
+        """
+        method = self.ROUTES.get(path.rstrip('/') or '/')
+        if method is None:
+            raise ServiceError(f"Unbekannter Endpunkt: {path}", status=404)
+
+        with self._requests_lock:
+            self.requests += 1
+        params = parse_params(query, defaults, require_symbol=method != 'health')
+        return getattr(self, method)(params)
+
+def parse_params(query, defaults, require_symbol=True):
+    """
+    Liest und prüft die Anfrageparameter.
+
+    Args:
+        query (dict): Query-Parameter (Name -> Liste der Werte)
+        defaults (dict): Standardwerte für threshold, window, risk, invest und exchange
+        require_symbol (bool): Ob der Parameter symbol erforderlich ist
+
+    Returns:
+        dict: Geprüfte Parameter
+    """
+    def value(name, default=None):
+        values = query.get(name)
+        return values[-1] if values else default
+
+    def number(name, cast, default):
+        raw = value(name)
+        if raw is None or raw == '':
+            return default
+        try:
+            result = cast(raw)
+        except ValueError:
+            raise ServiceError(f"Ungültiger Wert für {name}: {raw}")
+        if not math.isfinite(result):
+            raise ServiceError(f"Ungültiger Wert für {name}: {raw}")
+        return result
+
+    symbol = value('symbol') or defaults.get('symbol')
+    if require_symbol and not symbol:
+        raise ServiceError("Parameter symbol fehlt")
+
+    params = {
+        'symbol': symbol,
+        'start': value('start', defaults.get('start')),
+        'end': value('end', defaults.get('end')),
+        'exchange': value('exchange', defaults.get('exchange')),
+        'threshold': number('threshold', float, defaults['threshold']),
+        'window': number('window', int, defaults['window']),
+        'high_low': value('high_low', '0').lower() in ('1', 'true', 'yes', 'ja'),
+        'risk': number('risk', float, defaults['risk']),
+        'invest': number('invest', float, defaults['invest']),
+        'stop_loss': number('stop_loss', float, None)
+    }
+
+    if params['threshold'] <= 0:
+        raise ServiceError("threshold muss größer als 0 sein")
+    if params['window'] < 1:
+        raise ServiceError("window muss mindestens 1 sein")
+    if params['invest'] <= 0:
+        raise ServiceError("invest muss größer als 0 sein")
+    return params
+
+async def _handle_connection(reader, writer, service, defaults, executor):
+    """
+    Bearbeitet die Anfragen einer HTTP/1.1-Verbindung (mit Keep-Alive).
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except asyncio.LimitOverrunError:
+                await _send(writer, 413, {'error': 'Anfrage zu groß'}, keep_alive=False)
+                return
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+
+            lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, target, version = lines[0].split(' ', 2)
+            except ValueError:
+                await _send(writer, 400, {'error': 'Ungültige Anfragezeile'}, keep_alive=False)
+                return
+
+            headers = {}
+            for line in lines[1:]:
+                name, sep, val = line.partition(':')
+                if sep:
+                    headers[name.strip().lower()] = val.strip()
+
+            # Ein Anfragerumpf wird nicht ausgewertet, muss aber gelesen werden
+            try:
+                length = int(headers.get('content-length') or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                await _send(writer, 400, {'error': 'Ungültiger Content-Length-Header'}, keep_alive=False)
+                return
+            if length > MAX_BODY_BYTES:
+                await _send(writer, 413, {'error': 'Anfrage zu groß'}, keep_alive=False)
+                return
+            if length:
+                try:
+                    await reader.readexactly(length)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+
+            if method not in ('GET', 'HEAD'):
+                status, body = 405, {'error': f"Methode {method} wird nicht unterstützt"}
+            else:
+                url = urlsplit(target)
+                query = parse_qs(url.query)
+                start = time.perf_counter()
+                try:
+                    # Analyse und Download laufen in Threads, damit der Server weitere Anfragen annimmt
+                    body = await loop.run_in_executor(executor, service.handle, url.path, query, defaults)
+                    status = 200
+                except ServiceError as e:
+                    status, body = e.status, {'error': str(e)}
+                except Exception as e:
+                    status, body = 500, {'error': str(e)}
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"{datetime.now().strftime('%H:%M:%S')} {method} {target} {status} {elapsed:.1f} ms")
+
+            await _send(writer, status, body, keep_alive, head_only=method == 'HEAD')
+            if not keep_alive:
+                return
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+async def _send(writer, status, body, keep_alive, head_only=False):
+    payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+    header = (
+        f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        f"\r\n"
+    ).encode('latin-1')
+    writer.write(header if head_only else header + payload)
+    await writer.drain()
+
+async def serve(service, defaults, host='127.0.0.1', port=8765, workers=None):
+    """
+    Startet den HTTP-Server und bearbeitet Anfragen, bis der Task abgebrochen wird.
+
+    Args:
+        service (AnalysisService): Dienst mit den warmen Caches
+        defaults (dict): Standardwerte der Anfrageparameter
+        host (str): Adresse, an die der Server gebunden wird
+        port (int): Port des Servers
+        workers (int, optional): Anzahl der Threads für Analysen und Downloads
+    """
+    executor = ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) + 4))
+    server = await asyncio.start_server(
+        lambda r, w: _handle_connection(r, w, service, defaults, executor),
+        host, port, limit=MAX_HEADER_BYTES
+    )
+    addresses = ', '.join(f"http://{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+    print(f"Analysedienst läuft auf {addresses} (Beenden mit Strg+C)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Vorberechnete Auflösung von Symbolen in Tickersymbole für Yahoo Finance.
+
+Alle Prüfungen (Index, US-Symbol, Börsensuffix) sind Nachschlagen in Hash-Tabellen,
+aufgelöste Symbole werden gespeichert. Für die Autovervollständigung wird ein Präfixbaum
+über alle bekannten Symbole aufgebaut, dessen Knoten auf einen Bereich der sortierten
+Symbolliste zeigen, sodass eine Suche nur von der Länge der Eingabe abhängt.
+
+Das Universum kann um Symbollisten mit zehntausenden Einträgen erweitert werden
+(siehe SymbolResolver.load).
+"""
+
+import threading
+
+class SymbolResolver:
+    """
+    Löst Symbole auf und vervollständigt Eingaben.
+    """
+
+    # Maximale Anzahl gespeicherter Auflösungen, danach wird der Speicher geleert
+    MEMO_SIZE = 100000
+
+    def __init__(self, us_symbols, us_indices, german_symbols, index_symbols, exchanges, default_exchange):
+        """
+        Args:
+            us_symbols (list): Bekannte US-Aktien (Basissymbol ohne Suffix)
+            us_indices (list): Bekannte US-Indizes (z.B. '^GSPC')
+            german_symbols (list): Bekannte deutsche Aktien (Basissymbol ohne Suffix)
+            index_symbols (dict): Indexname -> Tickersymbol (z.B. 'DAX' -> '^GDAXI')
+            exchanges (dict): Börse -> Suffix (z.B. 'XETR' -> '.DE')
+            default_exchange (str): Börse für Symbole ohne Suffix
+        """
+        self.exchanges = dict(exchanges)
+        self.suffixes = frozenset(self.exchanges.values())
+        self.default_suffix = self.exchanges[default_exchange]
+
+        # Indexnamen (auch in Großschreibung) und Tickersymbole der Indizes
+        self.index_symbols = {}
+        for name, ticker in index_symbols.items():
+            self.index_symbols[name] = ticker
+            self.index_symbols[name.upper()] = ticker
+            self.index_symbols[ticker] = ticker
+        self.index_names = list(index_symbols)
+
+        self.us_symbols = set(us_symbols)
+        self.us_indices = set(us_indices)
+        self.german_symbols = set(german_symbols)
+        # Vollständige Tickersymbole aus geladenen Listen, die unverändert übernommen werden
+        self.known = set()
+
+        self._memo = {}
+        self._index = None
+        self._lock = threading.Lock()
+
+    def add(self, symbols, market=None):
+        """
+        Fügt Symbole zum Universum hinzu.
+
+        Args:
+            symbols (iterable): Tickersymbole
+            market (str, optional): 'US' oder 'DE'; ohne Angabe entscheidet das Suffix:
+                                    deutsche Suffixe -> DE, andere Suffixe und '^' -> unverändert,
+                                    ohne Suffix -> US
+
+        Returns:
+            int: Anzahl der hinzugefügten Symbole
+        """
+        count = 0
+        with self._lock:
+            for symbol in symbols:
+                symbol = symbol.strip()
+                if not symbol:
+                    continue
+                count += 1
+                base, dot, suffix = symbol.rpartition('.')
+                has_suffix = bool(dot) and bool(base)
+                market_name = (market or '').upper()
+
+                if market_name == 'US':
+                    self.us_symbols.add(symbol.split('.')[0])
+                elif market_name == 'DE' or (not market_name and has_suffix and f".{suffix}" in self.suffixes):
+                    if has_suffix and f".{suffix}" in self.suffixes:
+                        self.german_symbols.add(base)
+                        self.known.add(symbol)
+                    else:
+                        self.german_symbols.add(symbol)
+                elif has_suffix or symbol.startswith('^'):
+                    self.known.add(symbol)
+                else:
+                    self.us_symbols.add(symbol)
+
+            self._memo.clear()
+            self._index = None
+        return count
+
+    def load(self, path):
+        """
+        Lädt eine Symbolliste in das Universum.
+
+        Unterstützt CSV-Dateien mit der Spalte 'Symbol' (optional 'Market' mit US/DE) und
+        Textdateien mit einem Symbol pro Zeile (optional "Symbol,Markt").
+
+        Args:
+            path (str): Pfad zur Datei
+
+        Returns:
+            int: Anzahl der geladenen Symbole
+        """
+        if path.endswith('.csv'):
+            import pandas as pd
+
+            df = pd.read_csv(path, dtype=str)
+            column = 'Symbol' if 'Symbol' in df.columns else df.columns[0]
+            if 'Market' in df.columns:
+                count = 0
+                for market, group in df.groupby(df['Market'].fillna('')):
+                    count += self.add(group[column].dropna(), market=market or None)
+                return count
+            return self.add(df[column].dropna())
+
+        by_market = {}
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                symbol, _, market = line.partition(',')
+                by_market.setdefault(market.strip() or None, []).append(symbol)
+        return sum(self.add(symbols, market=market) for market, symbols in by_market.items())
+
+    def is_german_index(self, symbol):
+        """
+        Returns:
+            bool: True, wenn symbol ein deutscher Indexname oder Index-Tickersymbol ist
+        """
+        return symbol in self.index_symbols
+
+    def is_us_symbol(self, symbol):
+        """
+        Returns:
+            bool: True, wenn symbol eine bekannte US-Aktie oder ein Index ('^...') ist
+        """
+        return (symbol.split('.')[0] in self.us_symbols or
+                symbol in self.us_indices or
+                symbol.startswith('^'))
+
+    def has_exchange_suffix(self, symbol):
+        """
+        Returns:
+            bool: True, wenn symbol bereits auf das Suffix einer deutschen Börse endet
+        """
+        dot = symbol.rfind('.')
+        return dot > 0 and symbol[dot:] in self.suffixes
+
+    def format_german_symbol(self, symbol, exchange=None):
+        """
+        Ergänzt das Börsensuffix für deutsche Aktien.
+
+        Args:
+            symbol (str): Basissymbol (z.B. 'SAP')
+            exchange (str, optional): Börse (z.B. 'XETR', 'FRA')
+
+        Returns:
+            str: Symbol mit Suffix (z.B. 'SAP.DE'), US-Symbole und Symbole mit Suffix unverändert
+        """
+        if self.is_us_symbol(symbol) or self.has_exchange_suffix(symbol):
+            return symbol
+        return f"{symbol}{self.exchanges.get(exchange, self.default_suffix)}"
+
+    def resolve(self, symbol, exchange=None):
+        """
+        Wandelt ein eingegebenes Symbol in das Tickersymbol für Yahoo Finance um.
+
+        Args:
+            symbol (str): Tickersymbol oder Indexname (z.B. 'SAP', 'DAX', 'AAPL')
+            exchange (str, optional): Deutsche Börse (z.B. 'XETR', 'FRA')
+
+        Returns:
+            str: Aufgelöstes Tickersymbol (z.B. 'SAP.DE', '^GDAXI', 'AAPL')
+        """
+        key = (symbol, exchange)
+        resolved = self._memo.get(key)
+        if resolved is not None:
+            return resolved
+
+        resolved = self.index_symbols.get(symbol)
+        if resolved is None:
+            if symbol in self.known:
+                resolved = symbol
+            else:
+                resolved = self.format_german_symbol(symbol, exchange)
+
+        if len(self._memo) >= self.MEMO_SIZE:
+            self._memo.clear()
+        self._memo[key] = resolved
+        return resolved
+
+    def resolve_many(self, symbols, exchange=None):
+        """
+        Löst viele Symbole auf.
+
+        Args:
+            symbols (iterable): Tickersymbole oder Indexnamen
+            exchange (str, optional): Deutsche Börse
+
+        Returns:
+            dict: Dictionary {Eingabe: aufgelöstes Tickersymbol}
+        """
+        return {symbol: self.resolve(symbol, exchange) for symbol in symbols}
+
+    def _build_index(self):
+        """
+        Baut die sortierte Symbolliste und den Präfixbaum auf.
+
+        Jeder Knoten ist eine Liste [Kinder, Beginn, Ende]; Beginn und Ende begrenzen den Bereich
+        der sortierten Liste, dessen Einträge mit dem Pfad zum Knoten beginnen.
+        """
+        entries = set(self.us_symbols) | self.us_indices | self.german_symbols | set(self.index_names) | self.known
+        symbols = sorted(entries, key=lambda s: (s.upper(), s))
+
+        root = [{}, 0, len(symbols)]
+        for i, symbol in enumerate(symbols):
+            node = root
+            for char in symbol.upper():
+                child = node[0].get(char)
+                if child is None:
+                    child = node[0][char] = [{}, i, i + 1]
+                else:
+                    child[2] = i + 1
+                node = child
+        return symbols, root
+
+    def _get_index(self):
+        with self._lock:
+            if self._index is None:
+                self._index = self._build_index()
+            return self._index
+
+    @property
+    def symbols(self):
+        """
+        Returns:
+            list: Alle bekannten Symbole und Indexnamen, alphabetisch sortiert
+        """
+        return self._get_index()[0]
+
+    def complete(self, prefix, limit=50):
+        """
+        Liefert die Symbole, die mit der Eingabe beginnen (ohne Beachtung der Groß-/Kleinschreibung).
+
+        Args:
+            prefix (str): Bisherige Eingabe
+            limit (int): Maximale Anzahl der Vorschläge
+
+        Returns:
+            list: Alphabetisch sortierte Vorschläge
+        """
+        symbols, node = self._get_index()
+        for char in prefix.strip().upper():
+            node = node[0].get(char)
+            if node is None:
+                return []
+        return symbols[node[1]:min(node[2], node[1] + limit)]
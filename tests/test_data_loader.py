@@ -0,0 +1,113 @@
+import json
+
+import pandas as pd
+import pytest
+
+from data_loader import DataLoader
+
+
+def test_missing_ranges_inside_cache():
+    assert DataLoader._missing_ranges('2020-01-01', '2021-01-01', '2020-03-01', '2020-06-01') == []
+
+
+def test_missing_ranges_before_and_after():
+    gaps = DataLoader._missing_ranges('2020-01-01', '2021-01-01', '2019-06-01', '2021-03-01')
+    assert gaps == [('2019-06-01', '2020-01-01'), ('2021-01-01', '2021-03-01')]
+
+
+def test_missing_ranges_open_start():
+    # Ohne Startdatum fehlt die Historie vor dem Cache, außer der Cache beginnt selbst am Anfang
+    assert DataLoader._missing_ranges('2020-01-01', '2021-01-01', None, '2020-06-01') == [(None, '2020-01-01')]
+    assert DataLoader._missing_ranges(None, '2021-01-01', None, '2020-06-01') == []
+
+
+def test_missing_ranges_without_end_loads_everything():
+    assert DataLoader._missing_ranges('2020-01-01', None, '2020-03-01', '2020-06-01') == [('2020-03-01', '2020-06-01')]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLoader, 'CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+def _write_cache(symbol, meta):
+    data_path, meta_path = DataLoader._cache_paths(symbol)
+    index = pd.date_range('2020-01-01', periods=5, name='Date')
+    pd.DataFrame({'Close': range(5)}, index=index).to_parquet(data_path)
+    with open(meta_path, 'w') as f:
+        f.write(meta if isinstance(meta, str) else json.dumps(meta))
+
+
+@pytest.mark.parametrize('meta', [{'start': '2020-01-01'}, {'end': '2020-01-06'}, '{"start": "2020-', '[]'])
+def test_incomplete_cache_meta_is_treated_as_no_cache(cache_dir, meta):
+    _write_cache('TEST', meta)
+    assert DataLoader._cache_gaps('TEST', '2020-01-01', '2020-01-06') == [('2020-01-01', '2020-01-06')]
+
+    calls = []
+    index = pd.date_range('2020-01-01', periods=5, name='Date')
+
+    def download(symbol, start, end):
+        calls.append((start, end))
+        return pd.DataFrame({'Close': range(5)}, index=index)
+
+    df = DataLoader._load_with_cache('TEST', '2020-01-01', '2020-01-06', download=download)
+    assert calls == [('2020-01-01', '2020-01-06')]
+    assert len(df) == 5
+    assert DataLoader._cache_gaps('TEST', '2020-01-01', '2020-01-06') == []
+
+
+def test_cache_only_downloads_missing_range(cache_dir):
+    _write_cache('TEST', {'start': '2020-01-01', 'end': '2020-01-06'})
+    calls = []
+
+    def download(symbol, start, end):
+        calls.append((start, end))
+        return pd.DataFrame({'Close': [5.0]}, index=pd.DatetimeIndex(['2020-01-06'], name='Date'))
+
+    df = DataLoader._load_with_cache('TEST', '2020-01-01', '2020-01-08', download=download)
+    assert calls == [('2020-01-06', '2020-01-08')]
+    assert len(df) == 6
+
+
+def test_future_end_does_not_mark_cache_complete(cache_dir, monkeypatch):
+    monkeypatch.setattr(DataLoader, '_cache_horizon', staticmethod(lambda: '2020-01-06'))
+    calls = []
+
+    def download(symbol, start, end):
+        calls.append((start, end))
+        index = pd.date_range(start or '2020-01-01', min(end, DataLoader._cache_horizon()),
+                              inclusive='left', name='Date')
+        return pd.DataFrame({'Close': range(len(index))}, index=index)
+
+    DataLoader._load_with_cache('TEST', '2020-01-01', '2027-01-01', download=download)
+    assert DataLoader._read_cache_meta(DataLoader._cache_paths('TEST')[1]) == ('2020-01-01', '2020-01-06')
+
+    # Am nächsten Tag werden die neuen Bars nachgeladen
+    monkeypatch.setattr(DataLoader, '_cache_horizon', staticmethod(lambda: '2020-01-08'))
+    df = DataLoader._load_with_cache('TEST', '2020-01-01', '2020-01-08', download=download)
+    assert calls[-1] == ('2020-01-06', '2020-01-08')
+    assert df.index[-1] == pd.Timestamp('2020-01-07')
+
+
+def test_future_end_in_existing_meta_is_capped(cache_dir, monkeypatch):
+    monkeypatch.setattr(DataLoader, '_cache_horizon', staticmethod(lambda: '2020-01-06'))
+    _write_cache('TEST', {'start': '2020-01-01', 'end': '2027-01-01'})
+    assert DataLoader._cache_gaps('TEST', '2020-01-01', '2020-01-08') == [('2020-01-06', '2020-01-08')]
+
+
+def test_download_batch_leaves_out_failed_tickers(monkeypatch):
+    import yahoo_http
+
+    index = pd.date_range('2020-01-01', periods=3, name='Date')
+    columns = pd.MultiIndex.from_product([['Close'], ['AAA', 'BBB', 'CCC', 'DDD']], names=['Price', 'Ticker'])
+    df = pd.DataFrame(float('nan'), index=index, columns=columns)
+    df[('Close', 'AAA')] = [1.0, 2.0, 3.0]
+    errors = {'BBB': yahoo_http.NOT_FOUND, 'CCC': yahoo_http.FATAL, 'DDD': yahoo_http.RATE_LIMIT}
+    monkeypatch.setattr(yahoo_http, 'download', lambda tickers, **kwargs: (df, errors))
+
+    frames = DataLoader._download_batch(['AAA', 'BBB', 'CCC', 'DDD'], '2020-01-01', '2020-01-04')
+    # Nur Ticker mit Daten oder ohne Daten bei NOT_FOUND sind enthalten, alle anderen werden einzeln geladen
+    assert sorted(frames) == ['AAA', 'BBB']
+    assert len(frames['AAA']) == 3
+    assert frames['BBB'].empty
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from elliott_wave.synthetic import generate_ohlcv, generate_prices
+from providers import ReplayProvider
+
+
+@pytest.mark.parametrize('model', ['gbm', 'random_walk'])
+def test_synthetic_prefix_independent_of_length(model):
+    short = generate_ohlcv(6990, model=model, seed=42)
+    for n_bars in (7100, 8000):
+        longer = generate_ohlcv(n_bars, model=model, seed=42)
+        pd.testing.assert_frame_equal(longer.iloc[:len(short)], short)
+
+
+def test_synthetic_seed_changes_series():
+    assert not np.array_equal(generate_prices(500, seed=1), generate_prices(500, seed=2))
+
+
+def test_replay_history_is_deterministic():
+    provider = ReplayProvider()
+    before = provider.history('SAP.DE', '2020-01-01', '2020-02-01')
+    # Eine Anfrage mit späterem Ende verlängert die Reihe, ändert aber keine früheren Bars
+    provider.history('SAP.DE', '2020-01-01', '2035-01-01')
+    after = provider.history('SAP.DE', '2020-01-01', '2020-02-01')
+    pd.testing.assert_frame_equal(before, after)
+    pd.testing.assert_frame_equal(before, ReplayProvider().history('SAP.DE', '2020-01-01', '2020-02-01'))
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from service import _LRUCache, ServiceError, parse_params
+
+DEFAULTS = {'threshold': 0.03, 'window': 10, 'risk': 0.02, 'invest': 10000}
+
+
+def test_cache_hit_and_miss():
+    cache = _LRUCache(4)
+    calls = []
+    assert cache.get_or_compute('a', lambda: calls.append(1) or 1) == 1
+    assert cache.get_or_compute('a', lambda: calls.append(1) or 2) == 1
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = _LRUCache(2)
+    cache.get_or_compute('a', lambda: 'A')
+    cache.get_or_compute('b', lambda: 'B')
+    cache.get_or_compute('a', lambda: 'A2')
+    cache.get_or_compute('c', lambda: 'C')
+    assert list(cache.entries) == ['a', 'c']
+
+
+def test_cache_recomputes_stale_values():
+    cache = _LRUCache(2)
+    cache.get_or_compute('a', lambda: 1)
+    assert cache.get_or_compute('a', lambda: 2, is_fresh=lambda value: value > 1) == 2
+    assert cache.get_or_compute('a', lambda: 3, is_fresh=lambda value: value > 1) == 2
+
+
+def test_cache_failed_compute_is_not_stored():
+    cache = _LRUCache(2)
+
+    def fail():
+        raise RuntimeError('Download fehlgeschlagen')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute('a', fail)
+    assert cache.get_or_compute('a', lambda: 1) == 1
+    assert cache.pending == {}
+
+
+def test_cache_coalesces_concurrent_computations():
+    cache = _LRUCache(4)
+    calls = []
+    start = threading.Barrier(8)
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return 'wert'
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(cache.get_or_compute('a', compute))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ['wert'] * 8
+    assert len(calls) == 1
+
+
+def test_parse_params_defaults_and_values():
+    params = parse_params({'symbol': ['SAP'], 'threshold': ['0.05'], 'window': ['20'], 'high_low': ['ja']}, DEFAULTS)
+    assert params['symbol'] == 'SAP'
+    assert params['threshold'] == 0.05
+    assert params['window'] == 20
+    assert params['high_low'] is True
+    assert params['risk'] == DEFAULTS['risk']
+    assert params['stop_loss'] is None
+
+
+def test_parse_params_uses_last_value():
+    assert parse_params({'symbol': ['SAP', 'BMW']}, DEFAULTS)['symbol'] == 'BMW'
+
+
+def test_parse_params_symbol_required():
+    with pytest.raises(ServiceError):
+        parse_params({}, DEFAULTS)
+    assert parse_params({}, DEFAULTS, require_symbol=False)['symbol'] is None
+
+
+@pytest.mark.parametrize('name, value', [
+    ('threshold', 'nan'),
+    ('threshold', 'inf'),
+    ('threshold', '0'),
+    ('threshold', 'abc'),
+    ('window', '0'),
+    ('window', '1.5'),
+    ('invest', '-100'),
+    ('risk', 'nan'),
+    ('stop_loss', '-inf'),
+])
+def test_parse_params_rejects_invalid_values(name, value):
+    with pytest.raises(ServiceError) as info:
+        parse_params({'symbol': ['SAP'], name: [value]}, DEFAULTS)
+    assert info.value.status == 400
@@ -0,0 +1,86 @@
+import pytest
+
+from symbol_resolver import SymbolResolver
+
+
+@pytest.fixture
+def resolver():
+    return SymbolResolver(
+        us_symbols=['AAPL', 'AMZN', 'MSFT'],
+        us_indices=['^GSPC', '^DJI'],
+        german_symbols=['SAP', 'SIE', 'BMW'],
+        index_symbols={'DAX': '^GDAXI', 'MDAX': '^MDAXI'},
+        exchanges={'XETR': '.DE', 'FRA': '.F'},
+        default_exchange='XETR'
+    )
+
+
+@pytest.mark.parametrize('symbol, exchange, expected', [
+    ('SAP', None, 'SAP.DE'),
+    ('SAP', 'FRA', 'SAP.F'),
+    ('SAP.DE', 'FRA', 'SAP.DE'),
+    ('BMW.F', None, 'BMW.F'),
+    ('AAPL', None, 'AAPL'),
+    ('AAPL', 'XETR', 'AAPL'),
+    ('DAX', None, '^GDAXI'),
+    ('dax', None, 'dax.DE'),
+    ('^GDAXI', None, '^GDAXI'),
+    ('^GSPC', None, '^GSPC'),
+    ('UNKNOWN', None, 'UNKNOWN.DE'),
+    ('ABC', 'XYZ', 'ABC.DE'),
+])
+def test_resolve(resolver, symbol, exchange, expected):
+    assert resolver.resolve(symbol, exchange) == expected
+    # Zweiter Aufruf kommt aus dem Speicher und liefert dasselbe
+    assert resolver.resolve(symbol, exchange) == expected
+
+
+def test_add_invalidates_memo(resolver):
+    assert resolver.resolve('NVDA') == 'NVDA.DE'
+    assert resolver.add(['NVDA'], market='US') == 1
+    assert resolver.resolve('NVDA') == 'NVDA'
+
+
+def test_add_classifies_by_suffix(resolver):
+    resolver.add(['ADS.DE', '7203.T', '^N225', 'TSLA'])
+    assert resolver.resolve('ADS') == 'ADS.DE'
+    assert resolver.resolve('7203.T') == '7203.T'
+    assert resolver.resolve('^N225') == '^N225'
+    assert resolver.resolve('TSLA') == 'TSLA'
+
+
+def test_load_text_file(resolver, tmp_path):
+    path = tmp_path / 'symbols.txt'
+    path.write_text("# Kommentar\nNVDA\nADS,DE\n\n")
+    assert resolver.load(str(path)) == 2
+    # Ohne Markt und Suffix gilt ein Symbol als US-Aktie
+    assert resolver.resolve('NVDA') == 'NVDA'
+    assert resolver.resolve('ADS') == 'ADS.DE'
+
+
+def test_complete_prefix_case_insensitive(resolver):
+    assert resolver.complete('a') == ['AAPL', 'AMZN']
+    assert resolver.complete('S') == ['SAP', 'SIE']
+    assert resolver.complete(' md') == ['MDAX']
+    assert resolver.complete('^G') == ['^GSPC']
+    assert resolver.complete('XYZ') == []
+
+
+def test_complete_empty_prefix_and_limit(resolver):
+    assert resolver.complete('') == resolver.symbols[:50]
+    assert resolver.complete('', limit=3) == resolver.symbols[:3]
+    assert resolver.complete('A', limit=1) == ['AAPL']
+
+
+def test_complete_sees_added_symbols(resolver):
+    resolver.complete('A')
+    resolver.add(['ADS.DE', 'ABNB'])
+    assert resolver.complete('A') == ['AAPL', 'ABNB', 'ADS', 'ADS.DE', 'AMZN']
+
+
+def test_complete_matches_linear_filter(resolver):
+    resolver.add([f"S{i:04d}" for i in range(2000)] + [f"SA{i}" for i in range(50)])
+    symbols = resolver.symbols
+    for prefix in ['S', 'SA', 'S00', 'S19', 'SA4', 'SI', 's0']:
+        expected = [s for s in symbols if s.upper().startswith(prefix.upper())][:50]
+        assert resolver.complete(prefix) == expected
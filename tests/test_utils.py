@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from elliott_wave.utils import find_local_extrema, reduce_to_pivots, zigzag_filter
+
+
+def _random_series(rng, n_bars):
+    prices = np.cumsum(rng.normal(0, 1, n_bars)) + 200
+    # Plateaus durch Runden und vereinzelte NaN, an denen die Fensterlogik am ehesten abweicht
+    prices = np.round(prices, int(rng.integers(0, 2)))
+    if rng.random() < 0.3:
+        prices[rng.integers(0, n_bars, 3)] = np.nan
+    return prices
+
+
+def test_find_local_extrema_matches_argrelextrema():
+    signal = pytest.importorskip('scipy.signal')
+    rng = np.random.default_rng(14)
+    for _ in range(150):
+        prices = _random_series(rng, int(rng.integers(1, 400)))
+        window = int(rng.integers(1, 25))
+        maxima, minima = find_local_extrema(prices, window=window)
+        np.testing.assert_array_equal(maxima, signal.argrelextrema(prices, np.greater, order=window)[0])
+        np.testing.assert_array_equal(minima, signal.argrelextrema(prices, np.less, order=window)[0])
+
+
+def test_find_local_extrema_uses_highs_and_lows():
+    signal = pytest.importorskip('scipy.signal')
+    rng = np.random.default_rng(15)
+    close = np.cumsum(rng.normal(0, 1, 300)) + 200
+    highs = close + rng.random(300)
+    lows = close - rng.random(300)
+    maxima, minima = find_local_extrema(close, window=5, highs=highs, lows=lows)
+    np.testing.assert_array_equal(maxima, signal.argrelextrema(highs, np.greater, order=5)[0])
+    np.testing.assert_array_equal(minima, signal.argrelextrema(lows, np.less, order=5)[0])
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 250, 1000])
+@pytest.mark.parametrize('threshold', [0.01, 0.05])
+def test_reduce_to_pivots_matches_zigzag_filter(chunk_size, threshold):
+    rng = np.random.default_rng(19)
+    prices = np.cumsum(rng.normal(0, 1, 600)) + 300
+    df = pd.DataFrame({'Close': prices}, index=pd.date_range('2020-01-01', periods=len(prices), freq='min'))
+
+    reduced = reduce_to_pivots((df.iloc[i:i + chunk_size] for i in range(0, len(df), chunk_size)),
+                               threshold=threshold, tail_bars=60)
+
+    # Bar-Spalte verweist auf die Positionen in der vollen Reihe, Zeilen bleiben unverändert
+    bars = reduced['Bar'].to_numpy()
+    np.testing.assert_array_equal(reduced['Close'].to_numpy(), prices[bars])
+    assert list(reduced.index) == list(df.index[bars])
+
+    # Alle Wendepunkte der vollen Reihe und die letzten Bars sind enthalten
+    pivots = zigzag_filter(prices, threshold=threshold)
+    assert set(pivots) <= set(bars)
+    assert set(range(len(prices) - 60, len(prices))) <= set(bars)
+
+    # Der ZigZag-Filter liefert auf der reduzierten Reihe dieselben Wendepunkte
+    assert [int(bars[i]) for i in zigzag_filter(reduced['Close'].to_numpy(), threshold=threshold)] == pivots
+
+
+def test_reduce_to_pivots_empty():
+    assert reduce_to_pivots(iter([])).empty
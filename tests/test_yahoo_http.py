@@ -0,0 +1,118 @@
+import pytest
+
+import yahoo_http
+from yahoo_http import TokenBucket, classify, FetchError
+
+
+class FakeClock:
+    """Ersetzt time.monotonic und time.sleep, damit der Token-Bucket ohne Warten geprüft werden kann."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(yahoo_http.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(yahoo_http.time, 'sleep', clock.sleep)
+    return clock
+
+
+def test_burst_is_free_then_rate_applies(clock):
+    bucket = TokenBucket(rate=2, burst=4)
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.slept == 0
+    bucket.acquire()
+    assert clock.slept == pytest.approx(0.5)
+
+
+def test_batch_cost_above_burst_is_charged_in_full(clock):
+    bucket = TokenBucket(rate=10, burst=5)
+    bucket.acquire(50)
+    # 5 Token sind sofort verfügbar, die übrigen 45 kommen mit 10 pro Sekunde nach
+    assert clock.slept == pytest.approx(4.5)
+
+
+def test_penalize_blocks_all_requests(clock):
+    bucket = TokenBucket(rate=100, burst=10)
+    bucket.penalize(3)
+    bucket.acquire()
+    assert clock.slept >= 3
+
+
+def test_zero_rate_is_unlimited(clock):
+    bucket = TokenBucket(rate=0, burst=1)
+    bucket.acquire(1000)
+    assert clock.slept == 0
+
+
+@pytest.mark.parametrize('message, category', [
+    ('HTTP Error 429: Too Many Requests', yahoo_http.RATE_LIMIT),
+    ('429 Client Error: Too Many Requests for url', yahoo_http.RATE_LIMIT),
+    ('Rate limited. Try after a while.', yahoo_http.RATE_LIMIT),
+    ('HTTP Error 404: Not Found', yahoo_http.NOT_FOUND),
+    ('$XYZ: possibly delisted; no price data found (period=500d)', yahoo_http.NOT_FOUND),
+    ('status code: 503', yahoo_http.TRANSIENT),
+    ('502 Server Error: Bad Gateway', yahoo_http.TRANSIENT),
+    ('Failed to perform, curl: (28) Operation timed out', yahoo_http.TRANSIENT),
+    # Zahlen in Zeiträumen oder Symbolen sind keine Statuscodes
+    ('invalid period 500d', yahoo_http.FATAL),
+    ('unexpected value for 5020.T', yahoo_http.FATAL),
+])
+def test_classify_messages(message, category):
+    assert classify(message) == category
+
+
+def test_classify_exceptions():
+    assert classify(ConnectionError('reset by peer')) == yahoo_http.TRANSIENT
+    assert classify(TimeoutError()) == yahoo_http.TRANSIENT
+    assert classify(FetchError('SAP.DE', yahoo_http.NOT_FOUND, 'weg')) == yahoo_http.NOT_FOUND
+    assert classify(ValueError('kaputt')) == yahoo_http.FATAL
+
+
+def test_classify_uses_response_status():
+    class Response:
+        status_code = 429
+
+    error = RuntimeError('request failed')
+    error.response = Response()
+    assert classify(error) == yahoo_http.RATE_LIMIT
+
+
+def test_call_retries_transient_errors(clock, monkeypatch):
+    monkeypatch.setattr(yahoo_http, '_limiter', TokenBucket(rate=0, burst=1))
+    attempts = []
+
+    def fetch():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError('connection reset')
+        return 'ok'
+
+    assert yahoo_http.call(fetch, 'SAP.DE', retries=3) == 'ok'
+    assert len(attempts) == 3
+
+
+def test_call_does_not_retry_not_found(clock, monkeypatch):
+    monkeypatch.setattr(yahoo_http, '_limiter', TokenBucket(rate=0, burst=1))
+    attempts = []
+
+    def fetch():
+        attempts.append(1)
+        raise ValueError('No data found, symbol may be delisted')
+
+    with pytest.raises(FetchError) as info:
+        yahoo_http.call(fetch, 'XYZ', retries=3)
+    assert info.value.category == yahoo_http.NOT_FOUND
+    assert info.value.attempts == 1
+    assert len(attempts) == 1
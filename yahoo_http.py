@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gemeinsame Verbindungsschicht für alle Anfragen an Yahoo Finance.
+
+Alle Abrufe laufen über eine gemeinsame HTTP-Sitzung mit Keep-Alive, werden durch einen
+Token-Bucket auf eine einstellbare Anfragerate begrenzt und bei vorübergehenden Fehlern
+(Rate-Limit, Zeitüberschreitung, Verbindungsabbruch, Serverfehler) mit exponentiell
+wachsender, zufällig gestreuter Wartezeit wiederholt. Fehler werden je Symbol eingeordnet,
+damit Massenabrufe unbekannte Symbole überspringen, statt sie erneut anzufragen.
+
+Einstellungen über Umgebungsvariablen:
+    EW_YAHOO_RATE      Anfragen pro Sekunde (Standard: 4)
+    EW_YAHOO_BURST     Anfragen, die ohne Wartezeit gebündelt werden dürfen (Standard: 10)
+    EW_YAHOO_RETRIES   Wiederholungen nach einem vorübergehenden Fehler (Standard: 4)
+"""
+
+import os
+import random
+import re
+import threading
+import time
+
+# Fehlerkategorien
+RATE_LIMIT = 'rate_limit'
+TRANSIENT = 'transient'
+NOT_FOUND = 'not_found'
+FATAL = 'fatal'
+
+# Kategorien, bei denen ein erneuter Versuch sinnvoll ist
+RETRYABLE = (RATE_LIMIT, TRANSIENT)
+
+CATEGORY_LABELS = {
+    RATE_LIMIT: 'Rate-Limit',
+    TRANSIENT: 'vorübergehend',
+    NOT_FOUND: 'nicht gefunden',
+    FATAL: 'Fehler'
+}
+
+# Merkmale in Fehlermeldungen von yfinance und curl, falls der Ausnahmetyp nicht eindeutig ist
+_RATE_LIMIT_MARKERS = ('too many requests', 'rate limit')
+_NOT_FOUND_MARKERS = ('delisted', 'no data found', 'no price data', 'no timezone found',
+                      'not found', 'symbol may be', 'quote not found')
+_TRANSIENT_MARKERS = ('timed out', 'timeout', 'connection', 'temporarily', 'curl: (',
+                      'bad gateway', 'service unavailable', 'gateway timeout', 'internal server error')
+
+# HTTP-Statuscode in Meldungen wie "HTTP Error 429", "status code: 503" oder "404 Client Error",
+# damit Zahlen in Zeiträumen oder Symbolen nicht als Statuscode gelten
+_HTTP_STATUS_PATTERN = re.compile(
+    r'\b(?:http(?:\s+error)?|status(?:\s+code)?|response\s+code)\W{0,3}([1-5]\d\d)\b'
+    r'|\b([1-5]\d\d)\s+(?:client|server)\s+error')
+
+BASE_DELAY = 1.0
+MAX_DELAY = 30.0
+
+class FetchError(Exception):
+    """
+    Eingeordneter Fehler beim Abruf eines Symbols.
+
+    Attributes:
+        symbol (str): Betroffenes Symbol
+        category (str): RATE_LIMIT, TRANSIENT, NOT_FOUND oder FATAL
+        attempts (int): Anzahl der durchgeführten Versuche
+        message (str): Fehlermeldung ohne Kategorie
+    """
+
+    def __init__(self, symbol, category, message, attempts=1):
+        super().__init__(f"[{CATEGORY_LABELS[category]}] {message}")
+        self.message = message
+        self.symbol = symbol
+        self.category = category
+        self.attempts = attempts
+
+    @property
+    def retryable(self):
+        return self.category in RETRYABLE
+
+class TokenBucket:
+    """
+    Threadsicherer Token-Bucket: erlaubt im Mittel rate Anfragen pro Sekunde und
+    Spitzen von bis zu burst Anfragen.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1):
+        """
+        Wartet, bis tokens Anfragen erlaubt sind, und verbraucht sie.
+
+        Mehr als burst Anfragen (z.B. ein Massendownload) werden in Portionen von höchstens
+        burst verbraucht, sodass die volle Anzahl auf die Anfragerate angerechnet wird.
+
+        Args:
+            tokens (int): Anzahl der Anfragen
+        """
+        if self.rate <= 0:
+            return
+        remaining = tokens
+        while remaining > 0:
+            portion = min(remaining, self.burst)
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= portion:
+                    self.tokens -= portion
+                    remaining -= portion
+                    continue
+                wait = max(self.blocked_until - now, (portion - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def penalize(self, seconds):
+        """
+        Sperrt alle Anfragen für die angegebene Zeit, z.B. nach einer Rate-Limit-Antwort.
+
+        Args:
+            seconds (float): Dauer der Sperre in Sekunden
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + seconds)
+            self.tokens = 0.0
+            self.updated = now
+
+_limiter = TokenBucket(float(os.getenv('EW_YAHOO_RATE', '4')), int(os.getenv('EW_YAHOO_BURST', '10')))
+_max_retries = int(os.getenv('EW_YAHOO_RETRIES', '4'))
+_session = None
+_session_lock = threading.Lock()
+
+def configure(rate=None, burst=None, retries=None):
+    """
+    Ändert Anfragerate, Burst und Anzahl der Wiederholungen.
+
+    Args:
+        rate (float, optional): Anfragen pro Sekunde (0 = unbegrenzt)
+        burst (int, optional): Anfragen, die ohne Wartezeit gebündelt werden dürfen
+        retries (int, optional): Wiederholungen nach einem vorübergehenden Fehler
+    """
+    global _limiter, _max_retries
+    if rate is not None or burst is not None:
+        _limiter = TokenBucket(_limiter.rate if rate is None else rate,
+                               _limiter.burst if burst is None else burst)
+    if retries is not None:
+        _max_retries = retries
+
+def get_session():
+    """
+    Liefert die gemeinsame HTTP-Sitzung für yfinance.
+
+    yfinance hält intern genau eine Sitzung für alle Abrufe. Indem immer dieselbe Sitzung
+    übergeben wird, bleiben deren Verbindungen über alle Downloads, Ticker-Objekte und
+    Threads hinweg offen und werden wiederverwendet.
+
+    Returns:
+        curl_cffi.requests.Session: Sitzung oder None, wenn curl_cffi nicht installiert ist
+                                    (yfinance verwendet dann seine eigene Sitzung)
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            try:
+                from curl_cffi import requests as curl_requests
+            except ImportError:
+                return None
+            _session = curl_requests.Session(impersonate='chrome')
+        return _session
+
+def classify(error):
+    """
+    Ordnet einen Fehler beim Abruf einer Kategorie zu.
+
+    Args:
+        error (Exception oder str): Ausnahme oder Fehlermeldung
+
+    Returns:
+        str: RATE_LIMIT, TRANSIENT, NOT_FOUND oder FATAL
+    """
+    if isinstance(error, FetchError):
+        return error.category
+
+    name = type(error).__name__ if isinstance(error, BaseException) else ''
+    if name == 'YFRateLimitError':
+        return RATE_LIMIT
+    if name in ('YFTickerMissingError', 'YFTzMissingError', 'YFPricesMissingError'):
+        return NOT_FOUND
+
+    message = str(error).lower()
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if not isinstance(status, int):
+        match = _HTTP_STATUS_PATTERN.search(message)
+        status = int(match.group(1) or match.group(2)) if match else None
+    if status == 429:
+        return RATE_LIMIT
+    if status == 404:
+        return NOT_FOUND
+    if status is not None and status >= 500:
+        return TRANSIENT
+
+    if any(marker in message for marker in _RATE_LIMIT_MARKERS):
+        return RATE_LIMIT
+    if any(marker in message for marker in _NOT_FOUND_MARKERS):
+        return NOT_FOUND
+    if isinstance(error, (TimeoutError, ConnectionError)) or any(marker in message for marker in _TRANSIENT_MARKERS):
+        return TRANSIENT
+    # Übrige Netzwerkfehler (z.B. von curl) sind OSError und meist vorübergehend
+    if isinstance(error, OSError):
+        return TRANSIENT
+    return FATAL
+
+def backoff_delay(attempt, category=TRANSIENT):
+    """
+    Wartezeit vor dem nächsten Versuch (exponentiell mit voller Streuung).
+
+    Args:
+        attempt (int): Nummer des fehlgeschlagenen Versuchs (ab 0)
+        category (str): Kategorie des Fehlers, nach einem Rate-Limit wird länger gewartet
+
+    Returns:
+        float: Wartezeit in Sekunden
+    """
+    base = BASE_DELAY * (4 if category == RATE_LIMIT else 1)
+    return random.uniform(0, min(MAX_DELAY, base * 2 ** attempt))
+
+def call(func, symbol, cost=1, retries=None):
+    """
+    Führt einen Abruf mit Ratenbegrenzung und Wiederholung bei vorübergehenden Fehlern aus.
+
+    Args:
+        func (callable): Funktion ohne Argumente, die den Abruf durchführt
+        symbol (str): Symbol für Fehlermeldungen
+        cost (int): Anzahl der HTTP-Anfragen, die der Abruf verursacht
+        retries (int, optional): Wiederholungen (Standard: EW_YAHOO_RETRIES)
+
+    Returns:
+        Rückgabewert von func
+
+    Raises:
+        FetchError: Wenn der Abruf endgültig fehlschlägt
+    """
+    retries = _max_retries if retries is None else retries
+    for attempt in range(retries + 1):
+        _limiter.acquire(cost)
+        try:
+            return func()
+        except Exception as e:
+            category = classify(e)
+            if category not in RETRYABLE or attempt == retries:
+                raise FetchError(symbol, category, getattr(e, 'message', str(e)), attempts=attempt + 1) from e
+
+            delay = backoff_delay(attempt, category)
+            if category == RATE_LIMIT:
+                # Alle Threads pausieren, statt den Endpunkt weiter zu belasten
+                _limiter.penalize(delay)
+            print(f"Fehler bei {symbol} [{CATEGORY_LABELS[category]}]: {getattr(e, 'message', str(e))}, "
+                  f"Versuch {attempt + 2} von {retries + 1} in {delay:.1f} s")
+            time.sleep(delay)
+
+def _download_errors(tickers):
+    """Liefert die von yf.download gesammelten Fehler je Ticker (yfinance wirft dort keine Ausnahmen)."""
+    try:
+        import yfinance.shared as shared
+        return {ticker: shared._ERRORS[ticker] for ticker in tickers if ticker in shared._ERRORS}
+    except (ImportError, AttributeError):
+        return {}
+
+def download(tickers, retries=None, **kwargs):
+    """
+    Ruft yf.download über die gemeinsame Sitzung mit Ratenbegrenzung und Wiederholung auf.
+
+    Bei einem einzelnen Ticker ohne Daten wird der von yfinance gemeldete Fehler
+    eingeordnet; vorübergehende Fehler werden wiederholt, übrige als FetchError gemeldet.
+
+    Args:
+        tickers (str oder list): Ein Ticker oder eine Liste von Tickern
+        retries (int, optional): Wiederholungen (Standard: EW_YAHOO_RETRIES)
+        **kwargs: Weitere Argumente für yf.download (start, end, threads, ...)
+
+    Returns:
+        tuple: (DataFrame wie von yf.download, Dictionary {Ticker: Kategorie} für Ticker
+               mit gemeldetem Fehler)
+    """
+    import yfinance as yf
+
+    names = [tickers] if isinstance(tickers, str) else list(tickers)
+    session = get_session()
+    if session is not None:
+        kwargs.setdefault('session', session)
+
+    errors = {}
+
+    def fetch():
+        df = yf.download(tickers, **kwargs)
+        errors.clear()
+        errors.update({ticker: classify(message) for ticker, message in _download_errors(names).items()})
+        if len(names) == 1 and (df is None or df.empty) and names[0] in errors:
+            category = errors[names[0]]
+            if category != NOT_FOUND:
+                raise FetchError(names[0], category, _download_errors(names)[names[0]])
+        return df
+
+    return call(fetch, names[0] if len(names) == 1 else f"{len(names)} Symbole",
+                cost=len(names), retries=retries), errors
+
+def ticker(symbol):
+    """
+    Erzeugt ein yf.Ticker-Objekt, das die gemeinsame Sitzung verwendet.
+
+    Args:
+        symbol (str): Aufgelöstes Tickersymbol
+
+    Returns:
+        yfinance.Ticker: Ticker-Objekt
+    """
+    import yfinance as yf
+
+    session = get_session()
+    return yf.Ticker(symbol, session=session) if session is not None else yf.Ticker(symbol)